@@ -0,0 +1,3 @@
+"""
+Benchmarks del servidor ejecutados contra el stack local
+"""
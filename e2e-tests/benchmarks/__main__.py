@@ -0,0 +1,129 @@
+"""
+Benchmark de los repositorios del servidor (memoria vs MongoDB)
+
+Ejecuta la misma carga HTTP contra cada backend, guarda la corrida en el
+historial y la compara con las anteriores.
+
+Uso (desde e2e-tests/):
+    python -m benchmarks --backends memory,mongo --events 1000 --ops 300 --concurrency 8
+"""
+import argparse
+import sys
+import os
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import (
+    BENCHMARK_EVENTS,
+    BENCHMARK_OPS,
+    BENCHMARK_CONCURRENCY,
+    BENCHMARK_HISTORY_FILE,
+    BENCHMARK_DIR
+)
+from benchmarks.backends import BACKENDS, backend_stack, mongod_available
+from benchmarks.history import append_run, build_run, find_regressions, load_runs
+from benchmarks.workload import run_workload
+from utils.excel_reporter import ExcelReporter
+
+
+def result_entry(backend, stats, elapsed):
+    """Fila del historial para un endpoint de un backend"""
+    name, requests, throughput, p50, p95, p99, max_ms, errors, _ = stats.row(elapsed)
+    return {
+        "backend": backend,
+        "endpoint": name,
+        "requests": requests,
+        "ops_per_sec": throughput,
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "max_ms": max_ms,
+        "errors": errors
+    }
+
+
+def export_results(phases, regressions):
+    """
+    Agrega la corrida al reporte Excel: una fila por backend y endpoint
+    (FAILED si hubo errores o regresión) y el detalle en la hoja "Carga"
+
+    Returns:
+        ExcelReporter: El reporte con los resultados agregados
+    """
+    reporter = ExcelReporter()
+    rows = []
+    histograms = {}
+
+    for index, (backend, stats, elapsed) in enumerate(phases, start=1):
+        row = stats.row(elapsed)
+        row[0] = f"{backend}/{stats.name}"
+        rows.append(row)
+        histograms[row[0]] = stats.histogram()
+
+        messages = regressions.get((backend, stats.name), [])
+        if stats.errors:
+            messages = [f"{stats.errors} requests con error"] + messages
+
+        reporter.add_test_result(
+            test_id=f"BM-{index:02d}",
+            historia=f"Benchmark: backend {backend}",
+            test_name=stats.name,
+            description=f"{row[1]} requests, {row[2]} ops/seg, p50 {row[3]} ms, p95 {row[4]} ms, p99 {row[5]} ms",
+            status="FAILED" if messages else "PASSED",
+            duration=elapsed,
+            error_msg="; ".join(messages)
+        )
+
+    reporter.add_load_results(rows, histograms)
+    return reporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los repositorios del servidor")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="Backends separados por coma: memory,mongo")
+    parser.add_argument("--events", type=int, default=BENCHMARK_EVENTS, help="Eventos sembrados antes de medir")
+    parser.add_argument("--ops", type=int, default=BENCHMARK_OPS, help="Requests medidos por endpoint")
+    parser.add_argument("--concurrency", type=int, default=BENCHMARK_CONCURRENCY, help="Requests simultáneos")
+    parser.add_argument("--history", default=BENCHMARK_HISTORY_FILE, help="Archivo de historial (JSON Lines)")
+    parser.add_argument("--no-save", action="store_true", help="No agregar la corrida al historial")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Salir con código 1 si hay regresiones")
+    args = parser.parse_args()
+
+    backends = [backend.strip() for backend in args.backends.split(",")]
+    if "mongo" in backends and not mongod_available():
+        print("Warning: mongod no está instalado y no hay BENCHMARK_MONGODB_URI; se omite el backend mongo")
+        backends.remove("mongo")
+
+    phases = []
+    for backend in backends:
+        print(f"Backend {backend}: {args.events} eventos sembrados, {args.ops} requests por endpoint, concurrencia {args.concurrency}")
+        with backend_stack(backend):
+            for stats, elapsed in run_workload(args.events, args.ops, args.concurrency):
+                phases.append((backend, stats, elapsed))
+
+    params = {"events": args.events, "ops": args.ops, "concurrency": args.concurrency}
+    run = build_run(params, [result_entry(backend, stats, elapsed) for backend, stats, elapsed in phases])
+    regressions = find_regressions(run, load_runs(args.history))
+
+    print(f"\n{'backend':<8} {'endpoint':<12} {'ops/seg':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errores':>8}")
+    for result in run["results"]:
+        flag = "  REGRESIÓN" if (result["backend"], result["endpoint"]) in regressions else ""
+        print(
+            f"{result['backend']:<8} {result['endpoint']:<12} {result['ops_per_sec']:>9} {result['p50_ms']:>8} "
+            f"{result['p95_ms']:>8} {result['p99_ms']:>8} {result['errors']:>8}{flag}"
+        )
+
+    for (backend, endpoint), messages in regressions.items():
+        print(f"Regresión en {backend}/{endpoint}: {', '.join(messages)}")
+
+    if not args.no_save:
+        append_run(run, args.history)
+    export_results(phases, regressions).save(BENCHMARK_DIR)
+
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
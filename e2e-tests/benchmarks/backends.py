@@ -0,0 +1,107 @@
+"""
+Backends del servidor para los benchmarks: repositorios en memoria o MongoDB
+
+Para MongoDB se usa BENCHMARK_MONGODB_URI si está definida; si no, se levanta
+un mongod local temporal (requiere mongod en el PATH) con una base vacía.
+"""
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from config.config import BENCHMARK_MONGODB_URI, LOCAL_STACK_TIMEOUT, set_urls
+from utils.local_stack import LocalStack, get_free_port
+
+BACKENDS = ["memory", "mongo"]
+
+
+class LocalMongo:
+    """mongod temporal en loopback con un directorio de datos descartable"""
+
+    def __init__(self):
+        self.port = None
+        self.process = None
+        self.db_path = None
+
+    @property
+    def uri(self):
+        return f"mongodb://127.0.0.1:{self.port}/focusu_benchmark"
+
+    def start(self):
+        self.port = get_free_port()
+        self.db_path = tempfile.mkdtemp(prefix="e2e-mongod-")
+        self.process = subprocess.Popen(
+            ["mongod", "--bind_ip", "127.0.0.1", "--port", str(self.port), "--dbpath", self.db_path, "--quiet"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        self._wait_until_ready()
+        return self
+
+    def _wait_until_ready(self):
+        deadline = time.monotonic() + LOCAL_STACK_TIMEOUT
+
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self.stop()
+                raise RuntimeError("mongod terminó al iniciar")
+
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+
+        self.stop()
+        raise RuntimeError(f"mongod no respondió en {LOCAL_STACK_TIMEOUT}s")
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+        if self.db_path:
+            shutil.rmtree(self.db_path, ignore_errors=True)
+            self.db_path = None
+
+
+def mongod_available():
+    """
+    Indica si se puede correr el backend "mongo" (URI configurada o mongod instalado)
+    """
+    return bool(BENCHMARK_MONGODB_URI) or shutil.which("mongod") is not None
+
+
+@contextmanager
+def backend_stack(backend):
+    """
+    Levanta el servidor local con el backend indicado y apunta la suite a su API
+
+    Uso:
+        with backend_stack("mongo") as stack:
+            run_workload(...)
+    """
+    mongo = None
+    mongodb_uri = ""
+
+    if backend == "mongo":
+        if BENCHMARK_MONGODB_URI:
+            mongodb_uri = BENCHMARK_MONGODB_URI
+        else:
+            mongo = LocalMongo().start()
+            mongodb_uri = mongo.uri
+
+    stack = LocalStack(mongodb_uri=mongodb_uri, serve_web=False)
+    try:
+        stack.start(log_dir=os.path.join("reports", "local_stack", backend))
+        set_urls(api_url=stack.api_url)
+        yield stack
+    finally:
+        stack.stop()
+        if mongo:
+            mongo.stop()
@@ -0,0 +1,167 @@
+"""
+Benchmark de los endpoints batch de eventos
+
+Compara crear N eventos con N POST /events contra un POST /events/batch, y
+eliminarlos con N DELETE /events/:id contra un POST /events/batch-delete.
+Los requests individuales se hacen en secuencia, como una importación o un
+seeding sin paralelismo: la diferencia es el costo de los N round trips.
+
+Uso (desde e2e-tests/):
+    python -m benchmarks.batch --sizes 10,50,100 --rounds 20
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import BENCHMARK_DIR, set_urls
+from benchmarks.workload import login_benchmark_user, random_event
+from utils.api_client import api_request, create_events_batch, delete_events_batch
+from utils.local_stack import LocalStack
+from utils.seeding import EventFactory
+from utils.server_state import reset_server, state_routes_available
+from utils.timing import percentile
+
+
+def timed(operation):
+    """
+    Ejecuta operation() y retorna (resultado, milisegundos)
+    """
+    start = time.perf_counter()
+    result = operation()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def create_individually(token, events):
+    ids = []
+    for data in events:
+        response = api_request("POST", "/events", token, json=data)
+        response.raise_for_status()
+        ids.append(response.json()["_id"])
+    return ids
+
+
+def delete_individually(token, event_ids):
+    for event_id in event_ids:
+        api_request("DELETE", f"/events/{event_id}", token).raise_for_status()
+
+
+def create_in_batch(token, events):
+    results = create_events_batch(token, events)
+    if results is None:
+        raise RuntimeError("La API no tiene POST /events/batch")
+    return [result["event"]["_id"] for result in results if result["status"] == 201]
+
+
+def delete_in_batch(token, event_ids):
+    if delete_events_batch(token, event_ids) is None:
+        raise RuntimeError("La API no tiene POST /events/batch-delete")
+
+
+def batch_row(size, operation, individual, batch):
+    p50_individual = percentile(individual, 50)
+    p50_batch = percentile(batch, 50)
+    return {
+        "size": size,
+        "operation": operation,
+        "rounds": len(individual),
+        "individual_p50_ms": round(p50_individual, 2),
+        "batch_p50_ms": round(p50_batch, 2),
+        "speedup": round(p50_individual / p50_batch, 1) if p50_batch else 0,
+    }
+
+
+def run_benchmark(sizes, rounds, seed=42):
+    """
+    Mide, para cada tamaño de lote, rounds creaciones y eliminaciones con
+    requests individuales y con los endpoints batch
+
+    Returns:
+        list: Una fila por tamaño y operación
+    """
+    if state_routes_available():
+        reset_server()
+
+    token = login_benchmark_user()
+    factory = EventFactory(token)
+    rng = random.Random(seed)
+    results = []
+
+    for size in sorted(sizes):
+        print(f"Lotes de {size} eventos ({rounds} rondas)...")
+        timings = {"crear": ([], []), "eliminar": ([], [])}
+
+        for _ in range(rounds):
+            events = [random_event(factory, rng) for _ in range(size)]
+
+            ids, elapsed = timed(lambda: create_individually(token, events))
+            timings["crear"][0].append(elapsed)
+            _, elapsed = timed(lambda: delete_individually(token, ids))
+            timings["eliminar"][0].append(elapsed)
+
+            ids, elapsed = timed(lambda: create_in_batch(token, events))
+            timings["crear"][1].append(elapsed)
+            _, elapsed = timed(lambda: delete_in_batch(token, ids))
+            timings["eliminar"][1].append(elapsed)
+
+        for operation, (individual, batch) in timings.items():
+            results.append(batch_row(size, operation, individual, batch))
+
+    return results
+
+
+def save_results(results, directory=BENCHMARK_DIR):
+    """
+    Guarda los resultados en reports/benchmarks/batch_<timestamp>.json
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(directory, f"batch_{timestamp}.json")
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump({"benchmark": "batch", "timestamp": timestamp, "results": results}, f, indent=1)
+    return filepath
+
+
+def print_results(results):
+    print(f"\n{'eventos':>8}  {'operación':<10} {'N requests ms':>14} {'batch ms':>9} {'speedup':>8}")
+    for row in results:
+        print(f"{row['size']:>8}  {row['operation']:<10} {row['individual_p50_ms']:>14} "
+              f"{row['batch_p50_ms']:>9} {row['speedup']:>7}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los endpoints batch de eventos")
+    parser.add_argument("--sizes", default="10,50,100", help="Eventos por lote, separados por coma")
+    parser.add_argument("--rounds", type=int, default=20, help="Rondas medidas por tamaño")
+    parser.add_argument("--api-url", help="API ya levantada (si no se indica, se levanta el stack local en modo memoria)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    stack = None
+
+    if args.api_url:
+        set_urls(api_url=args.api_url)
+    else:
+        stack = LocalStack(serve_web=False).start()
+        set_urls(api_url=stack.api_url)
+
+    try:
+        results = run_benchmark(sizes, args.rounds)
+    finally:
+        if stack:
+            stack.stop()
+
+    print_results(results)
+    print(f"\nResultados guardados en {save_results(results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Historial de corridas de benchmark y detección de regresiones
+
+Cada corrida se agrega como una línea JSON a BENCHMARK_HISTORY_FILE. Una
+corrida nueva se compara, por backend y endpoint, con la mediana de las
+últimas BENCHMARK_BASELINE_RUNS corridas con los mismos parámetros.
+"""
+import json
+import os
+import statistics
+import subprocess
+from datetime import datetime
+from config.config import (
+    BENCHMARK_HISTORY_FILE,
+    BENCHMARK_REGRESSION_THRESHOLD,
+    BENCHMARK_BASELINE_RUNS
+)
+
+
+def git_commit():
+    """Commit actual del repositorio (None si git no está disponible)"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_run(params, results):
+    """
+    Arma el registro de una corrida
+
+    Args:
+        params (dict): Parámetros de la carga (events, ops, concurrency)
+        results (list): Un dict por backend y endpoint con ops_per_sec, p50_ms, p95_ms, p99_ms, errors
+    """
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "params": params,
+        "results": results
+    }
+
+
+def load_runs(path=BENCHMARK_HISTORY_FILE):
+    """Lee el historial; ignora líneas corruptas"""
+    if not os.path.exists(path):
+        return []
+
+    runs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except ValueError as e:
+                print(f"Warning: Skipping corrupt benchmark history line - {str(e)}")
+    return runs
+
+
+def append_run(run, path=BENCHMARK_HISTORY_FILE):
+    """Agrega una corrida al final del historial"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+
+def find_regressions(run, previous_runs, threshold=BENCHMARK_REGRESSION_THRESHOLD, baseline_runs=BENCHMARK_BASELINE_RUNS):
+    """
+    Compara una corrida con las anteriores comparables (mismos parámetros)
+
+    Hay regresión si el p95 supera a la mediana histórica en más de
+    `threshold` o si las ops/seg caen más de `threshold` por debajo de ella.
+
+    Returns:
+        dict: (backend, endpoint) -> lista de mensajes; vacío si no hay regresiones
+    """
+    comparable = [previous for previous in previous_runs if previous.get("params") == run["params"]][-baseline_runs:]
+    regressions = {}
+
+    for result in run["results"]:
+        key = (result["backend"], result["endpoint"])
+        history = [
+            previous_result
+            for previous in comparable
+            for previous_result in previous["results"]
+            if (previous_result["backend"], previous_result["endpoint"]) == key
+        ]
+        if not history:
+            continue
+
+        baseline_p95 = statistics.median(entry["p95_ms"] for entry in history)
+        baseline_ops = statistics.median(entry["ops_per_sec"] for entry in history)
+        messages = []
+
+        if baseline_p95 and result["p95_ms"] > baseline_p95 * (1 + threshold):
+            messages.append(f"p95 {result['p95_ms']} ms (mediana {baseline_p95} ms)")
+        if baseline_ops and result["ops_per_sec"] < baseline_ops * (1 - threshold):
+            messages.append(f"{result['ops_per_sec']} ops/seg (mediana {baseline_ops} ops/seg)")
+
+        if messages:
+            regressions[key] = messages
+
+    return regressions
@@ -0,0 +1,144 @@
+"""
+Benchmark del repositorio de eventos en memoria
+
+Mide la latencia de GET /events (un mes, como el calendario) y de
+PUT /events/:id a medida que crece la cantidad de eventos del usuario.
+Levanta el servidor local en modo memoria (o usa --api-url) y siembra los
+eventos por API en forma incremental hasta cada tamaño pedido.
+
+Uso (desde e2e-tests/):
+    python -m benchmarks.memory_store --sizes 100,1000,5000,10000 --samples 200
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import BENCHMARK_DIR, set_urls
+from benchmarks.workload import login_benchmark_user, month_range, random_event
+from utils.api_client import api_request
+from utils.local_stack import LocalStack
+from utils.seeding import EventFactory
+from utils.server_state import reset_server, state_routes_available
+from utils.timing import percentile
+
+
+def measure(samples, request):
+    """
+    Ejecuta request() samples veces y retorna las latencias en ms
+    """
+    latencies = []
+    for index in range(samples):
+        start = time.perf_counter()
+        response = request(index)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return latencies
+
+
+def latency_row(size, operation, latencies):
+    return {
+        "size": size,
+        "operation": operation,
+        "samples": len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+def run_benchmark(sizes, samples, seed=42):
+    """
+    Siembra eventos hasta cada tamaño y mide las consultas
+
+    Returns:
+        list: Una fila por tamaño y operación
+    """
+    if state_routes_available():
+        reset_server()
+
+    token = login_benchmark_user()
+    factory = EventFactory(token)
+    rng = random.Random(seed)
+    event_ids = []
+    results = []
+
+    for size in sorted(sizes):
+        missing = size - len(event_ids)
+        if missing > 0:
+            print(f"Sembrando {missing} eventos (total {size})...")
+            created = factory.create_many(events=[random_event(factory, rng) for _ in range(missing)])
+            event_ids.extend(event["_id"] for event in created)
+
+        def list_month(index):
+            date_from, date_to = month_range(index % 12 + 1)
+            return api_request("GET", "/events", token, params={"from": date_from, "to": date_to})
+
+        def update_event(index):
+            event_id = event_ids[rng.randrange(len(event_ids))]
+            return api_request("PUT", f"/events/{event_id}", token, json={"title": f"Benchmark {index}"})
+
+        # Calentamiento: conexión keep-alive y JIT de Node
+        measure(min(samples, 20), list_month)
+
+        results.append(latency_row(size, "listar_mes", measure(samples, list_month)))
+        results.append(latency_row(size, "actualizar", measure(samples, update_event)))
+
+    factory.cleanup()
+    return results
+
+
+def save_results(results, directory=BENCHMARK_DIR):
+    """
+    Guarda los resultados en reports/benchmarks/memory_store_<timestamp>.json
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(directory, f"memory_store_{timestamp}.json")
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump({"benchmark": "memory_store", "timestamp": timestamp, "results": results}, f, indent=1)
+    return filepath
+
+
+def print_results(results):
+    print(f"\n{'eventos':>8}  {'operación':<12} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for row in results:
+        print(f"{row['size']:>8}  {row['operation']:<12} {row['p50_ms']:>8} {row['p95_ms']:>8} {row['max_ms']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del repositorio de eventos en memoria")
+    parser.add_argument("--sizes", default="100,1000,5000", help="Cantidades de eventos del usuario, separadas por coma")
+    parser.add_argument("--samples", type=int, default=200, help="Requests medidos por tamaño y operación")
+    parser.add_argument("--api-url", help="API ya levantada en modo memoria (si no se indica, se levanta el stack local)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    stack = None
+
+    if args.api_url:
+        set_urls(api_url=args.api_url)
+    else:
+        stack = LocalStack(serve_web=False).start()
+        set_urls(api_url=stack.api_url)
+
+    try:
+        results = run_benchmark(sizes, args.samples)
+    finally:
+        if stack:
+            stack.stop()
+
+    print_results(results)
+    print(f"\nResultados guardados en {save_results(results)}")
+
+
+if __name__ == "__main__":
+    main()
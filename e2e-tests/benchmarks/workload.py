@@ -0,0 +1,123 @@
+"""
+Carga HTTP común a los benchmarks del servidor
+
+Todos los benchmarks usan el mismo usuario y eventos repartidos en
+BENCHMARK_YEAR, así los resultados de distintos backends son comparables.
+"""
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+import requests
+from config.config import TEST_USER_PASSWORD, get_api_url
+from loadgen.stats import ScenarioStats
+from utils.api_client import api_request, get_api_session
+from utils.seeding import EventFactory
+
+BENCHMARK_USER = "benchmark_user@example.com"
+
+# Los eventos se reparten en un año; las consultas piden un mes de ese año
+BENCHMARK_YEAR = 2030
+
+# Endpoints medidos, en el orden en que se ejecutan
+ENDPOINTS = ["crear", "listar_mes", "eliminar"]
+
+
+def random_event(factory, rng):
+    """Evento con fecha y hora aleatorias dentro de BENCHMARK_YEAR"""
+    day = date(BENCHMARK_YEAR, 1, 1) + timedelta(days=rng.randrange(365))
+    return factory.build(
+        date=day.isoformat(),
+        time=f"{rng.randrange(24):02d}:{rng.choice(['00', '30'])}"
+    )
+
+
+def month_range(month):
+    """Retorna (from, to) del mes indicado de BENCHMARK_YEAR"""
+    first = date(BENCHMARK_YEAR, month, 1)
+    last = (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return first.isoformat(), last.isoformat()
+
+
+def login_benchmark_user():
+    """
+    Registra el usuario del benchmark (o inicia sesión si ya existe) y retorna su token
+
+    No usa el cache de api_login: cada backend tiene sus propios usuarios.
+    """
+    credentials = {"email": BENCHMARK_USER, "password": TEST_USER_PASSWORD}
+
+    response = get_api_session().post(f"{get_api_url()}/auth/register", json=credentials, timeout=15)
+    if response.status_code != 201:
+        response = get_api_session().post(f"{get_api_url()}/auth/login", json=credentials, timeout=15)
+    response.raise_for_status()
+    return response.json()["token"]
+
+
+def run_phase(name, calls, concurrency):
+    """
+    Ejecuta los requests de un endpoint con `concurrency` hilos
+
+    Args:
+        name (str): Nombre del endpoint en los resultados
+        calls (list): Funciones sin argumentos que hacen un request y lo retornan
+        concurrency (int): Requests simultáneos
+
+    Returns:
+        tuple: (ScenarioStats, duración de la fase en segundos)
+    """
+    stats = ScenarioStats(name)
+
+    def timed(call):
+        start = time.perf_counter()
+        try:
+            status = call().status_code
+        except requests.RequestException:
+            status = None
+        stats.record((time.perf_counter() - start) * 1000, status)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, calls))
+    return stats, time.perf_counter() - start
+
+
+def run_workload(events, ops, concurrency, seed=42):
+    """
+    Siembra `events` eventos y mide `ops` requests de cada endpoint:
+    POST /events, GET /events de un mes y DELETE /events/:id (borrado lógico)
+
+    Returns:
+        list: (ScenarioStats, duración en segundos) por endpoint, en el orden de ENDPOINTS
+    """
+    token = login_benchmark_user()
+    factory = EventFactory(token)
+    rng = random.Random(seed)
+
+    factory.create_many(events=[random_event(factory, rng) for _ in range(events)])
+
+    new_events = [random_event(factory, rng) for _ in range(ops)]
+    created_ids = []
+
+    def create(data):
+        response = api_request("POST", "/events", token, json=data)
+        if response.status_code == 201:
+            created_ids.append(response.json()["_id"])
+        return response
+
+    def list_month(month):
+        date_from, date_to = month_range(month)
+        return api_request("GET", "/events", token, params={"from": date_from, "to": date_to})
+
+    results = [
+        run_phase("crear", [lambda data=data: create(data) for data in new_events], concurrency),
+        run_phase("listar_mes", [lambda index=index: list_month(index % 12 + 1) for index in range(ops)], concurrency),
+        run_phase(
+            "eliminar",
+            [lambda event_id=event_id: api_request("DELETE", f"/events/{event_id}", token) for event_id in created_ids],
+            concurrency
+        ),
+    ]
+
+    factory.cleanup()
+    return results
@@ -9,9 +9,38 @@ load_dotenv()
 # URL base de la aplicación
 BASE_URL = "https://testing-uade-frontend-git-main-bautibiancos-projects.vercel.app/?_vercel_share=WnqlJSBFtc5PmugJv07UeOHmTd9sCuSs"
 
+# URL base de la API (backend Express)
+API_URL = os.getenv("API_URL", "https://testing-uade-production.up.railway.app")
+
+# URLs en uso: el stack local y los benchmarks las reemplazan con set_urls(),
+# por eso la suite las lee con get_base_url()/get_api_url() y no importa las constantes
+_current_urls = {"base": BASE_URL, "api": API_URL}
+
+
+def get_base_url():
+    """URL del frontend contra la que corren los tests"""
+    return _current_urls["base"]
+
+
+def get_api_url():
+    """URL de la API contra la que corren los tests"""
+    return _current_urls["api"]
+
+
+def set_urls(base_url=None, api_url=None):
+    """
+    Apunta la suite a otro frontend y/o API (None conserva la URL actual)
+    """
+    if base_url:
+        _current_urls["base"] = base_url
+    if api_url:
+        _current_urls["api"] = api_url.rstrip("/")
+
 # Timeouts
 IMPLICIT_WAIT = 10
 EXPLICIT_WAIT = 15
+# Intervalo de sondeo de las esperas explícitas (segundos)
+WAIT_POLL_FREQUENCY = 0.05
 
 # Credenciales de prueba (usuarios de test)
 TEST_USER_EMAIL = "test_user_selenium@example.com"
@@ -21,10 +50,144 @@ TEST_USER_PASSWORD = "TestPassword123!"
 ALT_USER_EMAIL = "test_alt_user@example.com"
 ALT_USER_PASSWORD = "AltPassword123"
 
+# Login de los tests autenticados: "api" (inyecta la cookie JWT) o "ui" (formulario)
+AUTH_MODE = os.getenv("AUTH_MODE", "api")
+# El JWT vale 7 días; se renueva un poco antes para no usar tokens por vencer
+AUTH_TOKEN_TTL = 6 * 24 * 60 * 60
+
+# Conexiones HTTP reutilizables hacia la API
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))
+# Eventos por request en POST /events/batch y /events/batch-delete (máximo del servidor: 100)
+API_BATCH_SIZE = int(os.getenv("API_BATCH_SIZE", "100"))
+
 # Configuración del navegador
 BROWSER = os.getenv("BROWSER", "chrome")  # chrome, firefox, edge
 HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+# Perfil del navegador: "default" o "fast" (headless, sin imágenes/fuentes/animaciones,
+# page load "eager" y terceros bloqueados). En CI (variable CI definida) se usa "fast"
+BROWSER_PROFILE = os.getenv("BROWSER_PROFILE", "fast" if os.getenv("CI") else "default")
+# user-data-dir precalentado que se copia para cada navegador del perfil fast (Chrome/Edge).
+# Si no existe se crea en la primera ejecución; vacío = perfil nuevo en cada navegador
+BROWSER_PROFILE_TEMPLATE = os.getenv("BROWSER_PROFILE_TEMPLATE", "")
+# Patrones de URL bloqueados en el perfil fast (CDP Network.setBlockedURLs)
+FAST_PROFILE_BLOCKED_URLS = [
+    # Imágenes y fuentes
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    # Analytics y otros terceros (el CDN de Tailwind no se bloquea: la app lo necesita)
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*hotjar.com*", "*sentry.io*", "*facebook.net*",
+]
+
+# Binarios de WebDriver: rutas explícitas (opcional). Si no se indican se buscan en
+# los directorios del proyecto, en el cache de webdriver-manager y en el PATH
+DRIVER_PATHS = {
+    "chrome": os.getenv("CHROMEDRIVER_PATH", ""),
+    "firefox": os.getenv("GECKODRIVER_PATH", ""),
+    "edge": os.getenv("EDGEDRIVER_PATH", ""),
+}
+# true = nunca descargar drivers (falla si no hay un binario local)
+DRIVER_OFFLINE = os.getenv("DRIVER_OFFLINE", "false").lower() == "true"
+# Rutas resueltas en la sesión, compartidas con los workers de xdist
+DRIVER_CACHE_FILE = ".driver_cache.json"
 
 # Configuración de screenshots
 SCREENSHOT_DIR = "screenshots"
 SCREENSHOT_ON_FAILURE = True
+# Formato: "png" (tal cual lo entrega el driver), "png-optimized" o "webp" (ambos sin
+# pérdida, requieren Pillow). SCREENSHOT_SCALE < 1 reduce la resolución (requiere Pillow)
+SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png")
+SCREENSHOT_SCALE = float(os.getenv("SCREENSHOT_SCALE", "1.0"))
+# Capturas pendientes de escribir; si la cola se llena, las nuevas se descartan
+SCREENSHOT_QUEUE_SIZE = 20
+# Máximo de archivos en SCREENSHOT_DIR; se eliminan los más viejos (0 = sin límite)
+SCREENSHOT_MAX_FILES = int(os.getenv("SCREENSHOT_MAX_FILES", "200"))
+
+# Pool de navegadores (reutiliza instancias entre tests en lugar de abrir Chrome por test)
+BROWSER_POOL_ENABLED = os.getenv("BROWSER_POOL_ENABLED", "true").lower() == "true"
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+BROWSER_POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES", "20"))
+# Segundos máximos de espera a que se libere un navegador del pool
+BROWSER_POOL_ACQUIRE_TIMEOUT = int(os.getenv("BROWSER_POOL_ACQUIRE_TIMEOUT", "120"))
+
+# Reporte Excel en modo streaming: cada resultado se agrega a un journal en disco
+# y el .xlsx se arma al final con un workbook write-only (memoria constante)
+REPORT_STREAMING = os.getenv("REPORT_STREAMING", "false").lower() == "true"
+REPORT_FLUSH_EVERY = int(os.getenv("REPORT_FLUSH_EVERY", "10"))
+
+# Captura de performance por test (performance log de Chrome/Edge + Navigation/Resource Timing)
+PERF_CAPTURE = os.getenv("PERF_CAPTURE", "false").lower() == "true"
+PERF_CAPTURE_DIR = os.path.join("reports", "perf")
+
+# Presupuestos de Web Vitals por página (ms, salvo cls y long_tasks)
+PERF_BUDGETS = {
+    "/login": {"lcp": 2500, "cls": 0.1, "tti": 3500, "tbt": 200},
+    "/calendar": {"lcp": 2500, "cls": 0.1, "tti": 3800, "tbt": 300, "long_tasks": 5},
+    "/new": {"lcp": 2500, "cls": 0.1, "tti": 3500, "tbt": 200},
+}
+# "fail" hace fallar el test al exceder un presupuesto, "warn" solo lo informa
+PERF_BUDGET_MODE = os.getenv("PERF_BUDGET_MODE", "fail")
+# Presupuesto (ms) para mostrar un mes ya cacheado o prefetcheado al navegar el calendario
+CALENDAR_NAV_BUDGET_MS = int(os.getenv("CALENDAR_NAV_BUDGET_MS", "500"))
+
+# Generador de carga (python -m loadgen)
+LOADGEN_USERS = int(os.getenv("LOADGEN_USERS", "20"))
+LOADGEN_DURATION = int(os.getenv("LOADGEN_DURATION", "60"))  # segundos
+LOADGEN_RAMP_UP = int(os.getenv("LOADGEN_RAMP_UP", "5"))  # segundos hasta tener todos los usuarios activos
+LOADGEN_THINK_TIME = float(os.getenv("LOADGEN_THINK_TIME", "0.1"))  # pausa entre requests de un usuario
+LOADGEN_USER_PREFIX = "loadgen_user"
+# Los usuarios virtuales revalidan los GET repetidos con If-None-Match, como el navegador
+LOADGEN_CONDITIONAL_GET = os.getenv("LOADGEN_CONDITIONAL_GET", "true").lower() == "true"
+# Peso relativo de cada escenario
+LOADGEN_WEIGHTS = {
+    "listar_mes": 6,
+    "crear_evento": 3,
+    "eliminar_evento": 1,
+}
+# Tasa de error máxima (%) para considerar aprobado un escenario en el reporte
+LOADGEN_MAX_ERROR_RATE = float(os.getenv("LOADGEN_MAX_ERROR_RATE", "1.0"))
+
+# Prefijo del título de los eventos creados por API para las pruebas
+SEED_EVENT_PREFIX = "E2E Seed"
+# Eventos del mes sembrado para medir los filtros de GET /events (API-26)
+FILTER_DATASET_EVENTS = int(os.getenv("FILTER_DATASET_EVENTS", "300"))
+
+# Limpieza de eventos de prueba al terminar la sesión
+JANITOR_ENABLED = os.getenv("JANITOR_ENABLED", "true").lower() == "true"
+# Además de los de la sesión, elimina eventos de prueba creados hace más de N días (0 = no purgar)
+JANITOR_PURGE_DAYS = int(os.getenv("JANITOR_PURGE_DAYS", "7"))
+# Títulos que identifican eventos creados por la suite (API e interfaz)
+JANITOR_TITLE_PREFIXES = [
+    SEED_EVENT_PREFIX,
+    "Examen Final - ",
+]
+# Rango de fechas en el que se buscan eventos de prueba
+JANITOR_DATE_RANGE = ("2000-01-01", "2100-12-31")
+
+# Orden de ejecución: "history" (fallados recientes primero y, en paralelo, más lentos primero) o "file"
+TEST_ORDERING = os.getenv("TEST_ORDERING", "history")
+TEST_HISTORY_FILE = ".test_history.json"
+TEST_HISTORY_RUNS = 10  # ejecuciones que se conservan por test
+
+# Stack local: servidor Express en modo memoria + build de web/ en loopback (requiere Node.js)
+LOCAL_STACK = os.getenv("LOCAL_STACK", "false").lower() == "true"
+LOCAL_STACK_REBUILD = os.getenv("LOCAL_STACK_REBUILD", "false").lower() == "true"
+LOCAL_STACK_TIMEOUT = 60  # segundos de espera a que la API responda /health
+
+# Restauración del dataset base del servidor en memoria (rutas /__test__ del stack local):
+# "test" después de cada test, "module" después de cada archivo, "off" nunca
+STATE_RESET_SCOPE = os.getenv("STATE_RESET_SCOPE", "test")
+
+# Benchmarks del servidor (python -m benchmarks)
+BENCHMARK_DIR = os.path.join("reports", "benchmarks")
+# Historial de corridas (JSON Lines) contra el que se comparan las siguientes
+BENCHMARK_HISTORY_FILE = os.getenv("BENCHMARK_HISTORY_FILE", os.path.join(BENCHMARK_DIR, "history.jsonl"))
+# MongoDB para el backend "mongo"; vacío = levantar un mongod local temporal
+BENCHMARK_MONGODB_URI = os.getenv("BENCHMARK_MONGODB_URI", "")
+BENCHMARK_EVENTS = int(os.getenv("BENCHMARK_EVENTS", "1000"))  # eventos sembrados antes de medir
+BENCHMARK_OPS = int(os.getenv("BENCHMARK_OPS", "300"))  # requests medidos por endpoint
+BENCHMARK_CONCURRENCY = int(os.getenv("BENCHMARK_CONCURRENCY", "8"))
+# Variación tolerada (p95 y ops/seg) respecto de la mediana de las últimas corridas comparables
+BENCHMARK_REGRESSION_THRESHOLD = float(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", "0.2"))
+BENCHMARK_BASELINE_RUNS = 5
@@ -9,42 +9,243 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.browser_manager import BrowserManager
+from utils.browser_pool import BrowserPool
+from utils.driver_resolver import clear_driver_cache
 from utils.helpers import take_screenshot
+from utils.screenshots import screenshot_writer
 from utils.excel_reporter import ExcelReporter
-from config.config import BASE_URL, SCREENSHOT_ON_FAILURE
+from utils.users import get_worker_id, get_worker_credentials, provision_user
+from utils.api_client import api_login, inject_auth_cookie
+from utils.seeding import EventFactory
+from utils.janitor import janitor
+from utils.test_history import TestHistory, order_items
+from utils.local_stack import LocalStack, build_web, node_available
+from utils.server_state import state_routes_available, snapshot_server, restore_server
+from utils.network_tracker import read_network_log
+from utils.timing import step, reset_steps, collect_steps
+from utils.perf_capture import reset_perf_capture, collect_perf_capture, save_perf_capture
+from config.config import (
+    SCREENSHOT_ON_FAILURE, BROWSER_POOL_ENABLED, AUTH_MODE,
+    REPORT_STREAMING, REPORT_FLUSH_EVERY, PERF_CAPTURE,
+    JANITOR_ENABLED, JANITOR_PURGE_DAYS, TEST_ORDERING,
+    LOCAL_STACK, LOCAL_STACK_REBUILD, STATE_RESET_SCOPE,
+    get_base_url, set_urls
+)
 
 # Variable global para el reporte Excel
 excel_reporter = None
-test_results = []
+# Historial de duraciones y resultados (solo en el proceso controlador)
+test_history = None
+# Servidor y frontend locales cuando LOCAL_STACK=true
+local_stack = None
+
+# Historia de usuario de cada archivo de test (los del tier de API usan el
+# nombre sin "api_": test_api_01_registro_usuario.py -> test_01_registro_usuario.py)
+HISTORIA_MAP = {
+    "test_01_registro_usuario.py": "HU-01: Registro de Usuario",
+    "test_02_login.py": "HU-02: Inicio de sesión",
+    "test_03_crear_evento.py": "HU-03: Crear evento académico",
+    "test_04_visualizar_calendario.py": "HU-04: Visualización de calendario mensual",
+    "test_05_eliminar_evento.py": "HU-05: Eliminar evento",
+    "test_06_navegacion.py": "HU-06: Navegación en la interfaz",
+    "test_07_logout.py": "HU-07: Logout",
+    "test_08_rendimiento_frontend.py": "RNF-01: Rendimiento del frontend",
+    "test_09_perfil.py": "Perfil de usuario"
+}
+
+
+@pytest.fixture(scope="session")
+def browser_pool():
+    """
+    Fixture de sesión con el pool de navegadores reutilizables
+    """
+    pool = BrowserPool()
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def test_user():
+    """
+    Fixture de sesión con las credenciales del usuario de prueba del worker
+
+    En ejecución paralela (pytest -n N) cada worker tiene su propio usuario,
+    que se registra en la API si todavía no existe.
+    """
+    email, password = get_worker_credentials(get_worker_id())
+    provision_user(email, password)
+
+    return {"email": email, "password": password}
+
+
+@pytest.fixture(scope="session")
+def baseline_state(test_user):
+    """
+    Fixture de sesión que guarda el dataset base del servidor (con el usuario
+    de prueba ya registrado) si la API expone las rutas /__test__
+
+    Retorna el nombre del snapshot o None contra servidores sin rutas de test.
+    """
+    if STATE_RESET_SCOPE == "off" or not state_routes_available():
+        return None
+
+    snapshot_server("baseline")
+    return "baseline"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def state_per_module(baseline_state):
+    """
+    Restaura el dataset base al terminar cada archivo (STATE_RESET_SCOPE="module")
+    """
+    yield
+
+    if baseline_state and STATE_RESET_SCOPE == "module":
+        restore_server(baseline_state)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def state_per_test(baseline_state):
+    """
+    Restaura el dataset base al terminar cada test (STATE_RESET_SCOPE="test")
+    """
+    yield
+
+    if baseline_state and STATE_RESET_SCOPE == "test":
+        restore_server(baseline_state)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def event_janitor(test_user):
+    """
+    Fixture de sesión que al terminar elimina los eventos creados por la suite
+
+    Incluye los creados por API, los creados desde la interfaz durante la
+    sesión y los de ejecuciones anteriores con más de JANITOR_PURGE_DAYS días.
+    """
+    yield janitor
+
+    if not JANITOR_ENABLED:
+        return
+
+    try:
+        token = api_login(test_user["email"], test_user["password"])
+        janitor.sweep(token, purge_days=JANITOR_PURGE_DAYS)
+        deleted = janitor.cleanup()
+        print(f"\n[OK] Janitor: {deleted} eventos de prueba eliminados")
+    except Exception as e:
+        print(f"Warning: Could not clean up test events - {str(e)}")
 
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, browser_pool):
     """
-    Fixture que crea y destruye una instancia del navegador para cada test
+    Fixture que presta un navegador del pool para cada test
+
+    Los tests marcados con @pytest.mark.isolated (o todos, si el pool está
+    deshabilitado) reciben una instancia nueva que se cierra al terminar.
     """
-    driver = BrowserManager.get_driver()
-    driver.get(BASE_URL)
+    isolated = not BROWSER_POOL_ENABLED or request.node.get_closest_marker("isolated")
+
+    with step("navegador"):
+        if isolated:
+            driver = BrowserManager.get_driver()
+        else:
+            driver = browser_pool.acquire()
+
+    try:
+        if PERF_CAPTURE:
+            # El performance log solo debe tener los eventos de este test
+            reset_perf_capture(driver)
+
+        with step("navegación"):
+            driver.get(get_base_url())
+    except BaseException:
+        # Sin yield no hay teardown: el navegador no vuelve al pool y hay que liberar su lugar
+        if isolated:
+            driver.quit()
+        else:
+            browser_pool._discard(driver)
+        raise
 
     yield driver
 
-    driver.quit()
+    if isolated:
+        driver.quit()
+    else:
+        browser_pool.release(driver)
 
 
 @pytest.fixture(scope="function")
-def authenticated_driver(driver):
+def authenticated_driver(driver, test_user):
     """
     Fixture que proporciona un driver con usuario autenticado
     Útil para tests que requieren login previo
+
+    Con AUTH_MODE="api" (por defecto) obtiene el JWT con POST /auth/login
+    (cacheado por usuario durante la sesión) y lo inyecta como cookie, sin
+    pasar por el formulario. Si falla, recurre al login por la interfaz.
+    """
+    authenticated = False
+
+    with step("login"):
+        if AUTH_MODE == "api":
+            try:
+                token = api_login(test_user["email"], test_user["password"])
+                inject_auth_cookie(driver, token)
+                authenticated = True
+            except Exception as e:
+                print(f"Warning: API login failed, falling back to UI login - {str(e)}")
+
+        if not authenticated:
+            ui_login(driver, test_user)
+
+    yield driver
+
+
+@pytest.fixture(scope="function")
+def event_factory(test_user):
+    """
+    Fixture con una EventFactory del usuario de prueba del worker
+    Los eventos que crea se eliminan todos juntos al terminar el test
+    """
+    factory = EventFactory(api_login(test_user["email"], test_user["password"]))
+
+    yield factory
+
+    factory.cleanup()
+
+
+@pytest.fixture(scope="function")
+def seeded_events(request, event_factory):
+    """
+    Fixture que crea eventos por API como precondición del test
+
+    La cantidad se indica con @pytest.mark.seed_events(n) (por defecto 1) o
+    con los datos de cada evento: @pytest.mark.seed_events(events=[{"type": "CLASS"}])
+    """
+    marker = request.node.get_closest_marker("seed_events")
+    args = marker.args if marker else ()
+    kwargs = marker.kwargs if marker else {}
+
+    if not args and "events" not in kwargs:
+        args = (1,)
+
+    with step("seed"):
+        return event_factory.create_many(*args, **kwargs)
+
+
+def ui_login(driver, test_user):
+    """
+    Inicia sesión completando el formulario de /login
     """
-    from config.config import TEST_USER_EMAIL, TEST_USER_PASSWORD
     from selenium.webdriver.common.by import By
-    from utils.helpers import wait_for_element, clear_and_send_keys
-    import time
+    from utils.helpers import wait_for_element, clear_and_send_keys, wait_until, url_not_contains
 
     # Ir a la página de login
-    driver.get(f"{BASE_URL}/login")
-    time.sleep(1)
+    driver.get(f"{get_base_url()}/login")
 
     # Intentar hacer login (asume que el usuario ya existe)
     try:
@@ -52,39 +253,87 @@ def authenticated_driver(driver):
         password_field = wait_for_element(driver, (By.ID, "password"))
 
         if email_field and password_field:
-            clear_and_send_keys(email_field, TEST_USER_EMAIL)
-            clear_and_send_keys(password_field, TEST_USER_PASSWORD)
+            clear_and_send_keys(email_field, test_user["email"])
+            clear_and_send_keys(password_field, test_user["password"])
 
             submit_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             submit_button.click()
 
-            time.sleep(2)
+            wait_until(driver, url_not_contains("/login"))
     except Exception as e:
         print(f"Warning: Could not authenticate - {str(e)}")
 
-    yield driver
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Hook que reinicia el registro de fases antes de los fixtures de cada test
+    """
+    reset_steps()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook para capturar screenshots en caso de fallo
+    Hook para capturar screenshots en caso de fallo y adjuntar al reporte
+    los requests de red y los tiempos por fase registrados durante el test.
+    Con PERF_CAPTURE=true guarda además la captura de performance del test.
     """
     outcome = yield
     rep = outcome.get_result()
 
-    if rep.when == "call" and rep.failed and SCREENSHOT_ON_FAILURE:
-        driver = item.funcargs.get("driver") or item.funcargs.get("authenticated_driver")
-        if driver:
-            take_screenshot(driver, item.name)
+    if rep.when != "call":
+        return
+
+    # user_properties viaja con el reporte también desde los workers de xdist
+    rep.user_properties.append(("step_timings", collect_steps()))
+
+    # Llamadas registradas por los tests del tier de API (fixture api)
+    if hasattr(item, "api_calls"):
+        rep.user_properties.append(("api_calls", item.api_calls))
+
+    driver = item.funcargs.get("driver") or item.funcargs.get("authenticated_driver")
+
+    if rep.failed and SCREENSHOT_ON_FAILURE and driver:
+        take_screenshot(driver, item.name)
+
+    if driver:
+        try:
+            rep.user_properties.append(("network_requests", read_network_log(driver, clear=True)))
+        except Exception as e:
+            print(f"Warning: Could not read network log - {str(e)}")
+
+    if PERF_CAPTURE and driver:
+        try:
+            save_perf_capture(item.name, collect_perf_capture(driver))
+        except Exception as e:
+            print(f"Warning: Could not save performance capture - {str(e)}")
+
+
+def is_xdist_worker(config):
+    """
+    Indica si el proceso actual es un worker de pytest-xdist
+    """
+    return hasattr(config, "workerinput")
 
 
 def pytest_configure(config):
     """
     Configuración inicial de pytest
     """
-    global excel_reporter
-    excel_reporter = ExcelReporter()
+    global excel_reporter, test_history, local_stack
+
+    # En ejecución paralela solo el proceso controlador genera el reporte:
+    # recibe los resultados de todos los workers en pytest_runtest_logreport
+    if not is_xdist_worker(config):
+        excel_reporter = ExcelReporter(streaming=REPORT_STREAMING, flush_every=REPORT_FLUSH_EVERY)
+        test_history = TestHistory()
+        # Los drivers se resuelven de nuevo en cada sesión (el primer proceso
+        # que abre un navegador deja la ruta en el cache para los demás)
+        clear_driver_cache()
+
+    if LOCAL_STACK:
+        start_local_stack(config)
 
     config.addinivalue_line(
         "markers", "smoke: marca tests de smoke testing"
@@ -95,34 +344,87 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "critical: marca tests críticos"
     )
+    config.addinivalue_line(
+        "markers", "isolated: usa un navegador propio en lugar del pool"
+    )
+    config.addinivalue_line(
+        "markers", "seed_events(n, events=None): eventos a crear por API para el test"
+    )
+    config.addinivalue_line(
+        "markers", "api: pruebas del tier de API (HTTP, sin navegador)"
+    )
+
+
+def start_local_stack(config):
+    """
+    Levanta el servidor en modo memoria y el frontend local y apunta
+    la suite a ellos con set_urls()
+
+    El build de web/ se hace una sola vez (en el controlador si hay xdist);
+    cada proceso que ejecuta tests levanta su propio servidor, con su propia
+    base en memoria. El controlador de xdist no ejecuta tests y no lo levanta.
+    """
+    global local_stack
+
+    if not node_available():
+        raise pytest.UsageError("LOCAL_STACK=true requiere Node.js y npm instalados")
+
+    if not is_xdist_worker(config):
+        build_web(force=LOCAL_STACK_REBUILD)
+
+        if getattr(config.option, "numprocesses", None):
+            return
+
+    local_stack = LocalStack().start()
+    set_urls(local_stack.base_url, local_stack.api_url)
+
+
+def pytest_unconfigure(config):
+    """
+    Detiene el stack local al terminar la ejecución
+    """
+    if local_stack:
+        local_stack.stop()
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Ordena los tests según el historial de ejecuciones anteriores
+
+    Con TEST_ORDERING="history" van primero los que fallaron recientemente y,
+    en ejecución paralela, los más lentos primero para reducir el tiempo total.
+    """
+    if TEST_ORDERING != "history":
+        return
+
+    parallel = is_xdist_worker(config) or bool(getattr(config.option, "numprocesses", None))
+    order_items(items, TestHistory(), parallel=parallel)
+
+
+def historia_for(test_file):
+    """
+    Retorna la historia de usuario de un archivo de test
+
+    Los tests del tier de API (tests/api/test_api_NN_*.py) se mapean a la
+    misma historia que su archivo equivalente del tier de navegador.
+    """
+    file_name = os.path.basename(test_file).replace("test_api_", "test_", 1)
+    return HISTORIA_MAP.get(file_name, "Desconocida")
 
 
 def pytest_runtest_logreport(report):
     """
     Hook que se ejecuta después de cada test para recolectar resultados
+
+    Cada resultado se agrega al reporte apenas termina el test (en modo
+    streaming va directo al journal en disco)
     """
-    if report.when == "call":
+    if report.when == "call" and excel_reporter:
         # Extraer información del test
         test_name = report.nodeid.split("::")[-1]
         test_file = report.nodeid.split("::")[0]
 
-        # Mapear archivos de test a historias de usuario
-        historia_map = {
-            "test_01_registro_usuario.py": "HU-01: Registro de Usuario",
-            "test_02_login.py": "HU-02: Inicio de sesión",
-            "test_03_crear_evento.py": "HU-03: Crear evento académico",
-            "test_04_visualizar_calendario.py": "HU-04: Visualización de calendario mensual",
-            "test_05_eliminar_evento.py": "HU-05: Eliminar evento",
-            "test_06_navegacion.py": "HU-06: Navegación en la interfaz",
-            "test_07_logout.py": "HU-07: Logout"
-        }
-
-        # Obtener historia de usuario
-        historia = "Desconocida"
-        for file_pattern, hu in historia_map.items():
-            if file_pattern in test_file:
-                historia = hu
-                break
+        historia = historia_for(test_file)
 
         # Obtener ID del caso de prueba (extrae CP-XX del docstring si existe)
         test_id = "N/A"
@@ -147,38 +449,48 @@ def pytest_runtest_logreport(report):
             error_msg = "Unknown error"
 
         duration = report.duration
-
-        # Guardar resultado
-        test_results.append({
-            'test_id': test_id,
-            'historia': historia,
-            'test_name': test_name,
-            'description': description,
-            'status': status,
-            'duration': duration,
-            'error_msg': error_msg
-        })
+        network_requests = dict(report.user_properties).get("network_requests", [])
+        step_timings = dict(report.user_properties).get("step_timings", {})
+
+        # Agregar resultado al reporte
+        excel_reporter.add_test_result(
+            test_id=test_id,
+            historia=historia,
+            test_name=test_name,
+            description=description,
+            status=status,
+            duration=duration,
+            error_msg=error_msg
+        )
+        excel_reporter.add_network_requests(test_name, network_requests)
+        excel_reporter.add_step_timings(test_name, step_timings)
+        excel_reporter.add_api_calls(test_name, dict(report.user_properties).get("api_calls", []))
+
+        if test_history:
+            test_history.record(report.nodeid, duration, status)
+
+    elif report.when == "setup" and report.failed and test_history:
+        # Un fixture que falla (login, seeding, driver) no llega a "call": también
+        # cuenta como fallo reciente para ordenar la próxima ejecución
+        test_history.record(report.nodeid, report.duration, "ERROR")
 
 
 def pytest_sessionfinish(session, exitstatus):
     """
     Hook que se ejecuta al finalizar toda la sesión de tests
-    Genera el reporte Excel
-    """
-    global excel_reporter, test_results
-
-    if excel_reporter and test_results:
-        # Agregar cada resultado al reporte Excel
-        for result in test_results:
-            excel_reporter.add_test_result(
-                test_id=result['test_id'],
-                historia=result['historia'],
-                test_name=result['test_name'],
-                description=result['description'],
-                status=result['status'],
-                duration=result['duration'],
-                error_msg=result['error_msg']
-            )
+    Genera el reporte Excel con los resultados de todos los workers
+    """
+    global excel_reporter
+
+    # Cada proceso (controlador o worker) termina de escribir sus screenshots
+    screenshot_writer.flush()
+
+    if is_xdist_worker(session.config):
+        return
+
+    if test_history and test_history.tests:
+        test_history.save()
 
+    if excel_reporter and sum(excel_reporter.status_counts.values()):
         # Guardar el reporte
         excel_reporter.save()
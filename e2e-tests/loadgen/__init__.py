@@ -0,0 +1 @@
+# Load generation package
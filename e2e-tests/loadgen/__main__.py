@@ -0,0 +1,78 @@
+"""
+Generador de carga para la API de eventos
+
+Uso (desde e2e-tests/, con el servidor en modo memoria):
+    python -m loadgen --users 50 --duration 120 --api-url http://localhost:3001
+"""
+import argparse
+import asyncio
+import sys
+import os
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import (
+    LOADGEN_USERS,
+    LOADGEN_DURATION,
+    LOADGEN_RAMP_UP,
+    LOADGEN_THINK_TIME,
+    LOADGEN_WEIGHTS,
+    LOADGEN_CONDITIONAL_GET,
+    get_api_url
+)
+from loadgen.runner import run_load, export_results
+
+
+def parse_weights(value):
+    """
+    Convierte "listar_mes=6,crear_evento=3" en un dict de pesos
+    """
+    weights = dict(LOADGEN_WEIGHTS)
+    for item in value.split(","):
+        name, weight = item.split("=")
+        weights[name.strip()] = int(weight)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga de la API de eventos")
+    parser.add_argument("--users", type=int, default=LOADGEN_USERS, help="Usuarios virtuales")
+    parser.add_argument("--duration", type=int, default=LOADGEN_DURATION, help="Duración en segundos")
+    parser.add_argument("--ramp-up", type=int, default=LOADGEN_RAMP_UP, help="Segundos hasta tener todos los usuarios activos")
+    parser.add_argument("--think-time", type=float, default=LOADGEN_THINK_TIME, help="Pausa entre escenarios (segundos)")
+    parser.add_argument("--weights", type=parse_weights, default=LOADGEN_WEIGHTS, help="Pesos: listar_mes=6,crear_evento=3,eliminar_evento=1")
+    parser.add_argument("--api-url", default=get_api_url(), help="URL base de la API")
+    parser.add_argument("--no-conditional", dest="conditional", action="store_false", default=LOADGEN_CONDITIONAL_GET,
+                        help="No revalidar los GET con If-None-Match (descarga completa siempre)")
+    args = parser.parse_args()
+
+    print(f"Ejecutando carga contra {args.api_url}: {args.users} usuarios durante {args.duration}s")
+
+    result = asyncio.run(run_load(
+        users=args.users,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        think_time=args.think_time,
+        weights=args.weights,
+        api_url=args.api_url,
+        conditional=args.conditional
+    ))
+
+    print(f"\nTotal: {result.total_requests} requests en {result.elapsed:.1f}s ({result.throughput:.1f} req/s)")
+    for scenario in result.stats.values():
+        name, requests, throughput, p50, p95, p99, _, errors, error_rate = scenario.row(result.elapsed)
+        print(f"  {name:<16} {requests:>7} req  {throughput:>8} req/s  p50 {p50} ms  p95 {p95} ms  p99 {p99} ms  errores {errors} ({error_rate}%)")
+
+    # Ancho de banda: bytes descargados y los que evitaron las respuestas 304
+    print(f"\nDescargado: {result.bytes_received / 1024:.1f} KB")
+    for scenario in result.stats.values():
+        if scenario.not_modified:
+            print(f"  {scenario.name:<16} {scenario.not_modified:>7} respuestas 304  "
+                  f"{scenario.bytes_saved / 1024:.1f} KB ahorrados ({scenario.bandwidth_saved:.1f}%)")
+
+    export_results(result).save()
+
+
+if __name__ == "__main__":
+    main()
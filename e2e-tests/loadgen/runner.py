@@ -0,0 +1,222 @@
+"""
+Ejecución de la prueba de carga con usuarios virtuales asíncronos
+"""
+import asyncio
+import json
+import random
+import time
+import aiohttp
+from config.config import (
+    TEST_USER_PASSWORD,
+    LOADGEN_USER_PREFIX,
+    LOADGEN_WEIGHTS,
+    LOADGEN_MAX_ERROR_RATE,
+    LOADGEN_CONDITIONAL_GET,
+    get_api_url
+)
+from loadgen.scenarios import SCENARIOS
+from loadgen.stats import ScenarioStats
+from utils.excel_reporter import ExcelReporter
+
+
+class VirtualUser:
+    """Usuario sintético con su propio token y sus eventos creados"""
+
+    def __init__(self, index, session, stats, api_url=None, conditional=LOADGEN_CONDITIONAL_GET):
+        self.email = f"{LOADGEN_USER_PREFIX}_{index}@example.com"
+        self.session = session
+        self.stats = stats
+        self.api_url = api_url or get_api_url()
+        self.conditional = conditional
+        self.token = None
+        self.event_ids = []
+        # Como el navegador: ETag y tamaño de la última respuesta de cada GET
+        self.etags = {}
+
+    async def login(self):
+        """
+        Registra al usuario (o inicia sesión si ya existe) y guarda su token
+        """
+        credentials = {"email": self.email, "password": TEST_USER_PASSWORD}
+
+        async with self.session.post(f"{self.api_url}/auth/register", json=credentials) as response:
+            if response.status == 201:
+                self.token = (await response.json())["token"]
+                return
+
+        async with self.session.post(f"{self.api_url}/auth/login", json=credentials) as response:
+            response.raise_for_status()
+            self.token = (await response.json())["token"]
+
+    async def request(self, scenario, method, path, **kwargs):
+        """
+        Hace un request autenticado y registra su latencia en el escenario
+
+        Con GET condicionales activos, los GET repetidos envían If-None-Match
+        con el ETag anterior y un 304 cuenta como bytes ahorrados.
+
+        Returns:
+            tuple: (estado HTTP o None si falló la conexión, body JSON o None)
+        """
+        # La sesión no guarda cookies: cada usuario envía su propio token
+        headers = {"Cookie": f"token={self.token}"}
+        cache_key = (path, tuple(sorted(kwargs.get("params", {}).items())))
+        cached = self.etags.get(cache_key) if self.conditional and method == "GET" else None
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        start = time.perf_counter()
+        status, body, size = None, None, 0
+
+        try:
+            async with self.session.request(method, f"{self.api_url}{path}", headers=headers, **kwargs) as response:
+                status = response.status
+                raw = await response.read()
+                size = len(raw)
+                if raw and response.content_type == "application/json":
+                    body = json.loads(raw)
+                if self.conditional and method == "GET" and status == 200 and response.headers.get("ETag"):
+                    self.etags[cache_key] = (response.headers["ETag"], size)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+        saved = cached[1] if cached and status == 304 else 0
+        self.stats[scenario].record((time.perf_counter() - start) * 1000, status, size, saved)
+        return status, body
+
+    async def run(self, deadline, start_delay, think_time, weights):
+        """
+        Ejecuta escenarios elegidos según su peso hasta el deadline
+        """
+        await asyncio.sleep(start_delay)
+
+        names = list(weights)
+        scenario_weights = [weights[name] for name in names]
+
+        while time.perf_counter() < deadline:
+            scenario = random.choices(names, scenario_weights)[0]
+            await SCENARIOS[scenario](self)
+            if think_time:
+                await asyncio.sleep(think_time)
+
+    async def cleanup(self):
+        """
+        Elimina los eventos que el usuario creó y no borró durante la prueba
+        """
+        headers = {"Cookie": f"token={self.token}"}
+        for event_id in self.event_ids:
+            try:
+                async with self.session.delete(f"{self.api_url}/events/{event_id}", headers=headers) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+        self.event_ids.clear()
+
+
+class LoadResult:
+    """Resultado de una prueba de carga"""
+
+    def __init__(self, stats, elapsed):
+        self.stats = stats
+        self.elapsed = elapsed
+
+    @property
+    def total_requests(self):
+        return sum(scenario.requests for scenario in self.stats.values())
+
+    @property
+    def throughput(self):
+        """Requests por segundo de toda la prueba"""
+        return self.total_requests / self.elapsed if self.elapsed else 0
+
+    @property
+    def bytes_received(self):
+        return sum(scenario.bytes_received for scenario in self.stats.values())
+
+    @property
+    def bytes_saved(self):
+        return sum(scenario.bytes_saved for scenario in self.stats.values())
+
+
+async def run_load(users, duration, ramp_up=0, think_time=0, weights=None, api_url=None,
+                   conditional=LOADGEN_CONDITIONAL_GET):
+    """
+    Ejecuta la prueba de carga
+
+    Args:
+        users (int): Cantidad de usuarios virtuales
+        duration (int): Duración en segundos de la fase de carga
+        ramp_up (int): Segundos en los que se van sumando los usuarios
+        think_time (float): Pausa en segundos entre escenarios de un usuario
+        weights (dict): Peso de cada escenario (por defecto LOADGEN_WEIGHTS)
+        api_url (str): URL base de la API (por defecto get_api_url())
+        conditional (bool): Revalidar los GET repetidos con If-None-Match
+
+    Returns:
+        LoadResult: Estadísticas por escenario y duración real
+    """
+    weights = {name: weight for name, weight in (weights or LOADGEN_WEIGHTS).items() if weight > 0}
+    stats = {name: ScenarioStats(name) for name in SCENARIOS}
+
+    # Una sola sesión con pool de conexiones keep-alive para todos los usuarios
+    connector = aiohttp.TCPConnector(limit=users)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        cookie_jar=aiohttp.DummyCookieJar()
+    ) as session:
+        virtual_users = [VirtualUser(index, session, stats, api_url, conditional) for index in range(users)]
+        await asyncio.gather(*(user.login() for user in virtual_users))
+
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(
+            user.run(deadline, ramp_up * index / users, think_time, weights)
+            for index, user in enumerate(virtual_users)
+        ))
+        elapsed = time.perf_counter() - start
+
+        await asyncio.gather(*(user.cleanup() for user in virtual_users))
+
+    # Escenarios sin requests (peso 0) no aparecen en el reporte
+    return LoadResult({name: s for name, s in stats.items() if s.requests}, elapsed)
+
+
+def export_results(result, reporter=None, max_error_rate=LOADGEN_MAX_ERROR_RATE):
+    """
+    Agrega los resultados al reporte Excel: una fila por escenario en la hoja
+    de resultados (PASSED si la tasa de error no supera max_error_rate) y el
+    detalle en las hojas "Carga" e "Histograma de Latencias"
+
+    Returns:
+        ExcelReporter: El reporte con los resultados agregados
+    """
+    reporter = reporter or ExcelReporter()
+
+    for index, scenario in enumerate(result.stats.values(), start=1):
+        row = scenario.row(result.elapsed)
+        description = f"{row[1]} requests, {row[2]} req/s, p50 {row[3]} ms, p95 {row[4]} ms, p99 {row[5]} ms"
+        if scenario.not_modified:
+            description += f", {scenario.not_modified} respuestas 304 ({scenario.bandwidth_saved:.0f}% de bytes ahorrados)"
+        errors = ", ".join(
+            f"{status}: {count}" for status, count in scenario.status_codes.items()
+            if status == "conexión" or status >= 400
+        )
+        reporter.add_test_result(
+            test_id=f"LG-{index:02d}",
+            historia="Carga: API de eventos",
+            test_name=scenario.name,
+            description=description,
+            status="PASSED" if scenario.error_rate <= max_error_rate else "FAILED",
+            duration=result.elapsed,
+            error_msg=errors
+        )
+
+    reporter.add_load_results(
+        [scenario.row(result.elapsed) for scenario in result.stats.values()],
+        {scenario.name: scenario.histogram() for scenario in result.stats.values()}
+    )
+
+    return reporter
@@ -0,0 +1,72 @@
+"""
+Escenarios de carga sobre la API de eventos
+
+Cada escenario es una corrutina que recibe el usuario virtual y hace sus
+requests con user.request(), que mide la latencia y la registra bajo el
+nombre del escenario.
+"""
+import calendar
+import random
+from datetime import date, timedelta
+
+EVENT_TYPES = ["EXAM", "DELIVERY", "CLASS"]
+
+
+async def listar_mes(user):
+    """
+    GET /events?from=&to= de un mes cercano al actual, como al navegar el calendario
+    """
+    month = date.today().replace(day=1) + timedelta(days=31 * random.randint(-2, 2))
+    last_day = calendar.monthrange(month.year, month.month)[1]
+
+    await user.request(
+        "listar_mes",
+        "GET",
+        "/events",
+        params={
+            "from": f"{month.year}-{month.month:02d}-01",
+            "to": f"{month.year}-{month.month:02d}-{last_day:02d}"
+        }
+    )
+
+
+async def crear_evento(user):
+    """
+    POST /events con un evento en los próximos 60 días
+    """
+    event_date = date.today() + timedelta(days=random.randint(0, 60))
+
+    status, body = await user.request(
+        "crear_evento",
+        "POST",
+        "/events",
+        json={
+            "title": f"Evento de carga {random.randint(1, 10 ** 6)}",
+            "date": event_date.strftime("%Y-%m-%d"),
+            "time": f"{random.randint(8, 21):02d}:00",
+            "type": random.choice(EVENT_TYPES)
+        }
+    )
+
+    if status == 201 and body:
+        user.event_ids.append(body["_id"])
+
+
+async def eliminar_evento(user):
+    """
+    DELETE /events/:id de un evento creado por el usuario (lo crea si no tiene)
+    """
+    if not user.event_ids:
+        await crear_evento(user)
+        if not user.event_ids:
+            return
+
+    event_id = user.event_ids.pop(random.randrange(len(user.event_ids)))
+    await user.request("eliminar_evento", "DELETE", f"/events/{event_id}")
+
+
+SCENARIOS = {
+    "listar_mes": listar_mes,
+    "crear_evento": crear_evento,
+    "eliminar_evento": eliminar_evento,
+}
@@ -0,0 +1,88 @@
+"""
+Estadísticas de latencia y errores por escenario de carga
+"""
+from utils.timing import percentile
+
+# Límites superiores (ms) de los buckets del histograma de latencias
+HISTOGRAM_BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf")]
+
+
+class ScenarioStats:
+    """Acumula latencias y errores de los requests de un escenario"""
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.errors = 0
+        self.status_codes = {}
+        self.bytes_received = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    def record(self, latency_ms, status, size=0, saved=0):
+        """
+        Registra un request. status=None indica un error de conexión o timeout.
+
+        Args:
+            size (int): Bytes del cuerpo de la respuesta
+            saved (int): Bytes que no se descargaron gracias a un 304
+        """
+        self.latencies.append(latency_ms)
+        self.bytes_received += size
+        if status == 304:
+            self.not_modified += 1
+            self.bytes_saved += saved
+        key = status if status is not None else "conexión"
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+        if status is None or status >= 400:
+            self.errors += 1
+
+    @property
+    def requests(self):
+        return len(self.latencies)
+
+    @property
+    def error_rate(self):
+        """Porcentaje de requests con error"""
+        return (self.errors / self.requests * 100) if self.requests else 0
+
+    @property
+    def bandwidth_saved(self):
+        """Porcentaje de bytes que se evitaron descargar con GET condicionales"""
+        total = self.bytes_received + self.bytes_saved
+        return (self.bytes_saved / total * 100) if total else 0
+
+    def row(self, elapsed):
+        """
+        Retorna la fila del escenario con el formato de LOAD_HEADERS del reporte
+
+        Args:
+            elapsed (float): Duración total de la prueba en segundos
+        """
+        return [
+            self.name,
+            self.requests,
+            round(self.requests / elapsed, 2) if elapsed else 0,
+            round(percentile(self.latencies, 50), 1),
+            round(percentile(self.latencies, 95), 1),
+            round(percentile(self.latencies, 99), 1),
+            round(max(self.latencies), 1) if self.latencies else 0,
+            self.errors,
+            round(self.error_rate, 2)
+        ]
+
+    def histogram(self):
+        """
+        Retorna la cantidad de requests por bucket: lista de (límite en ms, requests)
+        """
+        counts = [0] * len(HISTOGRAM_BUCKETS)
+        for latency in self.latencies:
+            for index, upper_bound in enumerate(HISTOGRAM_BUCKETS):
+                if latency <= upper_bound:
+                    counts[index] += 1
+                    break
+
+        return [
+            ("+inf" if upper_bound == float("inf") else upper_bound, count)
+            for upper_bound, count in zip(HISTOGRAM_BUCKETS, counts)
+        ]
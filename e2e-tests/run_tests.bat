@@ -27,8 +27,13 @@ echo.
 echo [INFO] Iniciando ejecucion de pruebas...
 echo.
 
-REM Ejecutar pruebas
-pytest tests/ -v
+REM Ejecutar pruebas (WORKERS=N o WORKERS=auto para ejecutar en paralelo)
+if defined WORKERS (
+    echo [INFO] Ejecucion paralela con %WORKERS% workers
+    pytest tests/ -v -n %WORKERS%
+) else (
+    pytest tests/ -v
+)
 
 echo.
 echo ========================================
@@ -27,8 +27,13 @@ echo ""
 echo "[INFO] Iniciando ejecución de pruebas..."
 echo ""
 
-# Ejecutar pruebas
-pytest tests/ -v
+# Ejecutar pruebas (WORKERS=N o WORKERS=auto para ejecutar en paralelo)
+if [ -n "$WORKERS" ]; then
+    echo "[INFO] Ejecución paralela con $WORKERS workers"
+    pytest tests/ -v -n "$WORKERS"
+else
+    pytest tests/ -v
+fi
 
 echo ""
 echo "========================================"
@@ -0,0 +1,62 @@
+"""
+Fixtures del tier de pruebas de API (HTTP directo, sin navegador)
+"""
+import pytest
+from utils.api_client import ApiClient, api_login
+from utils.users import get_worker_id, get_worker_credentials, provision_user
+from config.config import ALT_USER_EMAIL, ALT_USER_PASSWORD
+
+
+@pytest.fixture
+def api(request):
+    """
+    Cliente HTTP sin sesión; las llamadas de todos los clientes del test
+    (incluidos los de api_user y alt_api_user) se registran en el reporte
+    """
+    client = ApiClient()
+    request.node.api_calls = client.calls
+    return client
+
+
+@pytest.fixture
+def api_user(api, test_user):
+    """
+    Cliente autenticado como el usuario de prueba del worker
+    """
+    return api.as_user(api_login(test_user["email"], test_user["password"]))
+
+
+@pytest.fixture(scope="session")
+def alt_user():
+    """
+    Credenciales del usuario alternativo del worker (para verificar el
+    aislamiento de datos entre usuarios)
+    """
+    email, password = get_worker_credentials(get_worker_id(), ALT_USER_EMAIL, ALT_USER_PASSWORD)
+    provision_user(email, password)
+
+    return {"email": email, "password": password}
+
+
+@pytest.fixture
+def alt_api_user(api, alt_user):
+    """
+    Cliente autenticado como el usuario alternativo
+    """
+    return api.as_user(api_login(alt_user["email"], alt_user["password"]))
+
+
+@pytest.fixture
+def created_events(api_user):
+    """
+    Lista donde los tests agregan los ids de los eventos que crean; al
+    terminar se eliminan
+    """
+    event_ids = []
+    yield event_ids
+
+    for event_id in event_ids:
+        try:
+            api_user.delete(f"/events/{event_id}")
+        except Exception as e:
+            print(f"Warning: Could not delete event {event_id} - {str(e)}")
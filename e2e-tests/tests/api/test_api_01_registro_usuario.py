@@ -0,0 +1,81 @@
+"""
+Tier de API para Historia de Usuario 01 - Registro de Usuario
+
+Criterios de aceptación:
+- Se valida que el email no exista previamente
+- La contraseña debe tener al menos 8 caracteres
+"""
+import pytest
+from utils.helpers import generate_unique_email
+
+pytestmark = pytest.mark.api
+
+
+@pytest.mark.smoke
+def test_api_registro_exitoso(api, test_user):
+    """
+    API-01: POST /auth/register con datos válidos
+
+    Verifica:
+    - Responde 201 con el usuario y el token
+    - Establece la cookie "token" httpOnly
+    - No expone el hash de la contraseña
+    """
+    email = generate_unique_email()
+    response = api.post("/auth/register", json={"email": email, "password": test_user["password"]})
+
+    assert response.status_code == 201, f"Registro rechazado: {response.status_code} {response.text}"
+    body = response.json()
+    assert body["user"]["email"] == email
+    assert body["token"], "La respuesta no incluye el token"
+    assert "passwordHash" not in body["user"], "La respuesta expone el hash de la contraseña"
+
+    set_cookie = response.headers.get("Set-Cookie", "")
+    assert "token=" in set_cookie, "No se estableció la cookie de sesión"
+    assert "HttpOnly" in set_cookie, "La cookie de sesión no es httpOnly"
+
+
+@pytest.mark.critical
+def test_api_registro_email_duplicado(api, test_user):
+    """
+    API-02: Registro con un email ya registrado
+
+    Verifica:
+    - Responde 409 con un mensaje de error
+    """
+    response = api.post("/auth/register", json={"email": test_user["email"], "password": test_user["password"]})
+
+    assert response.status_code == 409, f"Se esperaba 409 y se obtuvo {response.status_code}"
+    assert "registrado" in response.json()["error"]
+
+
+@pytest.mark.parametrize("password", ["Ab1", "abcdefgh1", "ABCDEFGH1", "Abcdefghi"])
+def test_api_registro_password_invalido(api, password):
+    """
+    API-03: Contraseña corta o sin mayúscula, minúscula y número
+
+    Verifica:
+    - Responde 422 indicando el campo password
+    """
+    response = api.post("/auth/register", json={"email": generate_unique_email(), "password": password})
+
+    assert response.status_code == 422, f"Se esperaba 422 y se obtuvo {response.status_code}"
+    assert any(detail.get("path") == "password" for detail in response.json()["details"])
+
+
+@pytest.mark.parametrize("payload", [
+    {"email": "no-es-un-email", "password": "TestPassword123!"},
+    {"email": "", "password": ""},
+    {}
+], ids=["email_invalido", "campos_vacios", "sin_campos"])
+def test_api_registro_datos_invalidos(api, payload):
+    """
+    API-04: Email inválido o campos vacíos
+
+    Verifica:
+    - Responde 422 con el detalle de los errores de validación
+    """
+    response = api.post("/auth/register", json=payload)
+
+    assert response.status_code == 422, f"Se esperaba 422 y se obtuvo {response.status_code}"
+    assert response.json()["details"], "La respuesta no detalla los errores"
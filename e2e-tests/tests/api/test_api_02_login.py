@@ -0,0 +1,102 @@
+"""
+Tier de API para Historia de Usuario 02 - Inicio de sesión
+
+Criterios de aceptación:
+- Si email o contraseña son incorrectos, se muestra error genérico
+- El token de sesión (JWT) se guarda en cookie segura
+"""
+import pytest
+from utils.helpers import generate_unique_email
+
+pytestmark = pytest.mark.api
+
+
+@pytest.mark.smoke
+@pytest.mark.critical
+def test_api_login_exitoso(api, test_user):
+    """
+    API-05: POST /auth/login con credenciales válidas
+
+    Verifica:
+    - Responde 200 con el usuario y el token
+    - Establece la cookie "token" httpOnly
+    """
+    response = api.post("/auth/login", json={"email": test_user["email"], "password": test_user["password"]})
+
+    assert response.status_code == 200, f"Login rechazado: {response.status_code} {response.text}"
+    body = response.json()
+    assert body["user"]["email"] == test_user["email"]
+    assert body["token"], "La respuesta no incluye el token"
+
+    set_cookie = response.headers.get("Set-Cookie", "")
+    assert "token=" in set_cookie and "HttpOnly" in set_cookie, "No se estableció la cookie httpOnly"
+
+
+@pytest.mark.critical
+def test_api_login_credenciales_invalidas(api, test_user):
+    """
+    API-06: Login con contraseña incorrecta y con email inexistente
+
+    Verifica:
+    - Ambos casos responden 401 con el mismo mensaje genérico
+      (no revela si el email existe)
+    """
+    wrong_password = api.post("/auth/login", json={"email": test_user["email"], "password": "WrongPassword123"})
+    unknown_email = api.post("/auth/login", json={"email": generate_unique_email(), "password": test_user["password"]})
+
+    assert wrong_password.status_code == 401
+    assert unknown_email.status_code == 401
+    assert wrong_password.json()["error"] == unknown_email.json()["error"] == "Credenciales inválidas"
+
+
+def test_api_login_campos_vacios(api):
+    """
+    API-07: Login sin email ni contraseña
+
+    Verifica:
+    - Responde 422 con el detalle de los errores de validación
+    """
+    response = api.post("/auth/login", json={"email": "", "password": ""})
+
+    assert response.status_code == 422, f"Se esperaba 422 y se obtuvo {response.status_code}"
+    fields = {detail.get("path") for detail in response.json()["details"]}
+    assert {"email", "password"} <= fields
+
+
+@pytest.mark.critical
+@pytest.mark.parametrize("path", ["/auth/me", "/events?from=2025-01-01&to=2025-01-31", "/profile"])
+def test_api_ruta_protegida_sin_autenticacion(api, path):
+    """
+    API-08: Acceso a rutas protegidas sin token
+
+    Verifica:
+    - Responde 401
+    """
+    response = api.get(path)
+
+    assert response.status_code == 401, f"{path} respondió {response.status_code} sin autenticación"
+
+
+def test_api_sesion_jwt(api_user, test_user):
+    """
+    API-09: El token del login identifica al usuario en GET /auth/me
+    """
+    response = api_user.get("/auth/me")
+
+    assert response.status_code == 200
+    assert response.json()["user"]["email"] == test_user["email"]
+
+
+def test_api_logout(api):
+    """
+    API-10: POST /auth/logout elimina la cookie de sesión
+
+    Verifica:
+    - Responde 204
+    - La cookie "token" se borra (expira en el pasado)
+    """
+    response = api.post("/auth/logout")
+
+    assert response.status_code == 204
+    set_cookie = response.headers.get("Set-Cookie", "")
+    assert "token=" in set_cookie and "Expires=Thu, 01 Jan 1970" in set_cookie, "No se eliminó la cookie de sesión"
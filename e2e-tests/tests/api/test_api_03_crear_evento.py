@@ -0,0 +1,157 @@
+"""
+Tier de API para Historia de Usuario 03 - Crear evento académico
+
+Criterios de aceptación:
+- Campos obligatorios: título, fecha, tipo
+- Campos opcionales: hora, organización, descripción
+- Tipo debe ser: Examen (EXAM), Entrega (DELIVERY) o Clase (CLASS)
+- Se asocia el evento al usuario actual
+- Varios eventos se pueden crear en un solo request (POST /events/batch)
+"""
+import pytest
+from utils.seeding import EventFactory
+
+pytestmark = pytest.mark.api
+
+
+@pytest.mark.smoke
+@pytest.mark.critical
+@pytest.mark.parametrize("event_type", ["EXAM", "DELIVERY", "CLASS"])
+def test_api_crear_evento(api_user, created_events, event_type):
+    """
+    API-11: POST /events con cada tipo de evento
+
+    Verifica:
+    - Responde 201 con el evento creado y su _id
+    - Los datos enviados se guardan tal cual
+    """
+    data = EventFactory(api_user.token).build(type=event_type, time="10:30")
+    response = api_user.post("/events", json=data)
+
+    assert response.status_code == 201, f"Evento rechazado: {response.status_code} {response.text}"
+    event = response.json()
+    created_events.append(event["_id"])
+
+    for field in ("title", "description", "date", "time", "type"):
+        assert event[field] == data[field], f"El campo {field} no coincide"
+
+
+def test_api_crear_evento_sin_hora(api_user, created_events):
+    """
+    API-12: La hora es opcional
+    """
+    data = EventFactory(api_user.token).build(type="DELIVERY")
+    del data["time"]
+
+    response = api_user.post("/events", json=data)
+
+    assert response.status_code == 201, f"Evento rechazado: {response.status_code} {response.text}"
+    created_events.append(response.json()["_id"])
+
+
+@pytest.mark.parametrize("field, value", [
+    ("title", ""),
+    ("title", "x"),
+    ("date", "31/12/2025"),
+    ("date", None),
+    ("time", "25:00"),
+    ("type", "REMINDER"),
+    ("type", None)
+], ids=["sin_titulo", "titulo_corto", "fecha_formato", "sin_fecha", "hora_invalida", "tipo_invalido", "sin_tipo"])
+def test_api_crear_evento_validaciones(api_user, field, value):
+    """
+    API-13: Validación de campos obligatorios y formatos
+
+    Verifica:
+    - Responde 422 indicando el campo inválido
+    """
+    data = EventFactory(api_user.token).build()
+    if value is None:
+        del data[field]
+    else:
+        data[field] = value
+
+    response = api_user.post("/events", json=data)
+
+    assert response.status_code == 422, f"Se esperaba 422 y se obtuvo {response.status_code}"
+    assert any(detail.get("path") == field for detail in response.json()["details"])
+
+
+def test_api_actualizar_evento(api_user, created_events):
+    """
+    API-14: PUT /events/:id actualiza solo los campos enviados
+    """
+    event = api_user.post("/events", json=EventFactory(api_user.token).build()).json()
+    created_events.append(event["_id"])
+
+    response = api_user.put(f"/events/{event['_id']}", json={"title": f"{event['title']} (editado)", "type": "CLASS"})
+
+    assert response.status_code == 200
+    updated = response.json()
+    assert updated["title"] == f"{event['title']} (editado)"
+    assert updated["type"] == "CLASS"
+    assert updated["date"] == event["date"]
+
+
+@pytest.mark.critical
+def test_api_crear_eventos_batch(api_user, created_events):
+    """
+    API-30: POST /events/batch crea todos los eventos válidos en un request
+
+    Verifica:
+    - Responde 201 con un resultado por evento, en el orden enviado
+    - Los eventos quedan asociados al usuario y aparecen en GET /events
+    """
+    factory = EventFactory(api_user.token)
+    data = [factory.build(date="2031-09-01", type=event_type) for event_type in ("EXAM", "DELIVERY", "CLASS")]
+
+    response = api_user.post("/events/batch", json={"events": data})
+
+    assert response.status_code == 201, f"Lote rechazado: {response.status_code} {response.text}"
+    body = response.json()
+    assert body["created"] == 3 and body["failed"] == 0
+    events = [result["event"] for result in body["results"]]
+    created_events.extend(event["_id"] for event in events)
+    assert [result["index"] for result in body["results"]] == [0, 1, 2]
+    assert [event["title"] for event in events] == [item["title"] for item in data]
+
+    listed = api_user.get("/events", params={"from": "2031-09-01", "to": "2031-09-01"}).json()
+    assert {event["_id"] for event in events} <= {event["_id"] for event in listed}
+
+
+def test_api_crear_eventos_batch_parcial(api_user, created_events):
+    """
+    API-31: Un lote con eventos inválidos crea solo los válidos
+
+    Verifica:
+    - Responde 207 con el estado de cada evento
+    - Los inválidos responden 422 con el campo que falló
+    """
+    factory = EventFactory(api_user.token)
+    data = [factory.build(), factory.build(type="REMINDER"), factory.build(), factory.build(title="x")]
+
+    response = api_user.post("/events/batch", json={"events": data})
+
+    assert response.status_code == 207, f"Se esperaba 207 y se obtuvo {response.status_code}"
+    results = response.json()["results"]
+    created_events.extend(result["event"]["_id"] for result in results if result["status"] == 201)
+
+    assert [result["status"] for result in results] == [201, 422, 201, 422]
+    assert [detail["path"] for detail in results[1]["details"]] == ["type"]
+    assert [detail["path"] for detail in results[3]["details"]] == ["title"]
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"events": []},
+    {"events": "no es una lista"},
+    {"events": [{"title": "Evento", "date": "2031-09-01", "type": "EXAM"}] * 101}
+], ids=["sin_events", "lista_vacia", "no_es_lista", "mas_de_100"])
+def test_api_crear_eventos_batch_lista_invalida(api_user, body):
+    """
+    API-32: Un lote vacío, que no es una lista o de más de 100 eventos se rechaza completo con 422
+    """
+    response = api_user.post("/events/batch", json=body)
+
+    assert response.status_code == 422, f"Se esperaba 422 y se obtuvo {response.status_code}"
+    assert any(detail.get("path") == "events" for detail in response.json()["details"])
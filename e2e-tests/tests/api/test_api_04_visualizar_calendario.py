@@ -0,0 +1,315 @@
+"""
+Tier de API para Historia de Usuario 04 - Visualización de calendario mensual
+
+Criterios de aceptación:
+- El calendario muestra los eventos del mes (GET /events?from=&to=)
+- Solo se muestran los eventos del usuario autenticado
+- Los filtros por tipo y texto se aplican en el servidor (GET /events?type=&search=)
+- Un mes sin cambios se revalida con ETag y responde 304 sin cuerpo
+"""
+import time
+import pytest
+from utils.api_client import api_login
+from utils.seeding import EventFactory
+from utils.timing import percentile
+from config.config import FILTER_DATASET_EVENTS
+
+pytestmark = pytest.mark.api
+
+# Mes sin otros eventos de la suite
+MONTH_FROM = "2031-03-01"
+MONTH_TO = "2031-03-31"
+
+# Mes de las pruebas de GET condicional
+ETAG_FROM = "2031-07-01"
+ETAG_TO = "2031-07-31"
+
+# Mes del dataset grande de los filtros
+DATASET_FROM = "2031-05-01"
+DATASET_TO = "2031-05-31"
+DATASET_TYPES = ["EXAM", "DELIVERY", "CLASS"]
+# Uno de cada DATASET_SEARCH_EVERY eventos lleva el texto buscado en el título
+DATASET_SEARCH_TEXT = "Recuperatorio"
+DATASET_SEARCH_EVERY = 10
+
+
+@pytest.mark.critical
+def test_api_listar_eventos_del_mes(api_user, created_events):
+    """
+    API-15: GET /events retorna los eventos del rango ordenados por fecha y hora
+
+    Verifica:
+    - Incluye los eventos dentro del rango (bordes inclusive)
+    - Excluye los eventos fuera del rango
+    - Ordena por fecha y hora
+    """
+    factory = EventFactory(api_user.token)
+    fechas = [
+        ("2031-03-31", "08:00"),
+        ("2031-03-01", "18:00"),
+        ("2031-03-01", "09:00"),
+        ("2031-02-28", "10:00"),
+        ("2031-04-01", "10:00")
+    ]
+    seeded = {}
+    for date, time in fechas:
+        event = api_user.post("/events", json=factory.build(date=date, time=time)).json()
+        created_events.append(event["_id"])
+        seeded[event["_id"]] = (date, time)
+
+    response = api_user.get("/events", params={"from": MONTH_FROM, "to": MONTH_TO})
+
+    assert response.status_code == 200
+    listed = [(event["date"], event["time"]) for event in response.json() if event["_id"] in seeded]
+    assert listed == [("2031-03-01", "09:00"), ("2031-03-01", "18:00"), ("2031-03-31", "08:00")]
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"from": MONTH_FROM},
+    {"from": "01/03/2031", "to": MONTH_TO}
+], ids=["sin_rango", "sin_to", "formato_invalido"])
+def test_api_listar_eventos_parametros_invalidos(api_user, params):
+    """
+    API-16: Los parámetros from y to son obligatorios y con formato YYYY-MM-DD
+    """
+    response = api_user.get("/events", params=params)
+
+    assert response.status_code == 400, f"Se esperaba 400 y se obtuvo {response.status_code}"
+
+
+@pytest.mark.critical
+def test_api_eventos_solo_del_usuario_actual(api_user, alt_api_user, created_events):
+    """
+    API-17: Un usuario no ve los eventos de otro
+    """
+    event = api_user.post("/events", json=EventFactory(api_user.token).build(date=MONTH_FROM)).json()
+    created_events.append(event["_id"])
+
+    response = alt_api_user.get("/events", params={"from": MONTH_FROM, "to": MONTH_TO})
+
+    assert response.status_code == 200
+    assert event["_id"] not in [other["_id"] for other in response.json()]
+
+
+@pytest.fixture(scope="module")
+def filter_dataset(test_user):
+    """
+    Siembra FILTER_DATASET_EVENTS eventos en DATASET_FROM..DATASET_TO con
+    tipos alternados y el texto de búsqueda en una fracción de los títulos
+    """
+    factory = EventFactory(api_login(test_user["email"], test_user["password"]))
+    overrides = []
+    for i in range(FILTER_DATASET_EVENTS):
+        title = f"{DATASET_SEARCH_TEXT} {i}" if i % DATASET_SEARCH_EVERY == 0 else f"Clase teórica {i}"
+        overrides.append({
+            "title": f"{factory.build()['title']} {title}",
+            "description": "Evento del dataset de filtros " * 8,
+            "date": f"2031-05-{i % 31 + 1:02d}",
+            "time": f"{i % 24:02d}:00",
+            "type": DATASET_TYPES[i % len(DATASET_TYPES)]
+        })
+    events = factory.create_many(events=overrides)
+
+    yield events
+
+    factory.cleanup()
+
+
+def test_api_filtrar_eventos_por_tipo(api_user, created_events):
+    """
+    API-23: GET /events?type= retorna solo los eventos de ese tipo
+    """
+    factory = EventFactory(api_user.token)
+    seeded = {}
+    for event_type in DATASET_TYPES:
+        event = api_user.post("/events", json=factory.build(date=MONTH_FROM, type=event_type)).json()
+        created_events.append(event["_id"])
+        seeded[event["_id"]] = event_type
+
+    response = api_user.get("/events", params={"from": MONTH_FROM, "to": MONTH_TO, "type": "DELIVERY"})
+
+    assert response.status_code == 200
+    events = response.json()
+    assert all(event["type"] == "DELIVERY" for event in events), "Se listaron eventos de otro tipo"
+    assert [seeded[event["_id"]] for event in events if event["_id"] in seeded] == ["DELIVERY"]
+
+
+def test_api_buscar_eventos_por_texto(api_user, created_events):
+    """
+    API-24: GET /events?search= busca en título y descripción
+
+    Verifica:
+    - No distingue mayúsculas
+    - Encuentra el texto en la descripción
+    - Los caracteres especiales se buscan literalmente
+    """
+    factory = EventFactory(api_user.token)
+    en_titulo = api_user.post("/events", json=factory.build(date=MONTH_FROM, title="Parcial de Álgebra (C++)")).json()
+    en_descripcion = api_user.post("/events", json=factory.build(date=MONTH_FROM, description="Traer el PARCIAL impreso")).json()
+    otro = api_user.post("/events", json=factory.build(date=MONTH_FROM, title="Entrega TP")).json()
+    created_events.extend(event["_id"] for event in (en_titulo, en_descripcion, otro))
+
+    def buscar(text):
+        response = api_user.get("/events", params={"from": MONTH_FROM, "to": MONTH_TO, "search": text})
+        assert response.status_code == 200
+        return {event["_id"] for event in response.json()}
+
+    encontrados = buscar("parcial")
+    assert {en_titulo["_id"], en_descripcion["_id"]} <= encontrados
+    assert otro["_id"] not in encontrados
+
+    assert buscar("(C++)") >= {en_titulo["_id"]}
+    assert en_titulo["_id"] not in buscar("C.+"), "La búsqueda se interpretó como expresión regular"
+
+
+@pytest.mark.parametrize("params", [
+    {"type": "REMINDER"},
+    {"search": "x" * 101}
+], ids=["tipo_invalido", "busqueda_larga"])
+def test_api_filtros_invalidos(api_user, params):
+    """
+    API-25: Un tipo desconocido o una búsqueda de más de 100 caracteres responden 400
+    """
+    response = api_user.get("/events", params={"from": MONTH_FROM, "to": MONTH_TO, **params})
+
+    assert response.status_code == 400, f"Se esperaba 400 y se obtuvo {response.status_code}"
+
+
+@pytest.mark.regression
+def test_api_filtros_reducen_payload(api_user, filter_dataset):
+    """
+    API-26: Con un mes de muchos eventos, filtrar en el servidor reduce el payload
+
+    Verifica:
+    - type y search retornan exactamente los eventos que cumplen el filtro
+    - El payload filtrado es proporcional a los eventos que cumplen el filtro
+    - Informa bytes y p50 de latencia de cada consulta (las llamadas quedan
+      además en la hoja "Latencia API")
+    """
+    seeded = {event["_id"]: event for event in filter_dataset}
+    consultas = {
+        "completo": {},
+        "tipo": {"type": "EXAM"},
+        "busqueda": {"search": DATASET_SEARCH_TEXT.lower()}
+    }
+
+    resultados = {}
+    for nombre, filtros in consultas.items():
+        durations = []
+        for _ in range(5):
+            start = time.perf_counter()
+            response = api_user.get("/events", params={"from": DATASET_FROM, "to": DATASET_TO, **filtros})
+            durations.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+
+        ids = {event["_id"] for event in response.json() if event["_id"] in seeded}
+        resultados[nombre] = (ids, len(response.content), percentile(durations, 50))
+        print(f"GET /events {nombre}: {len(ids)} eventos, {len(response.content)} bytes, p50 {resultados[nombre][2]:.1f}ms")
+
+    completo, tipo, busqueda = resultados["completo"], resultados["tipo"], resultados["busqueda"]
+    assert completo[0] == set(seeded)
+    assert tipo[0] == {i for i, event in seeded.items() if event["type"] == "EXAM"}
+    assert busqueda[0] == {i for i, event in seeded.items() if DATASET_SEARCH_TEXT in event["title"]}
+
+    # Un tercio de los eventos son EXAM y uno de cada diez tiene el texto buscado
+    assert tipo[1] <= completo[1] * 0.4, f"El filtro por tipo no redujo el payload ({tipo[1]} de {completo[1]} bytes)"
+    assert busqueda[1] <= completo[1] * 0.15, \
+        f"La búsqueda no redujo el payload ({busqueda[1]} de {completo[1]} bytes)"
+
+
+def listar_condicional(client, etag=None, **params):
+    """
+    GET /events del mes de las pruebas de ETag, con If-None-Match si se indica
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get("/events", params={"from": ETAG_FROM, "to": ETAG_TO, **params}, headers=headers)
+
+
+@pytest.mark.critical
+def test_api_get_condicional_sin_cambios(api_user, created_events):
+    """
+    API-27: GET /events con el ETag de la respuesta anterior responde 304
+
+    Verifica:
+    - La respuesta incluye ETag, Last-Modified y Cache-Control: no-cache
+    - Repetir el GET con If-None-Match responde 304 sin cuerpo
+    - If-Modified-Since con el Last-Modified también responde 304
+    """
+    event = api_user.post("/events", json=EventFactory(api_user.token).build(date=ETAG_FROM)).json()
+    created_events.append(event["_id"])
+
+    first = listar_condicional(api_user)
+    assert first.status_code == 200
+    etag = first.headers.get("ETag")
+    assert etag, "GET /events no envió ETag"
+    assert first.headers.get("Last-Modified"), "GET /events no envió Last-Modified"
+    assert "no-cache" in first.headers.get("Cache-Control", "")
+
+    second = listar_condicional(api_user, etag)
+    assert second.status_code == 304, f"Se esperaba 304 y se obtuvo {second.status_code}"
+    assert second.content == b""
+    assert second.headers.get("ETag") == etag
+
+    since = api_user.get(
+        "/events",
+        params={"from": ETAG_FROM, "to": ETAG_TO},
+        headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+    assert since.status_code == 304, f"Se esperaba 304 y se obtuvo {since.status_code}"
+
+
+@pytest.mark.critical
+@pytest.mark.parametrize("mutation", ["crear", "editar", "eliminar", "crear_otro_mes"])
+def test_api_get_condicional_tras_cambios(api_user, created_events, mutation):
+    """
+    API-28: Crear, editar o eliminar un evento del usuario invalida el ETag
+
+    Verifica:
+    - El GET con el ETag anterior responde 200 con un ETag nuevo
+    - La lista refleja el cambio
+    - Un cambio en otro mes también invalida el ETag (la versión es por usuario)
+    """
+    factory = EventFactory(api_user.token)
+    event = api_user.post("/events", json=factory.build(date=ETAG_FROM)).json()
+    created_events.append(event["_id"])
+    etag = listar_condicional(api_user).headers["ETag"]
+
+    if mutation == "crear":
+        changed = api_user.post("/events", json=factory.build(date=ETAG_TO)).json()
+        created_events.append(changed["_id"])
+    elif mutation == "editar":
+        api_user.put(f"/events/{event['_id']}", json={"title": f"{event['title']} (editado)"})
+    elif mutation == "eliminar":
+        api_user.delete(f"/events/{event['_id']}")
+    else:
+        other = api_user.post("/events", json=factory.build(date=MONTH_FROM)).json()
+        created_events.append(other["_id"])
+
+    response = listar_condicional(api_user, etag)
+
+    assert response.status_code == 200, f"Se respondió {response.status_code} después de {mutation}"
+    assert response.headers["ETag"] != etag
+    listed = {item["_id"]: item for item in response.json()}
+    if mutation == "crear":
+        assert changed["_id"] in listed
+    elif mutation == "editar":
+        assert listed[event["_id"]]["title"].endswith("(editado)")
+    elif mutation == "eliminar":
+        assert event["_id"] not in listed
+
+
+def test_api_etag_por_consulta_y_usuario(api_user, alt_api_user):
+    """
+    API-29: El ETag es distinto para cada rango, filtro y usuario
+
+    Verifica:
+    - El ETag de un mes no sirve para otro rango ni para otro filtro
+    - El ETag de un usuario no produce 304 para otro usuario
+    """
+    etag = listar_condicional(api_user).headers["ETag"]
+
+    assert listar_condicional(api_user, etag, type="EXAM").status_code == 200
+    otro_mes = api_user.get("/events", params={"from": MONTH_FROM, "to": MONTH_TO}, headers={"If-None-Match": etag})
+    assert otro_mes.status_code == 200
+    assert listar_condicional(alt_api_user, etag).status_code == 200
@@ -0,0 +1,103 @@
+"""
+Tier de API para Historia de Usuario 05 - Eliminar evento
+
+Criterios de aceptación:
+- El evento eliminado deja de aparecer en el calendario
+- Solo se pueden eliminar eventos propios
+- Varios eventos se pueden eliminar en un solo request (POST /events/batch-delete)
+"""
+import pytest
+from utils.seeding import EventFactory
+
+pytestmark = pytest.mark.api
+
+
+@pytest.mark.critical
+def test_api_eliminar_evento(api_user, created_events):
+    """
+    API-18: DELETE /events/:id
+
+    Verifica:
+    - Responde 204
+    - El evento ya no aparece en GET /events
+    - Eliminarlo de nuevo responde 404
+    """
+    event = api_user.post("/events", json=EventFactory(api_user.token).build()).json()
+    created_events.append(event["_id"])
+
+    response = api_user.delete(f"/events/{event['_id']}")
+    assert response.status_code == 204
+
+    listed = api_user.get("/events", params={"from": event["date"], "to": event["date"]}).json()
+    assert event["_id"] not in [other["_id"] for other in listed], "El evento eliminado sigue listado"
+
+    assert api_user.delete(f"/events/{event['_id']}").status_code == 404
+
+
+@pytest.mark.critical
+def test_api_solo_eliminar_eventos_propios(api_user, alt_api_user, created_events):
+    """
+    API-19: Un usuario no puede eliminar ni editar eventos de otro
+
+    Verifica:
+    - DELETE y PUT con otro usuario responden 404
+    - El evento sigue existiendo para su dueño
+    """
+    event = api_user.post("/events", json=EventFactory(api_user.token).build()).json()
+    created_events.append(event["_id"])
+
+    assert alt_api_user.delete(f"/events/{event['_id']}").status_code == 404
+    assert alt_api_user.put(f"/events/{event['_id']}", json={"title": "Modificado"}).status_code == 404
+
+    listed = api_user.get("/events", params={"from": event["date"], "to": event["date"]}).json()
+    assert event["_id"] in [other["_id"] for other in listed], "El evento fue eliminado por otro usuario"
+
+
+@pytest.mark.critical
+def test_api_eliminar_eventos_batch(api_user, alt_api_user, created_events):
+    """
+    API-33: POST /events/batch-delete elimina los eventos propios del lote
+
+    Verifica:
+    - Responde 200 con un estado por id: 204 eliminado, 404 inexistente o ajeno
+    - Los eventos eliminados ya no aparecen en GET /events
+    - El evento de otro usuario sigue existiendo
+    """
+    propios = [api_user.post("/events", json=EventFactory(api_user.token).build()).json() for _ in range(3)]
+    ajeno = alt_api_user.post("/events", json=EventFactory(alt_api_user.token).build()).json()
+    created_events.extend(event["_id"] for event in propios)
+    inexistente = "0" * 24
+    ids = [event["_id"] for event in propios] + [ajeno["_id"], inexistente]
+
+    try:
+        response = api_user.post("/events/batch-delete", json={"ids": ids})
+
+        assert response.status_code == 200, f"Lote rechazado: {response.status_code} {response.text}"
+        body = response.json()
+        assert body["deleted"] == 3
+        assert [(result["id"], result["status"]) for result in body["results"]] == \
+            [(event_id, 204) for event_id in ids[:3]] + [(ajeno["_id"], 404), (inexistente, 404)]
+
+        date = propios[0]["date"]
+        listed = {event["_id"] for event in api_user.get("/events", params={"from": date, "to": date}).json()}
+        assert not listed & set(ids[:3]), "Los eventos eliminados siguen listados"
+
+        ajenos = alt_api_user.get("/events", params={"from": ajeno["date"], "to": ajeno["date"]}).json()
+        assert ajeno["_id"] in [event["_id"] for event in ajenos], "Se eliminó el evento de otro usuario"
+    finally:
+        alt_api_user.delete(f"/events/{ajeno['_id']}")
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"ids": []},
+    {"ids": [1, 2]},
+    {"ids": ["0" * 24] * 101}
+], ids=["sin_ids", "lista_vacia", "ids_no_string", "mas_de_100"])
+def test_api_eliminar_eventos_batch_lista_invalida(api_user, body):
+    """
+    API-34: Una lista de ids vacía, con valores que no son strings o de más de 100 ids responde 422
+    """
+    response = api_user.post("/events/batch-delete", json=body)
+
+    assert response.status_code == 422, f"Se esperaba 422 y se obtuvo {response.status_code}"
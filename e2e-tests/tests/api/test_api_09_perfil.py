@@ -0,0 +1,49 @@
+"""
+Tier de API para el perfil de usuario (GET/PUT /profile)
+"""
+import pytest
+
+pytestmark = pytest.mark.api
+
+
+def test_api_obtener_perfil(api_user, test_user):
+    """
+    API-20: GET /profile retorna los datos del usuario sin el hash de la contraseña
+    """
+    response = api_user.get("/profile")
+
+    assert response.status_code == 200
+    user = response.json()["user"]
+    assert user["email"] == test_user["email"]
+    assert "passwordHash" not in user
+
+
+def test_api_actualizar_perfil(api_user):
+    """
+    API-21: PUT /profile actualiza nombre, apellido y organizaciones
+    """
+    original = api_user.get("/profile").json()["user"]
+    changes = {"firstName": "Ana", "lastName": "Prueba", "organizations": ["UADE"]}
+
+    try:
+        response = api_user.put("/profile", json=changes)
+
+        assert response.status_code == 200
+        user = response.json()["user"]
+        for field, value in changes.items():
+            assert user[field] == value, f"El campo {field} no se actualizó"
+    finally:
+        api_user.put("/profile", json={
+            "firstName": original.get("firstName") or "",
+            "lastName": original.get("lastName") or "",
+            "organizations": original.get("organizations", [])
+        })
+
+
+def test_api_actualizar_perfil_validaciones(api_user):
+    """
+    API-22: PUT /profile rechaza organizaciones que no son una lista
+    """
+    response = api_user.put("/profile", json={"organizations": "UADE"})
+
+    assert response.status_code == 422
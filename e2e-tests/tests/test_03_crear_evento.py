@@ -9,15 +9,21 @@ Criterios de aceptación:
 - Al crearlo, aparece reflejado en el calendario
 """
 import pytest
-import time
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
 from utils.helpers import (
     wait_for_element,
     wait_for_element_clickable,
-    clear_and_send_keys
+    clear_and_send_keys,
+    wait_until,
+    any_of,
+    url_contains,
+    element_appeared,
+    render_settled,
+    open_page,
+    take_screenshot
 )
-from config.config import BASE_URL
+from utils.timing import step
 
 
 @pytest.mark.smoke
@@ -34,8 +40,7 @@ def test_crear_evento_exitoso(authenticated_driver):
     - Evento aparece en el calendario (redirección a /calendar)
     """
     driver = authenticated_driver
-    driver.get(f"{BASE_URL}/calendar")
-    time.sleep(1)
+    open_page(driver, "/calendar")
 
     # Hacer clic en el botón "Nuevo evento"
     new_event_button = wait_for_element_clickable(driver, (
@@ -44,7 +49,7 @@ def test_crear_evento_exitoso(authenticated_driver):
     ))
     if new_event_button:
         new_event_button.click()
-        time.sleep(1)
+        wait_until(driver, url_contains("/new"), render_settled())
 
     titulo = f"Examen Final - {datetime.now().strftime('%Y%m%d%H%M%S')}"
     descripcion = "Examen final de Testing de Aplicaciones"
@@ -66,48 +71,50 @@ def test_crear_evento_exitoso(authenticated_driver):
         arguments[0].dispatchEvent(event);
     """
 
-    # Llenar el campo título
-    titulo_field = wait_for_element(driver, (By.ID, "title"))
-    if titulo_field:
-        driver.execute_script(set_react_value, titulo_field, titulo)
-        time.sleep(0.3)
-
-    # Seleccionar el tipo usando radio button (EXAM, DELIVERY, CLASS)
-    tipo_radio = wait_for_element_clickable(driver, (By.CSS_SELECTOR, "input[name='type'][value='EXAM']"))
-    if tipo_radio:
-        driver.execute_script("arguments[0].click();", tipo_radio)
-        time.sleep(0.3)
-
-    # Llenar el campo fecha usando JavaScript
-    fecha_field = wait_for_element(driver, (By.ID, "date"))
-    if fecha_field:
-        driver.execute_script(set_react_value, fecha_field, fecha)
-        time.sleep(0.3)
-
-    # Llenar el campo hora usando JavaScript
-    hora_field = wait_for_element(driver, (By.ID, "time"))
-    if hora_field:
-        driver.execute_script(set_react_value, hora_field, hora)
-        time.sleep(0.3)
-
-    # Llenar el campo descripción usando JavaScript
-    descripcion_field = wait_for_element(driver, (By.ID, "description"))
-    if descripcion_field:
-        driver.execute_script(set_react_textarea_value, descripcion_field, descripcion)
-        time.sleep(0.3)
+    with step("formulario"):
+        # Llenar el campo título
+        titulo_field = wait_for_element(driver, (By.ID, "title"))
+        if titulo_field:
+            driver.execute_script(set_react_value, titulo_field, titulo)
+
+        # Seleccionar el tipo usando radio button (EXAM, DELIVERY, CLASS)
+        tipo_radio = wait_for_element_clickable(driver, (By.CSS_SELECTOR, "input[name='type'][value='EXAM']"))
+        if tipo_radio:
+            driver.execute_script("arguments[0].click();", tipo_radio)
+
+        # Llenar el campo fecha usando JavaScript
+        fecha_field = wait_for_element(driver, (By.ID, "date"))
+        if fecha_field:
+            driver.execute_script(set_react_value, fecha_field, fecha)
+
+        # Llenar el campo hora usando JavaScript
+        hora_field = wait_for_element(driver, (By.ID, "time"))
+        if hora_field:
+            driver.execute_script(set_react_value, hora_field, hora)
+
+        # Llenar el campo descripción usando JavaScript
+        descripcion_field = wait_for_element(driver, (By.ID, "description"))
+        if descripcion_field:
+            driver.execute_script(set_react_textarea_value, descripcion_field, descripcion)
 
     submit_button = wait_for_element_clickable(driver, (By.CSS_SELECTOR, "button[type='submit']"))
     if submit_button:
         submit_button.click()
 
-    time.sleep(3)
+    wait_until(driver, any_of(
+        url_contains("/calendar"),
+        element_appeared((By.CSS_SELECTOR, ".bg-red-50.border"))
+    ))
 
-    # Verificar si hay algún mensaje de error
-    error_elements = driver.find_elements(By.CSS_SELECTOR, ".bg-red-50.border")
+    # Verificar si hay algún mensaje de error (solo si no hubo redirección, para
+    # no pagar la espera implícita buscando un elemento que no existe)
+    error_elements = []
+    if "/calendar" not in driver.current_url:
+        error_elements = driver.find_elements(By.CSS_SELECTOR, ".bg-red-50.border")
     if error_elements:
         error_text = " ".join([el.text for el in error_elements if el.text])
-        # Guardar screenshot para debug
-        driver.save_screenshot("reports/error_crear_evento.png")
+        # Guardar screenshot para debug (se escribe en segundo plano)
+        take_screenshot(driver, "error_crear_evento")
         print(f"Error en formulario: {error_text.encode('ascii', 'ignore').decode('ascii')}")
 
     current_url = driver.current_url
@@ -126,8 +133,7 @@ def test_crear_evento_campos_obligatorios(authenticated_driver):
     - Formulario no se envía con campos vacíos (permanece en /new)
     """
     driver = authenticated_driver
-    driver.get(f"{BASE_URL}/calendar")
-    time.sleep(1)
+    open_page(driver, "/calendar")
 
     # Hacer clic en el botón "Nuevo evento"
     new_event_button = wait_for_element_clickable(driver, (
@@ -136,12 +142,12 @@ def test_crear_evento_campos_obligatorios(authenticated_driver):
     ))
     if new_event_button:
         new_event_button.click()
-        time.sleep(1)
+        wait_until(driver, url_contains("/new"), render_settled())
 
     submit_button = wait_for_element_clickable(driver, (By.CSS_SELECTOR, "button[type='submit']"))
     if submit_button:
         submit_button.click()
 
-    time.sleep(1)
+    wait_until(driver, render_settled())
 
     assert "/new" in driver.current_url, "El formulario se envió con campos vacíos"
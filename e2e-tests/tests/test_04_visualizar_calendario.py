@@ -8,11 +8,9 @@ Criterios de aceptación:
 - Al hacer clic en un día, se ven sus eventos
 """
 import pytest
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
-from utils.helpers import wait_for_element
-from config.config import BASE_URL
+from utils.helpers import wait_for_element, wait_until, network_idle, render_settled, open_page
 
 
 @pytest.mark.smoke
@@ -28,8 +26,8 @@ def test_visualizar_calendario(authenticated_driver):
     - Posibilidad de navegar entre meses
     """
     driver = authenticated_driver
-    driver.get(f"{BASE_URL}/calendar")
-    time.sleep(2)
+    open_page(driver, "/calendar")
+    wait_until(driver, network_idle(), render_settled())
 
     assert "/calendar" in driver.current_url
 
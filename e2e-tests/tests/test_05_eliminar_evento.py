@@ -7,21 +7,50 @@ Criterios de aceptación:
 - El evento desaparece del calendario al eliminarse
 """
 import pytest
-import time
-from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
 from utils.helpers import (
     wait_for_element,
     wait_for_element_clickable,
-    clear_and_send_keys
+    wait_until,
+    element_stale,
+    network_idle,
+    render_settled,
+    open_page
 )
-from config.config import BASE_URL
+
+# Botones del modal de detalle y del modal de confirmación
+ELIMINAR_BUTTON = (By.XPATH, "//button[normalize-space()='Eliminar']")
+CONFIRMAR_ELIMINAR_BUTTON = (By.XPATH, "//button[normalize-space()='Eliminar evento']")
+CANCELAR_BUTTON = (By.XPATH, "//button[normalize-space()='Cancelar']")
+CONFIRMACION_TITULO = (By.XPATH, "//h3[contains(., 'eliminar este evento')]")
+
+
+def abrir_confirmacion_eliminar(driver, titulo):
+    """
+    Abre el evento en el calendario y pide eliminarlo
+
+    Returns:
+        WebElement: El botón del evento dentro del calendario
+    """
+    open_page(driver, "/calendar")
+    wait_until(driver, network_idle(), render_settled())
+
+    evento = wait_for_element_clickable(driver, (By.XPATH, f"//button[contains(@title, '{titulo}')]"))
+    assert evento is not None, f"El evento '{titulo}' no aparece en el calendario"
+    evento.click()
+
+    eliminar_button = wait_for_element_clickable(driver, ELIMINAR_BUTTON)
+    assert eliminar_button is not None, "El detalle del evento no muestra el botón Eliminar"
+    eliminar_button.click()
+
+    assert wait_for_element(driver, CONFIRMACION_TITULO), "No se solicitó confirmación antes de eliminar"
+    return evento
 
 
 @pytest.mark.smoke
 @pytest.mark.critical
-def test_eliminar_evento(authenticated_driver):
+@pytest.mark.seed_events(1)
+def test_eliminar_evento(authenticated_driver, seeded_events):
     """
     CP-08: Eliminar evento con confirmación
 
@@ -31,62 +60,22 @@ def test_eliminar_evento(authenticated_driver):
     - Evento desaparece del calendario
     """
     driver = authenticated_driver
+    titulo_evento = seeded_events[0]["title"]
 
-    driver.get(f"{BASE_URL}/new")
-    time.sleep(1)
-
-    titulo_evento = f"Evento a Eliminar - {datetime.now().strftime('%Y%m%d%H%M%S')}"
-    descripcion = "Este evento será eliminado"
-    fecha = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-
-    titulo_field = wait_for_element(driver, (By.NAME, "title"))
-    if titulo_field:
-        clear_and_send_keys(titulo_field, titulo_evento)
-
-    descripcion_field = wait_for_element(driver, (By.NAME, "description"))
-    if descripcion_field:
-        clear_and_send_keys(descripcion_field, descripcion)
-
-    fecha_field = wait_for_element(driver, (By.NAME, "date"))
-    if fecha_field:
-        clear_and_send_keys(fecha_field, fecha)
-
-    tipo_select = wait_for_element(driver, (By.NAME, "type"))
-    if tipo_select:
-        select = Select(tipo_select)
-        select.select_by_value("Recordatorio")
-
-    submit_button = wait_for_element_clickable(driver, (By.CSS_SELECTOR, "button[type='submit']"))
-    if submit_button:
-        submit_button.click()
+    evento = abrir_confirmacion_eliminar(driver, titulo_evento)
 
-    time.sleep(3)
+    confirm_button = wait_for_element_clickable(driver, CONFIRMAR_ELIMINAR_BUTTON)
+    assert confirm_button is not None, "El modal de confirmación no tiene el botón Eliminar evento"
+    confirm_button.click()
 
-    driver.get(f"{BASE_URL}/calendar")
-    time.sleep(2)
-
-    delete_buttons = driver.find_elements(
-        By.CSS_SELECTOR,
-        "button[aria-label*='delete'], button[class*='delete'], button:has(svg[data-icon='trash'])"
-    )
-
-    if len(delete_buttons) > 0:
-        delete_buttons[0].click()
-        time.sleep(1)
-
-        confirm_button = wait_for_element_clickable(driver, (
-            By.CSS_SELECTOR,
-            "button[class*='confirm'], button:contains('Confirmar'), button:contains('Eliminar'), button:contains('Sí')"
-        ))
-
-        if confirm_button:
-            confirm_button.click()
-            time.sleep(2)
+    assert wait_until(driver, element_stale(evento)), \
+        f"El evento '{titulo_evento}' sigue en el calendario después de eliminarlo"
 
 
 @pytest.mark.smoke
 @pytest.mark.critical
-def test_cancelar_eliminacion_evento(authenticated_driver):
+@pytest.mark.seed_events(1)
+def test_cancelar_eliminacion_evento(authenticated_driver, seeded_events):
     """
     CP-09: Cancelar eliminación de evento
 
@@ -96,53 +85,14 @@ def test_cancelar_eliminacion_evento(authenticated_driver):
     - Evento sigue presente en el calendario
     """
     driver = authenticated_driver
+    titulo_evento = seeded_events[0]["title"]
 
-    driver.get(f"{BASE_URL}/new")
-    time.sleep(1)
-
-    titulo_evento = f"Evento NO Eliminar - {datetime.now().strftime('%Y%m%d%H%M%S')}"
-    fecha = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
-
-    titulo_field = wait_for_element(driver, (By.NAME, "title"))
-    if titulo_field:
-        clear_and_send_keys(titulo_field, titulo_evento)
-
-    descripcion_field = wait_for_element(driver, (By.NAME, "description"))
-    if descripcion_field:
-        clear_and_send_keys(descripcion_field, "No debe eliminarse")
-
-    fecha_field = wait_for_element(driver, (By.NAME, "date"))
-    if fecha_field:
-        clear_and_send_keys(fecha_field, fecha)
-
-    tipo_select = wait_for_element(driver, (By.NAME, "type"))
-    if tipo_select:
-        select = Select(tipo_select)
-        select.select_by_value("Recordatorio")
-
-    submit_button = wait_for_element_clickable(driver, (By.CSS_SELECTOR, "button[type='submit']"))
-    if submit_button:
-        submit_button.click()
-
-    time.sleep(3)
-
-    driver.get(f"{BASE_URL}/calendar")
-    time.sleep(2)
-
-    delete_buttons = driver.find_elements(
-        By.CSS_SELECTOR,
-        "button[aria-label*='delete'], button[class*='delete']"
-    )
-
-    if len(delete_buttons) > 0:
-        delete_buttons[0].click()
-        time.sleep(1)
+    evento = abrir_confirmacion_eliminar(driver, titulo_evento)
+    confirmacion = driver.find_element(*CONFIRMACION_TITULO)
 
-        cancel_button = wait_for_element_clickable(driver, (
-            By.CSS_SELECTOR,
-            "button[class*='cancel'], button:contains('Cancelar'), button:contains('No')"
-        ))
+    cancel_button = wait_for_element_clickable(driver, CANCELAR_BUTTON)
+    assert cancel_button is not None, "El modal de confirmación no tiene el botón Cancelar"
+    cancel_button.click()
 
-        if cancel_button:
-            cancel_button.click()
-            time.sleep(1)
+    assert wait_until(driver, element_stale(confirmacion)), "El modal de confirmación no se cerró"
+    assert evento.is_displayed(), f"El evento '{titulo_evento}' ya no está en el calendario"
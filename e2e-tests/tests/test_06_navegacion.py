@@ -6,10 +6,8 @@ Criterios de aceptación:
 - Se puede volver al calendario desde cualquier vista
 """
 import pytest
-import time
 from selenium.webdriver.common.by import By
-from utils.helpers import wait_for_element
-from config.config import BASE_URL
+from utils.helpers import wait_for_element, open_page
 
 
 @pytest.mark.smoke
@@ -28,8 +26,7 @@ def test_navegacion_basica(authenticated_driver):
     paginas = ["/calendar", "/new"]
 
     for pagina in paginas:
-        driver.get(f"{BASE_URL}{pagina}")
-        time.sleep(1)
+        open_page(driver, pagina)
 
         navbar = wait_for_element(driver, (
             By.CSS_SELECTOR,
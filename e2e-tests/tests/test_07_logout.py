@@ -5,10 +5,8 @@ Criterios de aceptación:
 - El botón "Cerrar sesión" elimina el token y redirige al login
 """
 import pytest
-import time
 from selenium.webdriver.common.by import By
-from utils.helpers import wait_for_element_clickable
-from config.config import BASE_URL
+from utils.helpers import wait_for_element_clickable, wait_until, url_contains, open_page
 
 
 @pytest.mark.smoke
@@ -22,8 +20,7 @@ def test_logout(authenticated_driver):
     - Redirección a /login
     """
     driver = authenticated_driver
-    driver.get(f"{BASE_URL}/calendar")
-    time.sleep(1)
+    open_page(driver, "/calendar")
 
     # Primero hacer clic en el botón del menú de usuario (avatar)
     user_menu_button = wait_for_element_clickable(driver, (
@@ -33,7 +30,6 @@ def test_logout(authenticated_driver):
 
     if user_menu_button:
         user_menu_button.click()
-        time.sleep(0.5)
 
     # Ahora hacer clic en el botón "Cerrar sesión" del dropdown
     logout_button = wait_for_element_clickable(driver, (
@@ -43,6 +39,6 @@ def test_logout(authenticated_driver):
 
     if logout_button:
         logout_button.click()
-        time.sleep(2)
+        wait_until(driver, url_contains("/login"))
 
         assert "/login" in driver.current_url, "No redirigió al login"
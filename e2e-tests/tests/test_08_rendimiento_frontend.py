@@ -0,0 +1,116 @@
+"""
+Test Suite de Rendimiento del frontend - Presupuestos de Web Vitals
+
+Criterios de aceptación:
+- Las páginas principales cargan dentro de su presupuesto de LCP
+- El layout no se desplaza de forma inesperada (CLS)
+- La página queda interactiva rápido, sin long tasks prolongadas
+- Los presupuestos se configuran por página en config/config.py (PERF_BUDGETS)
+- Navegar entre meses ya visitados o adyacentes no repite requests a la API
+"""
+import time
+import pytest
+from datetime import date
+from selenium.webdriver.common.by import By
+from utils.helpers import wait_until, network_idle, render_settled, element_text_changed, open_page
+from utils.network_tracker import read_network_log
+from utils.timing import step
+from utils.web_vitals import read_web_vitals, assert_within_budget
+from config.config import CALENDAR_NAV_BUDGET_MS
+
+# Título "mes año" del encabezado de CalendarMonth
+MONTH_TITLE = (By.CSS_SELECTOR, "h2.text-xl")
+
+
+def medir_pagina(driver, path):
+    """
+    Abre la página, espera a que termine de cargar y retorna sus Web Vitals
+    """
+    open_page(driver, path)
+    wait_until(driver, network_idle(), render_settled())
+
+    metrics = read_web_vitals(driver)
+    assert metrics is not None, f"No se pudieron leer las métricas de {path}"
+    print(f"Web Vitals {path}: {metrics}")
+    return metrics
+
+
+def eventos_del_mes(requests, month_start):
+    """
+    Filtra los GET /events pedidos para el mes que empieza en month_start
+    """
+    return [
+        request for request in requests
+        if request["method"] == "GET" and "/events?" in request["url"] and f"from={month_start}" in request["url"]
+    ]
+
+
+@pytest.mark.regression
+def test_presupuesto_login(driver):
+    """
+    CP-40: Presupuesto de performance de la página de login
+
+    Verifica:
+    - LCP, CLS, TTI y tiempo de bloqueo de /login dentro del presupuesto
+    """
+    metrics = medir_pagina(driver, "/login")
+    assert_within_budget("/login", metrics)
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("path", ["/calendar", "/new"])
+def test_presupuesto_paginas_autenticadas(authenticated_driver, path):
+    """
+    CP-41: Presupuesto de performance del calendario y del formulario de evento
+
+    Verifica:
+    - LCP, CLS, TTI y long tasks de /calendar (render de CalendarMonth) y /new
+      dentro del presupuesto
+    """
+    metrics = medir_pagina(authenticated_driver, path)
+    assert path in authenticated_driver.current_url
+    assert_within_budget(path, metrics)
+
+
+@pytest.mark.regression
+def test_navegacion_meses_desde_cache(authenticated_driver):
+    """
+    CP-42: Navegación entre meses servida por la caché del calendario
+
+    Verifica:
+    - Al cargar /calendar se prefetchean los meses adyacentes
+    - Avanzar y volver entre meses no pide de nuevo GET /events del mes mostrado
+    - Cada mes se muestra dentro de CALENDAR_NAV_BUDGET_MS
+    - Cada navegación pide como mucho un mes nuevo (el siguiente adyacente)
+    """
+    driver = authenticated_driver
+    open_page(driver, "/calendar")
+    wait_until(driver, network_idle(), render_settled())
+    read_network_log(driver, clear=True)
+
+    hoy = date.today().replace(day=1)
+    pasos = [("Mes siguiente", 1), ("Mes siguiente", 2), ("Mes anterior", 1), ("Mes anterior", 0)]
+
+    for boton, offset in pasos:
+        month_index = hoy.month - 1 + offset
+        month_start = hoy.replace(year=hoy.year + month_index // 12, month=month_index % 12 + 1).isoformat()
+        titulo = driver.find_element(*MONTH_TITLE).text
+
+        start = time.perf_counter()
+        with step(f"mes {month_start}"):
+            driver.find_element(By.CSS_SELECTOR, f"button[aria-label='{boton}']").click()
+            assert wait_until(driver, element_text_changed(MONTH_TITLE, titulo), render_settled(quiet_ms=0)), \
+                f"El calendario no mostró el mes {month_start}"
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        # Se espera a que terminen los prefetch antes de leer el log y seguir navegando
+        wait_until(driver, network_idle())
+        requests = read_network_log(driver, clear=True)
+        eventos = [request for request in requests if request["method"] == "GET" and "/events?" in request["url"]]
+        print(f"Mes {month_start}: {elapsed_ms:.0f}ms, {len(eventos)} GET /events")
+
+        assert not eventos_del_mes(requests, month_start), \
+            f"El mes {month_start} se pidió de nuevo en lugar de servirse desde la caché"
+        assert len(eventos) <= 1, f"Se pidieron {len(eventos)} meses al navegar a {month_start}"
+        assert elapsed_ms <= CALENDAR_NAV_BUDGET_MS, \
+            f"El mes {month_start} tardó {elapsed_ms:.0f}ms (presupuesto {CALENDAR_NAV_BUDGET_MS}ms)"
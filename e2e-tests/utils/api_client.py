@@ -0,0 +1,204 @@
+"""
+Cliente HTTP para la API del backend
+
+Usa una única sesión de requests con pool de conexiones (keep-alive) para
+todas las llamadas de la suite y cachea los tokens JWT por usuario.
+"""
+import re
+import time
+import threading
+from http.cookiejar import DefaultCookiePolicy
+import requests
+from requests.adapters import HTTPAdapter
+from config.config import API_POOL_SIZE, API_BATCH_SIZE, AUTH_TOKEN_TTL, get_api_url
+
+_session = None
+_session_lock = threading.Lock()
+
+# Cache de tokens JWT: email -> (token, timestamp de obtención)
+_token_cache = {}
+
+
+def get_api_session():
+    """
+    Retorna la sesión HTTP compartida con pool de conexiones
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=API_POOL_SIZE, pool_maxsize=API_POOL_SIZE)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session.headers.update({"Content-Type": "application/json"})
+            # La sesión es compartida entre usuarios: no guarda cookies, cada
+            # llamada autenticada envía explícitamente el token de su usuario
+            _session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    return _session
+
+
+def api_login(email, password):
+    """
+    Inicia sesión con POST /auth/login y retorna el token JWT
+
+    El token se cachea por usuario durante AUTH_TOKEN_TTL segundos, así que
+    las llamadas siguientes no vuelven a tocar la API.
+    """
+    cached = _token_cache.get(email)
+    if cached and time.time() - cached[1] < AUTH_TOKEN_TTL:
+        return cached[0]
+
+    response = get_api_session().post(
+        f"{get_api_url()}/auth/login",
+        json={"email": email, "password": password},
+        timeout=15
+    )
+    response.raise_for_status()
+
+    # El backend establece la cookie "token" (setAuthCookie) y también lo retorna en el body
+    token = response.cookies.get("token") or response.json().get("token")
+    if not token:
+        raise RuntimeError(f"La API no retornó un token para {email}")
+
+    _token_cache[email] = (token, time.time())
+    return token
+
+
+def inject_auth_cookie(driver, token):
+    """
+    Inyecta la cookie "token" del dominio de la API en el navegador
+
+    En Chrome/Edge se usa CDP para setear la cookie sin navegar; en el resto de
+    los navegadores hay que abrir una página del dominio de la API primero.
+    """
+    secure = get_api_url().startswith("https://")
+    cookie = {
+        "name": "token",
+        "value": token,
+        "path": "/",
+        "httpOnly": True,
+        "secure": secure,
+        # Igual que setAuthCookie: en producción (HTTPS) la cookie es cross-site
+        "sameSite": "None" if secure else "Lax"
+    }
+
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.setCookie", {**cookie, "url": get_api_url()})
+    else:
+        driver.get(f"{get_api_url()}/health")
+        driver.add_cookie(cookie)
+
+
+def api_request(method, path, token, **kwargs):
+    """
+    Hace un request autenticado a la API con el token de un usuario
+
+    La sesión compartida no guarda cookies, así que el token viaja en el
+    header Cookie de cada request.
+    """
+    headers = {"Cookie": f"token={token}", **kwargs.pop("headers", {})}
+    kwargs.setdefault("timeout", 15)
+    return get_api_session().request(method, f"{get_api_url()}{path}", headers=headers, **kwargs)
+
+
+def _chunks(items, size=API_BATCH_SIZE):
+    """Divide la lista en lotes de a lo sumo size elementos"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def create_events_batch(token, events):
+    """
+    Crea eventos con POST /events/batch, en lotes de API_BATCH_SIZE
+
+    Returns:
+        list: Resultado de cada evento en el orden pedido ({"status": 201,
+        "event": {...}} o {"status": 422, "details": [...]}), o None si la
+        API no tiene el endpoint batch
+    """
+    results = []
+    for chunk in _chunks(list(events)):
+        response = api_request("POST", "/events/batch", token, json={"events": chunk}, timeout=60)
+        if response.status_code in (404, 405):
+            return None
+        if response.status_code not in (201, 207, 422) or "results" not in response.json():
+            response.raise_for_status()
+        results.extend(response.json()["results"])
+    return results
+
+
+def delete_events_batch(token, event_ids):
+    """
+    Elimina eventos con POST /events/batch-delete, en lotes de API_BATCH_SIZE
+
+    Returns:
+        dict: Estado de cada id (204 eliminado, 404 no existía), o None si la
+        API no tiene el endpoint batch
+    """
+    statuses = {}
+    for chunk in _chunks(list(event_ids)):
+        response = api_request("POST", "/events/batch-delete", token, json={"ids": chunk}, timeout=60)
+        if response.status_code in (404, 405):
+            return None
+        response.raise_for_status()
+        statuses.update({result["id"]: result["status"] for result in response.json()["results"]})
+    return statuses
+
+
+# Segmentos de ruta que son ids de MongoDB (se agrupan como ":id" en el reporte)
+OBJECT_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{24}(?=/|$)")
+
+
+class ApiClient:
+    """
+    Cliente del tier de pruebas de API: usa la sesión compartida y registra
+    método, endpoint, estado y latencia de cada llamada
+    """
+
+    def __init__(self, token=None, calls=None):
+        """
+        Args:
+            token (str): JWT con el que se autentican las llamadas (None = sin sesión)
+            calls (list): Lista donde registrar las llamadas (se comparte entre clientes de un test)
+        """
+        self.token = token
+        self.calls = calls if calls is not None else []
+
+    def as_user(self, token):
+        """Retorna un cliente autenticado con otro token que registra en la misma lista"""
+        return ApiClient(token, self.calls)
+
+    def request(self, method, path, **kwargs):
+        """
+        Hace el request y registra su latencia
+
+        Returns:
+            requests.Response: La respuesta (no se lanza excepción por estado HTTP)
+        """
+        headers = kwargs.pop("headers", {})
+        if self.token:
+            headers = {"Cookie": f"token={self.token}", **headers}
+        kwargs.setdefault("timeout", 15)
+
+        start = time.perf_counter()
+        response = get_api_session().request(method, f"{get_api_url()}{path}", headers=headers, **kwargs)
+        self.calls.append({
+            "method": method,
+            "endpoint": OBJECT_ID_SEGMENT.sub("/:id", path),
+            "status": response.status_code,
+            "duration": (time.perf_counter() - start) * 1000
+        })
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
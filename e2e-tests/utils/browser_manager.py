@@ -1,69 +1,114 @@
 """
 Gestión de navegadores para las pruebas E2E
 """
-import os
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from config.config import BROWSER, HEADLESS, IMPLICIT_WAIT
+from utils.network_tracker import install_network_tracker
+from utils.perf_capture import enable_perf_logging
+from utils.web_vitals import install_web_vitals
+from utils.driver_resolver import resolve_driver
+from utils.browser_profiles import (
+    apply_fast_chromium_options,
+    apply_fast_firefox_options,
+    configure_fast_session,
+    prepare_user_data_dir
+)
+from config.config import BROWSER, HEADLESS, IMPLICIT_WAIT, PERF_CAPTURE, BROWSER_PROFILE, get_base_url
 
 
 class BrowserManager:
     """Clase para gestionar la creación y configuración de navegadores"""
 
     @staticmethod
-    def get_driver():
+    def get_driver(user_data_dir=None):
         """
         Crea y retorna una instancia del navegador configurado
+
+        Args:
+            user_data_dir (str): Perfil de Chrome/Edge a usar; con el perfil fast
+                y sin valor se usa una copia de BROWSER_PROFILE_TEMPLATE
         """
+        fast = BROWSER_PROFILE == "fast"
+        if fast and user_data_dir is None and BROWSER.lower() in ("chrome", "edge"):
+            user_data_dir = prepare_user_data_dir(BrowserManager._warm_profile_template)
+
         if BROWSER.lower() == "chrome":
             options = webdriver.ChromeOptions()
-            if HEADLESS:
+            if fast:
+                apply_fast_chromium_options(options)
+            elif HEADLESS:
                 options.add_argument("--headless")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-
-            # Usar chromedriver local si existe, sino usar webdriver-manager
-            local_chromedriver = os.path.join(os.getcwd(), "chromedriver-win64", "chromedriver-win64", "chromedriver.exe")
-            if os.path.exists(local_chromedriver):
-                driver_path = local_chromedriver
-            else:
-                driver_path = ChromeDriverManager().install()
+            if not fast:
+                options.add_argument("--window-size=1920,1080")
+            if user_data_dir:
+                options.add_argument(f"--user-data-dir={user_data_dir}")
+            if PERF_CAPTURE:
+                enable_perf_logging(options)
 
             driver = webdriver.Chrome(
-                service=ChromeService(driver_path),
+                service=ChromeService(resolve_driver("chrome")),
                 options=options
             )
 
         elif BROWSER.lower() == "firefox":
             options = webdriver.FirefoxOptions()
-            if HEADLESS:
+            if fast:
+                apply_fast_firefox_options(options)
+            elif HEADLESS:
                 options.add_argument("--headless")
 
             driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
+                service=FirefoxService(resolve_driver("firefox")),
                 options=options
             )
 
         elif BROWSER.lower() == "edge":
             options = webdriver.EdgeOptions()
-            if HEADLESS:
+            if fast:
+                apply_fast_chromium_options(options)
+            elif HEADLESS:
                 options.add_argument("--headless")
+            if user_data_dir:
+                options.add_argument(f"--user-data-dir={user_data_dir}")
+            if PERF_CAPTURE:
+                enable_perf_logging(options)
 
             driver = webdriver.Edge(
-                service=EdgeService(EdgeChromiumDriverManager().install()),
+                service=EdgeService(resolve_driver("edge")),
                 options=options
             )
         else:
             raise ValueError(f"Navegador no soportado: {BROWSER}")
 
         driver.implicitly_wait(IMPLICIT_WAIT)
-        driver.maximize_window()
+
+        if fast:
+            # Headless ya arranca con el tamaño fijo; maximizar no aplica
+            configure_fast_session(driver)
+        else:
+            driver.maximize_window()
+
+        # Contar requests fetch/XHR para poder esperar a que la red quede inactiva
+        install_network_tracker(driver)
+
+        # Observers de LCP/CLS/long tasks para los presupuestos de performance
+        install_web_vitals(driver)
 
         return driver
+
+    @staticmethod
+    def _warm_profile_template(path):
+        """
+        Crea la plantilla de user-data-dir: abre la app una vez para que queden
+        en cache los recursos estáticos (incluido el CDN de Tailwind)
+        """
+        driver = BrowserManager.get_driver(user_data_dir=path)
+        try:
+            driver.get(f"{get_base_url()}/login")
+        finally:
+            driver.quit()
@@ -0,0 +1,128 @@
+"""
+Pool de navegadores reutilizables para las pruebas E2E
+
+Evita el costo de arrancar un navegador nuevo en cada test: las instancias
+se prestan a los tests y se devuelven al pool con el estado limpio.
+"""
+import queue
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from utils.browser_manager import BrowserManager
+from config.config import BROWSER_POOL_SIZE, BROWSER_POOL_MAX_USES, BROWSER_POOL_ACQUIRE_TIMEOUT
+
+
+class BrowserPool:
+    """Clase que administra un conjunto de navegadores calientes"""
+
+    def __init__(self, size=BROWSER_POOL_SIZE, max_uses=BROWSER_POOL_MAX_USES,
+                 acquire_timeout=BROWSER_POOL_ACQUIRE_TIMEOUT):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Presta un navegador del pool, creando uno nuevo si no hay libres
+
+        Raises:
+            RuntimeError: Si no se libera ningún navegador en acquire_timeout segundos
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                break
+
+            # Todos los navegadores están prestados: esperar a que se libere uno
+            if time.monotonic() >= deadline:
+                raise RuntimeError(
+                    f"No se liberó ningún navegador del pool en {self.acquire_timeout}s "
+                    f"({self._created}/{self.size} prestados)"
+                )
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+        try:
+            driver = BrowserManager.get_driver()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+        self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver):
+        """
+        Devuelve un navegador al pool
+
+        Se descarta (y se reemplazará por uno nuevo) si superó la cantidad
+        máxima de usos o si dejó de responder.
+        """
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if uses >= self.max_uses or not self._reset(driver):
+            self._discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def close(self):
+        """Cierra todos los navegadores libres del pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def _reset(self, driver):
+        """
+        Limpia cookies, localStorage y sessionStorage y navega a about:blank
+
+        Retorna False si el navegador no responde (crash o sesión perdida).
+        """
+        try:
+            # El storage solo se puede limpiar desde el origen de la app
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+
+            # En Chrome/Edge se limpian las cookies de todos los dominios (incluida la API)
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        """Cierra un navegador y libera su lugar en el pool"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+        with self._lock:
+            self._created -= 1
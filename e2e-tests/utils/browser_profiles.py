@@ -0,0 +1,178 @@
+"""
+Perfil "fast" de los navegadores para CI
+
+Headless (modo new en Chrome/Edge), sin imágenes, sin fuentes web, sin
+animaciones ni transiciones, con page_load_strategy "eager" y bloqueo de
+requests de terceros conocidos (analytics, fuentes). Tailwind se carga desde
+su CDN, así que no se bloquea todo lo que no sea del dominio de la app.
+
+Opcionalmente cada navegador arranca con una copia de un user-data-dir
+"plantilla" ya precalentado (cache HTTP con el CDN de Tailwind, primer
+arranque de Chrome ya hecho).
+"""
+import atexit
+import os
+import shutil
+import tempfile
+import time
+from config.config import FAST_PROFILE_BLOCKED_URLS, BROWSER_PROFILE_TEMPLATE
+
+# Argumentos de Chrome/Edge del perfil fast
+FAST_CHROMIUM_ARGS = [
+    "--headless=new",
+    "--window-size=1920,1080",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--force-prefers-reduced-motion",
+]
+
+# Preferencias de Firefox del perfil fast
+FAST_FIREFOX_PREFS = {
+    "permissions.default.image": 2,
+    "browser.display.use_document_fonts": 0,
+    "ui.prefersReducedMotion": 1,
+    "toolkit.cosmeticAnimations.enabled": False,
+    "layout.css.prefers-reduced-motion.enabled": True,
+}
+
+# CSS que anula animaciones y transiciones (se inyecta en cada documento)
+DISABLE_ANIMATIONS_JS = """
+(function () {
+    var css = '*, *::before, *::after {' +
+        ' animation-duration: 0s !important; animation-delay: 0s !important;' +
+        ' transition-duration: 0s !important; transition-delay: 0s !important;' +
+        ' scroll-behavior: auto !important; }';
+    function inject() {
+        if (document.getElementById('__e2e-no-animations')) return;
+        var style = document.createElement('style');
+        style.id = '__e2e-no-animations';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+    if (document.documentElement) inject();
+    document.addEventListener('DOMContentLoaded', inject);
+})();
+"""
+
+# Archivos de bloqueo de Chrome que no se copian de la plantilla
+PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile", "*.lock")
+
+# Segundos que se espera a que otro proceso termine de preparar la plantilla
+TEMPLATE_LOCK_TIMEOUT = 120
+
+# Copias de la plantilla creadas por este proceso (se borran al salir)
+_profile_copies = []
+
+
+def apply_fast_chromium_options(options):
+    """
+    Configura ChromeOptions/EdgeOptions con el perfil fast
+    """
+    for argument in FAST_CHROMIUM_ARGS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+    options.page_load_strategy = "eager"
+
+
+def apply_fast_firefox_options(options):
+    """
+    Configura FirefoxOptions con el perfil fast
+    """
+    options.add_argument("--headless")
+    options.add_argument("--width=1920")
+    options.add_argument("--height=1080")
+    for name, value in FAST_FIREFOX_PREFS.items():
+        options.set_preference(name, value)
+    options.page_load_strategy = "eager"
+
+
+def configure_fast_session(driver):
+    """
+    Bloqueo de URLs y anulación de animaciones en la sesión ya creada
+
+    En Chrome/Edge se usa CDP (aplica a todos los documentos); en Firefox las
+    preferencias de FAST_FIREFOX_PREFS ya cubren imágenes, fuentes y animaciones.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return
+
+    if getattr(driver, "_e2e_fast_profile", False):
+        return
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": FAST_PROFILE_BLOCKED_URLS})
+    driver.execute_cdp_cmd("Emulation.setEmulatedMedia", {
+        "features": [{"name": "prefers-reduced-motion", "value": "reduce"}]
+    })
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DISABLE_ANIMATIONS_JS})
+    driver._e2e_fast_profile = True
+
+
+def prepare_user_data_dir(warm_template, template=BROWSER_PROFILE_TEMPLATE):
+    """
+    Retorna una copia descartable de la plantilla de user-data-dir
+
+    Si la plantilla no existe, la crea con warm_template(path) (abre un
+    navegador con ese user-data-dir, carga la app y lo cierra). Un directorio
+    "<plantilla>.lock" evita que dos workers de xdist la preparen a la vez.
+
+    Returns:
+        str: Ruta de la copia, o None si no hay plantilla configurada
+    """
+    if not template:
+        return None
+
+    if not os.path.exists(template):
+        _create_template(template, warm_template)
+
+    copy_path = tempfile.mkdtemp(prefix="e2e-profile-")
+    shutil.copytree(
+        template,
+        copy_path,
+        dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns(*PROFILE_LOCK_FILES)
+    )
+    _profile_copies.append(copy_path)
+    return copy_path
+
+
+def _create_template(template, warm_template):
+    lock_dir = f"{template}.lock"
+    deadline = time.monotonic() + TEMPLATE_LOCK_TIMEOUT
+
+    while True:
+        try:
+            os.makedirs(lock_dir)
+            break
+        except FileExistsError:
+            # Otro proceso la está preparando: esperar a que termine
+            if os.path.exists(template) and not os.path.exists(lock_dir):
+                return
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Timeout esperando la plantilla de perfil {template}")
+            time.sleep(0.5)
+
+    try:
+        if not os.path.exists(template):
+            tmp_template = f"{template}.tmp"
+            shutil.rmtree(tmp_template, ignore_errors=True)
+            warm_template(tmp_template)
+            os.replace(tmp_template, template)
+    finally:
+        os.rmdir(lock_dir)
+
+
+@atexit.register
+def _remove_profile_copies():
+    for path in _profile_copies:
+        shutil.rmtree(path, ignore_errors=True)
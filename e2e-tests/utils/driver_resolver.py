@@ -0,0 +1,288 @@
+"""
+Resolución de los binarios de WebDriver (chromedriver, geckodriver, msedgedriver)
+
+Se resuelve una vez por sesión y el resultado se comparte entre el proceso
+controlador y los workers de xdist a través de DRIVER_CACHE_FILE. Orden de
+búsqueda:
+
+1. Variable de entorno (CHROMEDRIVER_PATH, GECKODRIVER_PATH, EDGEDRIVER_PATH)
+2. Directorios locales del proyecto (chromedriver-win64/, chromedriver-linux64/, drivers/)
+3. Cache de webdriver-manager (~/.wdm) de descargas anteriores
+4. PATH del sistema
+5. Descarga con webdriver-manager o, si falla, Selenium Manager (no en modo
+   DRIVER_OFFLINE); ambos eligen la versión del navegador instalado
+
+En los pasos 2 a 4 se descartan los chromedriver/msedgedriver cuya versión
+mayor no coincide con la del navegador instalado (por ejemplo, un driver
+viejo en ~/.wdm después de una actualización de Chrome).
+
+La búsqueda y la descarga se hacen con un lock de archivo, así dos workers
+no descargan el mismo binario a la vez.
+"""
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from config.config import DRIVER_CACHE_FILE, DRIVER_OFFLINE, DRIVER_PATHS
+
+E2E_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXE_SUFFIX = ".exe" if os.name == "nt" else ""
+
+# Nombre del binario de cada navegador
+DRIVER_NAMES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+    "edge": "msedgedriver",
+}
+
+# Directorios del proyecto donde se buscan binarios descargados a mano
+LOCAL_DRIVER_DIRS = [
+    os.path.join("chromedriver-win64", "chromedriver-win64"),
+    "chromedriver-win64",
+    "chromedriver-linux64",
+    "chromedriver-mac-x64",
+    "chromedriver-mac-arm64",
+    "drivers",
+]
+
+# Binarios de cada navegador para leer su versión con --version (Linux y macOS)
+BROWSER_BINARIES = {
+    "chrome": [
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ],
+    "edge": [
+        "microsoft-edge", "microsoft-edge-stable",
+        "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+    ],
+}
+
+# En Windows el navegador no imprime su versión: se lee del registro
+BROWSER_REGISTRY_KEYS = {
+    "chrome": r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+    "edge": r"HKEY_CURRENT_USER\Software\Microsoft\Edge\BLBeacon",
+}
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+(?:\.\d+)*")
+
+# Cache de webdriver-manager
+WDM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".wdm", "drivers")
+
+# Segundos que se espera el lock antes de considerarlo abandonado
+LOCK_TIMEOUT = 120
+
+# Rutas ya resueltas por este proceso: navegador -> binario
+_resolved = {}
+
+
+class DriverNotFoundError(RuntimeError):
+    """No se encontró el binario del driver (y no se pudo descargar)"""
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+@contextmanager
+def _file_lock(path):
+    """
+    Lock entre procesos con un archivo creado en forma exclusiva
+    """
+    deadline = time.monotonic() + LOCK_TIMEOUT
+
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                # Lock de un proceso que terminó sin liberarlo
+                print(f"Warning: Removing stale driver lock {path}")
+                os.remove(path)
+                deadline = time.monotonic() + LOCK_TIMEOUT
+            time.sleep(0.2)
+
+    try:
+        yield
+    finally:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _read_cache(cache_file):
+    if not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read driver cache - {str(e)}")
+        return {}
+
+
+def _write_cache(cache_file, cache):
+    tmp_path = f"{cache_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1)
+    os.replace(tmp_path, cache_file)
+
+
+def _major_version(command):
+    """
+    Ejecuta el comando y retorna la versión mayor que imprime, o None
+    """
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return int(match.group(1)) if match else None
+
+
+def browser_major_version(browser):
+    """
+    Versión mayor del navegador instalado, o None si no se puede determinar
+    (Firefox no se verifica: geckodriver soporta varias versiones)
+    """
+    if os.name == "nt":
+        key = BROWSER_REGISTRY_KEYS.get(browser)
+        return _major_version(["reg", "query", key, "/v", "version"]) if key else None
+
+    for binary in BROWSER_BINARIES.get(browser, []):
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if path and os.path.exists(path):
+            version = _major_version([path, "--version"])
+            if version:
+                return version
+    return None
+
+
+def driver_matches_browser(browser, path, browser_version):
+    """
+    True si la versión mayor del driver coincide con la del navegador (o si
+    alguna de las dos no se puede determinar)
+    """
+    if browser_version is None:
+        return True
+    driver_version = _major_version([path, "--version"])
+    return driver_version is None or driver_version == browser_version
+
+
+def _local_candidates(browser):
+    """Binarios locales de los pasos 2 a 4, en orden de preferencia"""
+    name = DRIVER_NAMES[browser] + EXE_SUFFIX
+
+    for directory in LOCAL_DRIVER_DIRS:
+        yield os.path.join(E2E_DIR, directory, name)
+
+    # Descargas anteriores de webdriver-manager: de la más reciente a la más vieja
+    cached = glob.glob(os.path.join(WDM_CACHE_DIR, "**", name), recursive=True)
+    yield from sorted(cached, key=os.path.getmtime, reverse=True)
+
+    yield shutil.which(DRIVER_NAMES[browser])
+
+
+def find_local_driver(browser, browser_version=None):
+    """
+    Busca el binario sin usar la red (pasos 1 a 4)
+
+    Args:
+        browser_version (int): Versión mayor del navegador; se descartan los
+            drivers de otra versión (la ruta de la variable de entorno se usa igual)
+
+    Returns:
+        str: Ruta del binario o None si no se encontró
+    """
+    env_path = DRIVER_PATHS.get(browser)
+    if env_path:
+        if _is_executable(env_path):
+            if not driver_matches_browser(browser, env_path, browser_version):
+                print(f"Warning: {env_path} does not match {browser} {browser_version}")
+            return env_path
+        print(f"Warning: Driver path {env_path} does not exist or is not executable")
+
+    for candidate in _local_candidates(browser):
+        if not _is_executable(candidate):
+            continue
+        if driver_matches_browser(browser, candidate, browser_version):
+            return candidate
+        print(f"Warning: Skipping {candidate}: it does not match {browser} {browser_version}")
+
+    return None
+
+
+def download_driver(browser):
+    """
+    Descarga el binario con webdriver-manager (paso 5), que elige la versión
+    del navegador instalado
+
+    Returns:
+        str: Ruta del binario, o None para que Selenium Manager lo resuelva al
+        crear el driver (si webdriver-manager no está instalado o falla)
+    """
+    try:
+        if browser == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        if browser == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+    except Exception as e:
+        print(f"Warning: webdriver-manager could not download {DRIVER_NAMES[browser]}, using Selenium Manager - {str(e)}")
+        return None
+
+
+def resolve_driver(browser, offline=DRIVER_OFFLINE, cache_file=DRIVER_CACHE_FILE):
+    """
+    Retorna la ruta del binario del driver del navegador, o None si lo tiene
+    que resolver Selenium Manager
+
+    Raises:
+        DriverNotFoundError: Si no hay binario local y no se puede descargar
+    """
+    browser = browser.lower()
+    if browser in _resolved:
+        return _resolved[browser]
+
+    with _file_lock(f"{cache_file}.lock"):
+        cache = _read_cache(cache_file)
+        if browser in cache and (cache[browser] is None or _is_executable(cache[browser])):
+            # Ya verificado contra el navegador por otro proceso de esta sesión
+            _resolved[browser] = cache[browser]
+            return cache[browser]
+
+        path = find_local_driver(browser, browser_major_version(browser))
+
+        if not path:
+            if offline:
+                raise DriverNotFoundError(
+                    f"No se encontró {DRIVER_NAMES[browser]} y DRIVER_OFFLINE=true impide descargarlo. "
+                    f"Indicá la ruta con la variable de entorno o agregalo al PATH"
+                )
+            path = download_driver(browser)
+
+        cache[browser] = path
+        _write_cache(cache_file, cache)
+
+    _resolved[browser] = path
+    return path
+
+
+def clear_driver_cache(cache_file=DRIVER_CACHE_FILE):
+    """
+    Descarta las rutas resueltas en sesiones anteriores (el controlador la
+    llama al comenzar, antes de que arranquen los workers)
+    """
+    _resolved.clear()
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
@@ -2,61 +2,237 @@
 Generador de reportes en Excel para los resultados de las pruebas E2E
 """
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from datetime import datetime
+import json
 import os
+import sys
+from utils.timing import percentile
+
+RESULTS_SHEET = "Resultados de Pruebas"
+RESULT_HEADERS = [
+    "ID Caso",
+    "Historia de Usuario",
+    "Nombre del Test",
+    "Descripción",
+    "Estado",
+    "Fecha Ejecución",
+    "Duración (seg)",
+    "Error/Observaciones"
+]
+RESULT_COLUMN_WIDTHS = [12, 30, 40, 50, 15, 20, 15, 50]
+
+NETWORK_HEADERS = ["Nombre del Test", "Método", "URL", "Estado HTTP", "Duración (ms)"]
+NETWORK_COLUMN_WIDTHS = [40, 10, 80, 12, 15]
+
+TIMINGS_HEADERS = ["Nombre del Test", "Fase", "Duración (seg)"]
+TIMINGS_COLUMN_WIDTHS = [40, 20, 15, 15, 15]
+TIMINGS_SUMMARY_HEADERS = ["Fase", "Tests", "p50 (seg)", "p95 (seg)", "Total (seg)"]
+
+LOAD_HEADERS = [
+    "Escenario", "Requests", "Throughput (req/s)", "p50 (ms)", "p95 (ms)",
+    "p99 (ms)", "Máx (ms)", "Errores", "Tasa de Error (%)"
+]
+LOAD_COLUMN_WIDTHS = [30, 12, 18, 12, 12, 12, 12, 12, 18]
+
+HISTOGRAM_HEADERS = ["Escenario", "Latencia hasta (ms)", "Requests"]
+HISTOGRAM_COLUMN_WIDTHS = [30, 20, 12]
+
+API_HEADERS = ["Nombre del Test", "Método", "Endpoint", "Estado HTTP", "Duración (ms)"]
+API_COLUMN_WIDTHS = [40, 20, 40, 12, 15]
+API_SUMMARY_HEADERS = ["Endpoint", "Llamadas", "p50 (ms)", "p95 (ms)", "Máx (ms)"]
+
+# Hojas adicionales del reporte: tipo de registro -> (título, encabezados, anchos)
+EXTRA_SHEETS = {
+    "network": ("Red", NETWORK_HEADERS, NETWORK_COLUMN_WIDTHS),
+    "timing": ("Timings", TIMINGS_HEADERS, TIMINGS_COLUMN_WIDTHS),
+    "load": ("Carga", LOAD_HEADERS, LOAD_COLUMN_WIDTHS),
+    "histogram": ("Histograma de Latencias", HISTOGRAM_HEADERS, HISTOGRAM_COLUMN_WIDTHS),
+    "api": ("Latencia API", API_HEADERS, API_COLUMN_WIDTHS),
+}
+
+# Colores de la columna Estado
+STATUS_COLORS = {
+    "PASSED": "C6EFCE",  # Verde claro
+    "FAILED": "FFC7CE",  # Rojo claro
+    "SKIPPED": "FFEB9C",  # Amarillo claro
+    "ERROR": "FF9999"    # Rojo más oscuro
+}
+
+# Columnas centradas de la hoja de resultados (el resto se ajusta con wrap)
+CENTERED_COLUMNS = [1, 5, 6, 7]
+
+
+def build_named_styles():
+    """
+    Crea los estilos con nombre que comparten todas las celdas del reporte
+
+    Cada celda referencia un estilo por nombre en lugar de tener sus propios
+    objetos Border/Alignment/PatternFill, lo que mantiene chico el workbook.
+    """
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    header = NamedStyle(name="e2e_header")
+    header.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    header.font = Font(color="FFFFFF", bold=True, size=12)
+    header.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    header.border = border
+
+    center = NamedStyle(name="e2e_center")
+    center.alignment = Alignment(horizontal="center", vertical="center")
+    center.border = border
+
+    text = NamedStyle(name="e2e_text")
+    text.alignment = Alignment(vertical="center", wrap_text=True)
+    text.border = border
+
+    summary_title = NamedStyle(name="e2e_summary_title")
+    summary_title.font = Font(bold=True, size=14)
+
+    bold = NamedStyle(name="e2e_bold")
+    bold.font = Font(bold=True)
+
+    styles = [header, center, text, summary_title, bold]
+
+    for status, color in STATUS_COLORS.items():
+        status_style = NamedStyle(name=f"e2e_status_{status}")
+        status_style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+        status_style.font = Font(bold=True)
+        status_style.alignment = Alignment(horizontal="center", vertical="center")
+        status_style.border = border
+
+        fill_style = NamedStyle(name=f"e2e_fill_{status}")
+        fill_style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+        styles.extend([status_style, fill_style])
+
+    return styles
+
+
+def result_cell_style(column, status):
+    """Retorna el nombre del estilo de una celda de la hoja de resultados"""
+    if column == 5 and status in STATUS_COLORS:
+        return f"e2e_status_{status}"
+    return "e2e_center" if column in CENTERED_COLUMNS else "e2e_text"
+
+
+def summary_rows(status_counts):
+    """
+    Retorna las filas del resumen como listas de (valor, estilo)
+    """
+    total = sum(status_counts.values())
+    rows = [
+        [],
+        [("RESUMEN", "e2e_summary_title")],
+        [],
+        [("Total de Pruebas:", None), (total, None)],
+        [("Exitosas (PASSED):", None), (status_counts["PASSED"], "e2e_fill_PASSED")],
+        [("Fallidas (FAILED):", None), (status_counts["FAILED"], "e2e_fill_FAILED")],
+        [("Omitidas (SKIPPED):", None), (status_counts["SKIPPED"], "e2e_fill_SKIPPED")],
+    ]
+
+    if total > 0:
+        porcentaje_exito = (status_counts["PASSED"] / total) * 100
+        rows.append([])
+        rows.append([("Porcentaje de Éxito:", None), (f"{porcentaje_exito:.2f}%", "e2e_bold")])
+
+    return rows
+
+
+def timings_summary_rows(phase_durations):
+    """
+    Retorna las filas con los percentiles p50/p95 de cada fase
+    """
+    return [
+        [
+            phase,
+            len(durations),
+            round(percentile(durations, 50), 3),
+            round(percentile(durations, 95), 3),
+            round(sum(durations), 3)
+        ]
+        for phase, durations in phase_durations.items()
+    ]
+
+
+def api_summary_rows(endpoint_latencies):
+    """
+    Retorna las filas con los percentiles p50/p95 de cada endpoint del tier de API
+    """
+    return [
+        [
+            endpoint,
+            len(latencies),
+            round(percentile(latencies, 50), 1),
+            round(percentile(latencies, 95), 1),
+            round(max(latencies), 1)
+        ]
+        for endpoint, latencies in sorted(endpoint_latencies.items())
+    ]
 
 
 class ExcelReporter:
     """Clase para generar reportes en Excel de los resultados de las pruebas"""
 
-    def __init__(self, filename="reporte_pruebas.xlsx"):
+    def __init__(self, filename="reporte_pruebas.xlsx", streaming=False, directory="reports", flush_every=10):
+        """
+        Args:
+            filename (str): Nombre base del reporte
+            streaming (bool): Si es True, cada fila se agrega a un journal en disco
+                en lugar de mantener el workbook en memoria (memoria constante)
+            directory (str): Directorio del journal en modo streaming
+            flush_every (int): Cada cuántas filas se vuelca el journal a disco
+        """
         self.filename = filename
+        self.streaming = streaming
+        self.flush_every = max(1, flush_every)
+        self.pending_rows = 0
+        self.journal = None
+        self.journal_path = None
+        self.status_counts = {status: 0 for status in STATUS_COLORS}
+        self.phase_durations = {}
+        # Latencias del tier de API: "MÉTODO /endpoint" -> lista de ms
+        self.endpoint_latencies = {}
+
+        if streaming:
+            self.workbook = None
+            self._open_journal(directory)
+            return
+
         self.workbook = Workbook()
+        for style in build_named_styles():
+            self.workbook.add_named_style(style)
         self.sheet = self.workbook.active
-        self.sheet.title = "Resultados de Pruebas"
+        self.sheet.title = RESULTS_SHEET
         self.current_row = 1
+        # Hojas adicionales creadas a medida que llegan filas: tipo -> [hoja, próxima fila]
+        self.extra_sheets = {}
         self._setup_headers()
 
     def _setup_headers(self):
         """Configura los encabezados de las columnas"""
-        headers = [
-            "ID Caso",
-            "Historia de Usuario",
-            "Nombre del Test",
-            "Descripción",
-            "Estado",
-            "Fecha Ejecución",
-            "Duración (seg)",
-            "Error/Observaciones"
-        ]
-
-        # Estilo para encabezados
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True, size=12)
-        alignment_center = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        self._write_sheet_headers(self.sheet, RESULT_HEADERS, RESULT_COLUMN_WIDTHS)
+        self.current_row = 2
 
-        for col, header in enumerate(headers, start=1):
-            cell = self.sheet.cell(row=1, column=col)
-            cell.value = header
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = alignment_center
-            cell.border = border
+    def _open_journal(self, directory):
+        """Abre el journal JSONL donde se van agregando las filas del reporte"""
+        if not os.path.exists(directory):
+            os.makedirs(directory)
 
-        # Ajustar anchos de columna
-        column_widths = [12, 30, 40, 50, 15, 20, 15, 50]
-        for col, width in enumerate(column_widths, start=1):
-            self.sheet.column_dimensions[chr(64 + col)].width = width
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.journal_path = os.path.join(directory, f"reporte_pruebas_{timestamp}.jsonl")
+        self.journal = open(self.journal_path, "a", encoding="utf-8")
 
-        self.current_row = 2
+    def _append_record(self, kind, values):
+        """Agrega una fila al journal y lo vuelca a disco cada flush_every filas"""
+        self.journal.write(json.dumps({"kind": kind, "values": values}, ensure_ascii=False) + "\n")
+        self.pending_rows += 1
+        if self.pending_rows >= self.flush_every:
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+            self.pending_rows = 0
 
     def add_test_result(self, test_id, historia, test_name, description, status, duration=0, error_msg=""):
         """
@@ -71,116 +247,164 @@ class ExcelReporter:
             duration (float): Duración en segundos
             error_msg (str): Mensaje de error si aplica
         """
-        row = self.current_row
+        values = [
+            test_id,
+            historia,
+            test_name,
+            description,
+            status,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            round(duration, 2),
+            error_msg
+        ]
+
+        if status in self.status_counts:
+            self.status_counts[status] += 1
 
-        # Valores
-        self.sheet.cell(row=row, column=1).value = test_id
-        self.sheet.cell(row=row, column=2).value = historia
-        self.sheet.cell(row=row, column=3).value = test_name
-        self.sheet.cell(row=row, column=4).value = description
-        self.sheet.cell(row=row, column=5).value = status
-        self.sheet.cell(row=row, column=6).value = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.sheet.cell(row=row, column=7).value = round(duration, 2)
-        self.sheet.cell(row=row, column=8).value = error_msg
-
-        # Estilo según estado
-        status_colors = {
-            "PASSED": "C6EFCE",  # Verde claro
-            "FAILED": "FFC7CE",  # Rojo claro
-            "SKIPPED": "FFEB9C",  # Amarillo claro
-            "ERROR": "FF9999"    # Rojo más oscuro
-        }
-
-        status_cell = self.sheet.cell(row=row, column=5)
-        if status in status_colors:
-            status_cell.fill = PatternFill(
-                start_color=status_colors[status],
-                end_color=status_colors[status],
-                fill_type="solid"
-            )
-            status_cell.font = Font(bold=True)
-            status_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Bordes
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        for col in range(1, 9):
+        if self.streaming:
+            self._append_record("result", values)
+            return
+
+        row = self.current_row
+        for col, value in enumerate(values, start=1):
             cell = self.sheet.cell(row=row, column=col)
-            cell.border = border
-            if col in [1, 5, 6, 7]:  # Centrar algunas columnas
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            else:
-                cell.alignment = Alignment(vertical="center", wrap_text=True)
+            cell.value = value
+            cell.style = result_cell_style(col, status)
 
         self.current_row += 1
 
-    def add_summary(self):
-        """Agrega un resumen al final del reporte"""
-        # Dejar una fila en blanco
-        self.current_row += 1
+    def add_network_requests(self, test_name, requests):
+        """
+        Agrega los requests fetch/XHR registrados durante un test a la hoja "Red"
 
-        # Título de resumen
-        summary_row = self.current_row
-        self.sheet.cell(row=summary_row, column=1).value = "RESUMEN"
-        self.sheet.cell(row=summary_row, column=1).font = Font(bold=True, size=14)
-
-        # Contar estados
-        passed = 0
-        failed = 0
-        skipped = 0
-        error = 0
-
-        for row in range(2, summary_row - 1):
-            status = self.sheet.cell(row=row, column=5).value
-            if status == "PASSED":
-                passed += 1
-            elif status == "FAILED":
-                failed += 1
-            elif status == "SKIPPED":
-                skipped += 1
-            elif status == "ERROR":
-                error += 1
-
-        total = passed + failed + skipped + error
-
-        # Agregar estadísticas
-        self.current_row += 1
-        self.sheet.cell(row=self.current_row, column=1).value = "Total de Pruebas:"
-        self.sheet.cell(row=self.current_row, column=2).value = total
-        self.current_row += 1
+        Args:
+            test_name (str): Nombre del test
+            requests (list): Requests leídos con network_tracker.read_network_log
+        """
+        for request in requests or []:
+            values = [
+                test_name,
+                request.get("method"),
+                request.get("url"),
+                request.get("status"),
+                round(request.get("duration") or 0, 1)
+            ]
+            self._add_row("network", values)
 
-        self.sheet.cell(row=self.current_row, column=1).value = "Exitosas (PASSED):"
-        self.sheet.cell(row=self.current_row, column=2).value = passed
-        self.sheet.cell(row=self.current_row, column=2).fill = PatternFill(
-            start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-        )
-        self.current_row += 1
+    def add_step_timings(self, test_name, step_timings):
+        """
+        Agrega el desglose por fase de un test a la hoja "Timings"
 
-        self.sheet.cell(row=self.current_row, column=1).value = "Fallidas (FAILED):"
-        self.sheet.cell(row=self.current_row, column=2).value = failed
-        self.sheet.cell(row=self.current_row, column=2).fill = PatternFill(
-            start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-        )
-        self.current_row += 1
+        Args:
+            test_name (str): Nombre del test
+            step_timings (dict): Segundos por fase ({"login": 0.4, "espera": 1.2, ...})
+        """
+        for phase, seconds in (step_timings or {}).items():
+            self._add_row("timing", [test_name, phase, round(seconds, 3)])
+            self.phase_durations.setdefault(phase, []).append(seconds)
 
-        self.sheet.cell(row=self.current_row, column=1).value = "Omitidas (SKIPPED):"
-        self.sheet.cell(row=self.current_row, column=2).value = skipped
-        self.sheet.cell(row=self.current_row, column=2).fill = PatternFill(
-            start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"
-        )
-        self.current_row += 1
+    def add_api_calls(self, test_name, calls):
+        """
+        Agrega las llamadas HTTP de un test del tier de API a la hoja "Latencia API"
+
+        Args:
+            test_name (str): Nombre del test
+            calls (list): Llamadas registradas por api_client.ApiClient
+        """
+        for call in calls or []:
+            duration = round(call.get("duration") or 0, 1)
+            self._add_row("api", [test_name, call.get("method"), call.get("endpoint"), call.get("status"), duration])
+            self.endpoint_latencies.setdefault(f"{call.get('method')} {call.get('endpoint')}", []).append(duration)
+
+    def add_load_results(self, scenario_stats, histograms=None):
+        """
+        Agrega los resultados de una prueba de carga a las hojas "Carga" e
+        "Histograma de Latencias"
+
+        Args:
+            scenario_stats (list): Filas con los valores de LOAD_HEADERS por escenario
+            histograms (dict): Escenario -> lista de (límite del bucket en ms, requests)
+        """
+        for values in scenario_stats:
+            self._add_row("load", values)
+
+        for scenario, buckets in (histograms or {}).items():
+            for upper_bound, count in buckets:
+                self._add_row("histogram", [scenario, upper_bound, count])
+
+    def _add_row(self, kind, values):
+        """
+        Agrega una fila a la hoja adicional del tipo indicado (ver EXTRA_SHEETS),
+        creándola con sus encabezados la primera vez
+        """
+        if self.streaming:
+            self._append_record(kind, values)
+            return
+
+        if kind not in self.extra_sheets:
+            title, headers, column_widths = EXTRA_SHEETS[kind]
+            sheet = self.workbook.create_sheet(title)
+            self._write_sheet_headers(sheet, headers, column_widths)
+            self.extra_sheets[kind] = [sheet, 2]
+
+        sheet, row = self.extra_sheets[kind]
+        for col, value in enumerate(values, start=1):
+            sheet.cell(row=row, column=col).value = value
+        self.extra_sheets[kind][1] = row + 1
+
+    def add_timings_summary(self):
+        """
+        Agrega debajo del desglose de la hoja "Timings" los percentiles p50/p95
+        de cada fase sobre todos los tests de la ejecución
+        """
+        self._add_sheet_summary("timing", TIMINGS_SUMMARY_HEADERS, timings_summary_rows(self.phase_durations))
+
+    def add_api_summary(self):
+        """
+        Agrega debajo de las llamadas de la hoja "Latencia API" los percentiles
+        p50/p95 de cada endpoint
+        """
+        self._add_sheet_summary("api", API_SUMMARY_HEADERS, api_summary_rows(self.endpoint_latencies))
 
-        if total > 0:
-            porcentaje_exito = (passed / total) * 100
+    def _add_sheet_summary(self, kind, headers, rows):
+        """Agrega una tabla de resumen al final de una hoja adicional (si existe)"""
+        if kind not in self.extra_sheets:
+            return
+
+        sheet, row = self.extra_sheets[kind]
+        row += 1
+        for col, header in enumerate(headers, start=1):
+            cell = sheet.cell(row=row, column=col)
+            cell.value = header
+            cell.style = "e2e_header"
+        row += 1
+
+        for values in rows:
+            for col, value in enumerate(values, start=1):
+                sheet.cell(row=row, column=col).value = value
+            row += 1
+
+        self.extra_sheets[kind][1] = row
+
+    def add_summary(self):
+        """Agrega un resumen al final del reporte"""
+        for row_values in summary_rows(self.status_counts):
+            for col, (value, style) in enumerate(row_values, start=1):
+                cell = self.sheet.cell(row=self.current_row, column=col)
+                cell.value = value
+                if style:
+                    cell.style = style
             self.current_row += 1
-            self.sheet.cell(row=self.current_row, column=1).value = "Porcentaje de Éxito:"
-            self.sheet.cell(row=self.current_row, column=2).value = f"{porcentaje_exito:.2f}%"
-            self.sheet.cell(row=self.current_row, column=2).font = Font(bold=True)
+
+    def _write_sheet_headers(self, sheet, headers, column_widths):
+        """Escribe la fila de encabezados y los anchos de columna de una hoja"""
+        for col, header in enumerate(headers, start=1):
+            cell = sheet.cell(row=1, column=col)
+            cell.value = header
+            cell.style = "e2e_header"
+
+        for col, width in enumerate(column_widths, start=1):
+            sheet.column_dimensions[chr(64 + col)].width = width
 
     def save(self, directory="reports"):
         """
@@ -197,7 +421,113 @@ class ExcelReporter:
         filename_with_timestamp = f"reporte_pruebas_{timestamp}.xlsx"
         filepath = os.path.join(directory, filename_with_timestamp)
 
-        self.add_summary()
-        self.workbook.save(filepath)
+        if self.streaming:
+            self.journal.close()
+            build_report_from_journal(self.journal_path, filepath)
+        else:
+            self.add_summary()
+            self.add_timings_summary()
+            self.add_api_summary()
+            self.workbook.save(filepath)
+
         print(f"\n[OK] Reporte Excel generado: {filepath}")
         return filepath
+
+
+def build_report_from_journal(journal_path, filepath):
+    """
+    Genera el Excel a partir de un journal JSONL del modo streaming
+
+    Lee el journal línea por línea y escribe con un workbook write-only, así
+    que la memoria no crece con la cantidad de tests. También sirve para
+    recuperar el reporte parcial de una ejecución que se interrumpió.
+    """
+    workbook = Workbook(write_only=True)
+    for style in build_named_styles():
+        workbook.add_named_style(style)
+
+    results_sheet = _create_write_only_sheet(workbook, RESULTS_SHEET, RESULT_HEADERS, RESULT_COLUMN_WIDTHS)
+    extra_sheets = {}
+    status_counts = {status: 0 for status in STATUS_COLORS}
+    phase_durations = {}
+    endpoint_latencies = {}
+
+    with open(journal_path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Última línea incompleta de una ejecución interrumpida
+                continue
+
+            values = record["values"]
+
+            if record["kind"] == "result":
+                status = values[4]
+                if status in status_counts:
+                    status_counts[status] += 1
+                row = []
+                for col, value in enumerate(values, start=1):
+                    cell = WriteOnlyCell(results_sheet, value=value)
+                    cell.style = result_cell_style(col, status)
+                    row.append(cell)
+                results_sheet.append(row)
+
+            elif record["kind"] in EXTRA_SHEETS:
+                if record["kind"] not in extra_sheets:
+                    extra_sheets[record["kind"]] = _create_write_only_sheet(workbook, *EXTRA_SHEETS[record["kind"]])
+                extra_sheets[record["kind"]].append(values)
+                if record["kind"] == "timing":
+                    phase_durations.setdefault(values[1], []).append(values[2])
+                elif record["kind"] == "api":
+                    endpoint_latencies.setdefault(f"{values[1]} {values[2]}", []).append(values[4])
+
+    for row_values in summary_rows(status_counts):
+        row = []
+        for value, style in row_values:
+            cell = WriteOnlyCell(results_sheet, value=value)
+            if style:
+                cell.style = style
+            row.append(cell)
+        results_sheet.append(row)
+
+    for kind, headers, rows in (
+        ("timing", TIMINGS_SUMMARY_HEADERS, timings_summary_rows(phase_durations)),
+        ("api", API_SUMMARY_HEADERS, api_summary_rows(endpoint_latencies)),
+    ):
+        sheet = extra_sheets.get(kind)
+        if sheet is not None:
+            sheet.append([])
+            sheet.append(_header_cells(sheet, headers))
+            for values in rows:
+                sheet.append(values)
+
+    workbook.save(filepath)
+    return filepath
+
+
+def _create_write_only_sheet(workbook, title, headers, column_widths):
+    """Crea una hoja write-only con sus anchos de columna y encabezados"""
+    sheet = workbook.create_sheet(title)
+    for col, width in enumerate(column_widths, start=1):
+        sheet.column_dimensions[chr(64 + col)].width = width
+    sheet.append(_header_cells(sheet, headers))
+    return sheet
+
+
+def _header_cells(sheet, headers):
+    """Retorna las celdas de encabezado estilizadas para una hoja write-only"""
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(sheet, value=header)
+        cell.style = "e2e_header"
+        cells.append(cell)
+    return cells
+
+
+if __name__ == "__main__":
+    # Uso: python -m utils.excel_reporter reports/reporte_pruebas_XXXX.jsonl
+    journal_file = sys.argv[1]
+    output_file = os.path.splitext(journal_file)[0] + ".xlsx"
+    build_report_from_journal(journal_file, output_file)
+    print(f"[OK] Reporte Excel generado: {output_file}")
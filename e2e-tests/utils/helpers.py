@@ -1,12 +1,45 @@
 """
 Funciones auxiliares para las pruebas E2E
 """
-import os
+import time
+import uuid
+import logging
 from datetime import datetime
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from config.config import EXPLICIT_WAIT, SCREENSHOT_DIR
+from selenium.common.exceptions import (
+    TimeoutException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException
+)
+from utils.network_tracker import install_network_tracker, get_network_state
+from utils.screenshots import screenshot_writer
+from utils.timing import step
+from config.config import EXPLICIT_WAIT, IMPLICIT_WAIT, WAIT_POLL_FREQUENCY, get_base_url
+
+logger = logging.getLogger(__name__)
+
+# Registro de todas las esperas de la sesión: descripción, duración y si se cumplió
+wait_timings = []
+
+# Script que instala (una vez por página) un MutationObserver y retorna
+# cuántos ms pasaron desde la última mutación del DOM y si hay spinners de carga
+RENDER_STATE_JS = """
+    if (!window.__e2eRenderObserver) {
+        window.__e2eLastMutation = performance.now();
+        window.__e2eRenderObserver = new MutationObserver(function () {
+            window.__e2eLastMutation = performance.now();
+        });
+        window.__e2eRenderObserver.observe(document, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    return [
+        performance.now() - window.__e2eLastMutation,
+        document.querySelector('.animate-spin') !== null
+    ];
+"""
 
 
 def wait_for_element(driver, locator, timeout=EXPLICIT_WAIT):
@@ -14,7 +47,7 @@ def wait_for_element(driver, locator, timeout=EXPLICIT_WAIT):
     Espera hasta que un elemento esté presente en el DOM
     """
     try:
-        element = WebDriverWait(driver, timeout).until(
+        element = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
             EC.presence_of_element_located(locator)
         )
         return element
@@ -27,7 +60,7 @@ def wait_for_element_clickable(driver, locator, timeout=EXPLICIT_WAIT):
     Espera hasta que un elemento sea clickeable
     """
     try:
-        element = WebDriverWait(driver, timeout).until(
+        element = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
             EC.element_to_be_clickable(locator)
         )
         return element
@@ -40,7 +73,7 @@ def wait_for_url_contains(driver, text, timeout=EXPLICIT_WAIT):
     Espera hasta que la URL contenga un texto específico
     """
     try:
-        WebDriverWait(driver, timeout).until(
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
             EC.url_contains(text)
         )
         return True
@@ -48,17 +81,176 @@ def wait_for_url_contains(driver, text, timeout=EXPLICIT_WAIT):
         return False
 
 
+def wait_until(driver, *conditions, timeout=EXPLICIT_WAIT, description=None):
+    """
+    Espera hasta que se cumplan todas las condiciones y retorna apenas ocurre
+
+    Las condiciones son callables que reciben el driver (como las de
+    expected_conditions) y se pueden combinar con all_of() y any_of().
+    Cada espera se registra en wait_timings con su duración real.
+
+    Retorna el resultado de la condición, o False si se agotó el timeout.
+    """
+    condition = conditions[0] if len(conditions) == 1 else all_of(*conditions)
+    description = description or _describe(condition)
+
+    start = time.perf_counter()
+    with step("espera"):
+        # Sin espera implícita durante el sondeo: un elemento que todavía no existe
+        # cuenta como "aún no" en lugar de bloquear IMPLICIT_WAIT segundos (clave en any_of)
+        driver.implicitly_wait(0)
+        try:
+            # Los scripts pueden fallar mientras la página navega: se reintenta en el próximo sondeo
+            result = WebDriverWait(
+                driver,
+                timeout,
+                poll_frequency=WAIT_POLL_FREQUENCY,
+                ignored_exceptions=(JavascriptException, NoSuchElementException, StaleElementReferenceException)
+            ).until(condition)
+        except TimeoutException:
+            result = False
+        finally:
+            driver.implicitly_wait(IMPLICIT_WAIT)
+    elapsed = time.perf_counter() - start
+
+    wait_timings.append({
+        "description": description,
+        "seconds": elapsed,
+        "satisfied": bool(result)
+    })
+    if result:
+        logger.info(f"Espera '{description}' completada en {elapsed:.2f}s")
+    else:
+        logger.warning(f"Espera '{description}' agotó el timeout de {timeout}s")
+
+    return result
+
+
+def open_page(driver, path=""):
+    """
+    Navega a una ruta de la aplicación y registra el tiempo como fase "navegación"
+    """
+    with step("navegación"):
+        driver.get(f"{get_base_url()}{path}")
+
+
+def wait_for_network_idle(driver, quiet_ms=500, timeout=EXPLICIT_WAIT):
+    """
+    Espera hasta que no haya requests en curso durante quiet_ms milisegundos
+    """
+    return wait_until(driver, network_idle(quiet_ms), timeout=timeout)
+
+
+def url_changed(previous_url):
+    """
+    Condición: la URL actual es distinta de previous_url
+    """
+    def condition(driver):
+        return driver.current_url != previous_url
+    return _named(condition, f"URL distinta de {previous_url}")
+
+
+def url_contains(text):
+    """
+    Condición: la URL actual contiene el texto
+    """
+    return _named(EC.url_contains(text), f"URL contiene '{text}'")
+
+
+def url_not_contains(text):
+    """
+    Condición: la URL actual no contiene el texto
+    """
+    def condition(driver):
+        return text not in driver.current_url
+    return _named(condition, f"URL no contiene '{text}'")
+
+
+def network_idle(quiet_ms=500):
+    """
+    Condición: la página terminó de cargar, no hay requests fetch/XHR en
+    curso y no hubo actividad de red durante quiet_ms milisegundos
+    """
+    def condition(driver):
+        state = get_network_state(driver)
+        if state is None:
+            # La página no tiene el tracker (por ejemplo, en Firefox): se inyecta ahora
+            install_network_tracker(driver)
+            return False
+        ready_state, pending, idle_ms = state
+        return ready_state == "complete" and pending == 0 and idle_ms >= quiet_ms
+    return _named(condition, f"red inactiva {quiet_ms}ms")
+
+
+def render_settled(quiet_ms=300):
+    """
+    Condición: React terminó de renderizar (sin spinners de carga y sin
+    mutaciones del DOM durante quiet_ms milisegundos)
+    """
+    def condition(driver):
+        since_last_mutation, loading = driver.execute_script(RENDER_STATE_JS)
+        return not loading and since_last_mutation >= quiet_ms
+    return _named(condition, f"render estable {quiet_ms}ms")
+
+
+def element_appeared(locator):
+    """
+    Condición: el elemento está presente y visible; retorna el elemento
+    """
+    return _named(EC.visibility_of_element_located(locator), f"elemento visible {locator[1]}")
+
+
+def element_text_changed(locator, previous_text):
+    """
+    Condición: el texto del elemento es distinto de previous_text
+    """
+    def condition(driver):
+        return driver.find_element(*locator).text != previous_text
+    return _named(condition, f"texto de {locator[1]} distinto de '{previous_text}'")
+
+
+def element_stale(element):
+    """
+    Condición: el elemento fue removido del DOM (por ejemplo, tras navegar)
+    """
+    return _named(EC.staleness_of(element), "elemento removido del DOM")
+
+
+def all_of(*conditions):
+    """
+    Condición compuesta: se cumplen todas las condiciones
+    """
+    description = " y ".join(_describe(c) for c in conditions)
+    return _named(EC.all_of(*conditions), description)
+
+
+def any_of(*conditions):
+    """
+    Condición compuesta: se cumple al menos una de las condiciones
+    """
+    description = " o ".join(_describe(c) for c in conditions)
+    return _named(EC.any_of(*conditions), description)
+
+
+def _named(condition, description):
+    """Asocia una descripción legible a una condición"""
+    condition.description = description
+    return condition
+
+
+def _describe(condition):
+    """Retorna la descripción de una condición"""
+    return getattr(condition, "description", getattr(condition, "__name__", "condición"))
+
+
 def take_screenshot(driver, test_name):
     """
     Toma una captura de pantalla y la guarda con timestamp
-    """
-    if not os.path.exists(SCREENSHOT_DIR):
-        os.makedirs(SCREENSHOT_DIR)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{SCREENSHOT_DIR}/{test_name}_{timestamp}.png"
-    driver.save_screenshot(filename)
-    return filename
+    La escritura a disco se hace en segundo plano (utils.screenshots); una
+    captura idéntica a una anterior retorna el archivo ya guardado.
+    """
+    return screenshot_writer.capture(driver, test_name)
 
 
 def clear_and_send_keys(element, text):
@@ -72,6 +264,8 @@ def clear_and_send_keys(element, text):
 def generate_unique_email():
     """
     Genera un email único para pruebas
+
+    Incluye un sufijo aleatorio para que no colisione entre workers paralelos
     """
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    return f"test_user_{timestamp}@example.com"
+    return f"test_user_{timestamp}_{uuid.uuid4().hex[:6]}@example.com"
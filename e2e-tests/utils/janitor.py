@@ -0,0 +1,124 @@
+"""
+Limpieza de los eventos que crea la suite
+
+El janitor registra los eventos creados por API durante la sesión y, al
+terminar, los elimina en paralelo junto con los que los tests crearon desde
+la interfaz (se reconocen por el prefijo del título). También puede purgar
+eventos de prueba viejos que quedaron de ejecuciones anteriores, para que el
+calendario del usuario de prueba no crezca entre corridas.
+
+Los eventos de cada usuario se eliminan con POST /events/batch-delete; si la
+API no tiene el endpoint, uno por uno en paralelo.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from utils.api_client import api_request, delete_events_batch
+from config.config import API_POOL_SIZE, JANITOR_TITLE_PREFIXES, JANITOR_DATE_RANGE
+
+# Margen para diferencias de reloj entre la máquina de tests y el servidor
+CLOCK_SKEW = timedelta(minutes=1)
+
+
+def _parse_timestamp(value):
+    """Convierte un timestamp ISO de la API ("2025-01-31T12:00:00.000Z") a datetime"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class Janitor:
+    """Registro de eventos creados por la suite, agrupados por token de usuario"""
+
+    def __init__(self):
+        self.session_start = datetime.now(timezone.utc)
+        self.tracked = {}
+
+    def track(self, token, event_id):
+        """Registra un evento creado por la suite"""
+        self.tracked.setdefault(token, set()).add(event_id)
+
+    def untrack(self, token, event_id):
+        """Quita un evento que ya se eliminó"""
+        self.tracked.get(token, set()).discard(event_id)
+
+    def find_test_events(self, token):
+        """
+        Retorna los eventos del usuario cuyo título empieza con alguno de los
+        prefijos de JANITOR_TITLE_PREFIXES
+        """
+        date_from, date_to = JANITOR_DATE_RANGE
+        response = api_request("GET", "/events", token, params={"from": date_from, "to": date_to}, timeout=30)
+        response.raise_for_status()
+
+        return [
+            event for event in response.json()
+            if event.get("title", "").startswith(tuple(JANITOR_TITLE_PREFIXES))
+        ]
+
+    def sweep(self, token, purge_days=0):
+        """
+        Registra los eventos de prueba creados durante la sesión (incluidos los
+        creados desde la interfaz) y, si purge_days > 0, los de ejecuciones
+        anteriores con más de purge_days días
+
+        Returns:
+            int: Cantidad de eventos agregados al registro
+        """
+        session_cutoff = self.session_start - CLOCK_SKEW
+        stale_cutoff = datetime.now(timezone.utc) - timedelta(days=purge_days)
+        found = 0
+
+        for event in self.find_test_events(token):
+            created_at = _parse_timestamp(event["createdAt"])
+            if created_at >= session_cutoff or (purge_days > 0 and created_at < stale_cutoff):
+                self.track(token, event["_id"])
+                found += 1
+
+        return found
+
+    def cleanup(self):
+        """
+        Elimina todos los eventos registrados: un POST /events/batch-delete
+        por usuario (cada API_BATCH_SIZE eventos) o, si no está disponible,
+        un DELETE por evento en paralelo
+
+        Returns:
+            int: Cantidad de eventos eliminados
+        """
+        removed = 0
+        pending = []
+
+        for token, ids in self.tracked.items():
+            if not ids:
+                continue
+            try:
+                statuses = delete_events_batch(token, sorted(ids))
+            except Exception as e:
+                print(f"Warning: Could not batch delete events - {str(e)}")
+                statuses = None
+
+            if statuses is None:
+                pending.extend((token, event_id) for event_id in ids)
+            else:
+                # 404: ya no existía (lo borró el test); se deja de seguir pero no se cuenta
+                removed += sum(1 for status in statuses.values() if status == 204)
+                ids.difference_update(statuses)
+
+        with ThreadPoolExecutor(max_workers=API_POOL_SIZE) as executor:
+            results = list(executor.map(lambda item: self._delete(*item), pending))
+
+        for (token, event_id), status in zip(pending, results):
+            if status in (204, 404):
+                self.untrack(token, event_id)
+
+        return removed + results.count(204)
+
+    def _delete(self, token, event_id):
+        """Retorna el status del DELETE, o None si falló el request"""
+        try:
+            return api_request("DELETE", f"/events/{event_id}", token).status_code
+        except Exception as e:
+            print(f"Warning: Could not delete event {event_id} - {str(e)}")
+            return None
+
+
+# Janitor de la sesión (uno por proceso; cada worker de xdist tiene el suyo)
+janitor = Janitor()
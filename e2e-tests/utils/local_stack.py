@@ -0,0 +1,316 @@
+"""
+Stack local para ejecutar la suite sin depender de los despliegues remotos
+
+Levanta el servidor Express de server/ con la base en memoria en un puerto
+libre y sirve el build de web/ desde un servidor HTTP local que además
+reenvía las rutas de la API al servidor Express (mismo origen, sin CORS).
+"""
+import hashlib
+import http.client
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from config.config import LOCAL_STACK_TIMEOUT
+
+E2E_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(E2E_DIR)
+SERVER_DIR = os.path.join(ROOT_DIR, "server")
+WEB_DIR = os.path.join(ROOT_DIR, "web")
+WEB_DIST_DIR = os.path.join(WEB_DIR, "dist")
+
+# Marca que indica que el build de web/ se hizo para el stack local (API en el mismo origen)
+# y guarda el hash de las fuentes con las que se hizo
+BUILD_STAMP = os.path.join(WEB_DIST_DIR, ".e2e-local-stack")
+
+# Archivos y directorios de web/ de los que depende el build
+WEB_BUILD_INPUTS = ("src", "index.html", "package.json", "vite.config.ts", "tsconfig.json")
+
+# Rutas que el servidor estático reenvía a la API
+API_PREFIXES = ("/auth", "/events", "/profile", "/health", "/api-docs")
+
+# Rutas de la API que también son rutas de React Router (web/src/App.tsx): una
+# navegación del navegador (GET que acepta text/html) recibe index.html
+SPA_ROUTES = ("/profile",)
+
+# Headers que no se copian al reenviar una respuesta
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "upgrade", "content-length"}
+
+NPM = "npm.cmd" if os.name == "nt" else "npm"
+NPX = "npx.cmd" if os.name == "nt" else "npx"
+
+
+def get_free_port():
+    """
+    Retorna un puerto TCP libre en la interfaz de loopback
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _source_files(base_dir, inputs):
+    """Archivos de inputs (relativos a base_dir), en orden estable"""
+    for name in inputs:
+        path = os.path.join(base_dir, name)
+        if os.path.isfile(path):
+            yield path
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file_name in sorted(files):
+                yield os.path.join(root, file_name)
+
+
+def sources_hash(base_dir, inputs):
+    """
+    Hash del contenido de las fuentes, para saber si un build quedó viejo
+    """
+    digest = hashlib.sha256()
+    for path in _source_files(base_dir, inputs):
+        digest.update(os.path.relpath(path, base_dir).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def build_web(force=False):
+    """
+    Compila web/ con la API en el mismo origen (VITE_API_URL vacío)
+
+    El build no depende del puerto, así que se reutiliza entre ejecuciones
+    mientras BUILD_STAMP tenga el hash de las fuentes actuales de web/.
+    """
+    stamp = f"VITE_API_URL=\nsources={sources_hash(WEB_DIR, WEB_BUILD_INPUTS)}\n"
+    if not force and os.path.exists(BUILD_STAMP):
+        with open(BUILD_STAMP) as f:
+            if f.read() == stamp:
+                return
+
+    env = {**os.environ, "VITE_API_URL": ""}
+    subprocess.run([NPM, "run", "build"], cwd=WEB_DIR, env=env, check=True)
+
+    with open(BUILD_STAMP, "w") as f:
+        f.write(stamp)
+
+
+def server_build_is_current():
+    """
+    Indica si server/dist/index.js es posterior a todas las fuentes de server/src
+    """
+    entry = os.path.join(SERVER_DIR, "dist", "index.js")
+    if not os.path.exists(entry):
+        return False
+    newest_source = max(
+        (os.path.getmtime(path) for path in _source_files(SERVER_DIR, ("src",))),
+        default=0
+    )
+    return os.path.getmtime(entry) >= newest_source
+
+
+class SpaProxyHandler(SimpleHTTPRequestHandler):
+    """
+    Sirve web/dist con fallback a index.html (rutas de React Router) y
+    reenvía las rutas de la API al servidor Express
+    """
+
+    api_port = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=WEB_DIST_DIR, **kwargs)
+
+    def log_message(self, format, *args):
+        # Sin log por request para no llenar la salida de pytest
+        pass
+
+    def do_GET(self):
+        if self.path.startswith(API_PREFIXES) and not self._is_spa_navigation():
+            return self._proxy()
+
+        # Las rutas del SPA (/calendar, /new, ...) no existen como archivo
+        if not os.path.exists(self.translate_path(self.path)):
+            self.path = "/index.html"
+        return super().do_GET()
+
+    def _is_spa_navigation(self):
+        route = self.path.split("?")[0].rstrip("/")
+        return route in SPA_ROUTES and "text/html" in (self.headers.get("Accept") or "")
+
+    def do_POST(self):
+        self._proxy()
+
+    def do_PUT(self):
+        self._proxy()
+
+    def do_DELETE(self):
+        self._proxy()
+
+    def do_OPTIONS(self):
+        self._proxy()
+
+    def _proxy(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        headers = {key: value for key, value in self.headers.items() if key.lower() != "host"}
+
+        connection = http.client.HTTPConnection("127.0.0.1", self.api_port, timeout=30)
+        try:
+            connection.request(self.command, self.path, body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except OSError as e:
+            self.send_error(502, f"API no disponible: {e}")
+            return
+        finally:
+            connection.close()
+
+        self.send_response(response.status)
+        for key, value in response.getheaders():
+            if key.lower() not in HOP_BY_HOP_HEADERS:
+                self.send_header(key, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class LocalStack:
+    """Servidor Express en modo memoria + build de web/ servidos en loopback"""
+
+    def __init__(self, mongodb_uri="", serve_web=True):
+        """
+        Args:
+            mongodb_uri (str): Base MongoDB del servidor (vacío = repositorios en memoria)
+            serve_web (bool): Servir también el build de web/ (los benchmarks solo usan la API)
+        """
+        self.mongodb_uri = mongodb_uri
+        self.serve_web = serve_web
+        self.api_port = None
+        self.web_port = None
+        self.server_process = None
+        self.web_server = None
+        self.log_file = None
+        self.log_path = None
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self.api_port}"
+
+    @property
+    def database(self):
+        """Valor de "database" que debe reportar GET /health"""
+        return "mongodb" if self.mongodb_uri else "memory"
+
+    @property
+    def base_url(self):
+        """URL del frontend, o None si el stack solo levanta la API"""
+        return f"http://127.0.0.1:{self.web_port}" if self.serve_web else None
+
+    def start(self, log_dir=os.path.join("reports", "local_stack")):
+        """
+        Levanta el servidor y el frontend y espera a que la API responda
+        """
+        self.api_port = get_free_port()
+        self.web_port = get_free_port()
+
+        self._start_server(log_dir)
+        if self.serve_web:
+            self._start_web()
+        self._wait_until_ready()
+        return self
+
+    def _server_command(self):
+        """Usa el build de server/ si está al día con src/; si no, ts-node sobre el código fuente"""
+        if server_build_is_current():
+            return ["node", os.path.join("dist", "index.js")]
+        return [NPX, "ts-node", os.path.join("src", "index.ts")]
+
+    def _start_server(self, log_dir):
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+
+        env = {
+            **os.environ,
+            "NODE_ENV": "test",
+            "PORT": str(self.api_port),
+            # Sin MONGODB_URI el servidor usa los repositorios en memoria
+            "MONGODB_URI": self.mongodb_uri,
+            "JWT_SECRET": "e2e-local-stack-secret",
+            "CORS_ORIGIN": f"http://127.0.0.1:{self.web_port},http://localhost:{self.web_port}",
+            "RATE_LIMIT_MAX_REQUESTS": "100000",
+            # Rutas /__test__ para restaurar el dataset base entre tests
+            "ENABLE_TEST_ROUTES": "true",
+        }
+
+        self.log_path = os.path.join(log_dir, f"server_{self.api_port}.log")
+        self.log_file = open(self.log_path, "w")
+        self.server_process = subprocess.Popen(
+            self._server_command(),
+            cwd=SERVER_DIR,
+            env=env,
+            stdout=self.log_file,
+            stderr=subprocess.STDOUT,
+            # Grupo de procesos propio para poder terminar npx y node juntos
+            start_new_session=os.name != "nt"
+        )
+
+    def _start_web(self):
+        handler = type("LocalStackHandler", (SpaProxyHandler,), {"api_port": self.api_port})
+        self.web_server = ThreadingHTTPServer(("127.0.0.1", self.web_port), handler)
+        threading.Thread(target=self.web_server.serve_forever, daemon=True).start()
+
+    def _wait_until_ready(self):
+        """
+        Readiness probe: GET /health debe responder con la base esperada
+        """
+        deadline = time.monotonic() + LOCAL_STACK_TIMEOUT
+
+        while time.monotonic() < deadline:
+            if self.server_process.poll() is not None:
+                self.stop()
+                raise RuntimeError(f"El servidor local terminó al iniciar (ver {self.log_path})")
+
+            try:
+                response = requests.get(f"{self.api_url}/health", timeout=1)
+                if response.ok and response.json().get("database") == self.database:
+                    return
+            except requests.RequestException:
+                pass
+
+            time.sleep(0.2)
+
+        self.stop()
+        raise RuntimeError(f"El servidor local no respondió en {LOCAL_STACK_TIMEOUT}s (ver {self.log_path})")
+
+    def stop(self):
+        """
+        Detiene el frontend y el servidor
+        """
+        if self.web_server:
+            self.web_server.shutdown()
+            self.web_server.server_close()
+            self.web_server = None
+
+        if self.server_process and self.server_process.poll() is None:
+            if os.name == "nt":
+                self.server_process.terminate()
+            else:
+                os.killpg(self.server_process.pid, signal.SIGTERM)
+            try:
+                self.server_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.server_process.kill()
+
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+
+
+def node_available():
+    """
+    Indica si node y npm están instalados
+    """
+    return shutil.which("node") is not None and shutil.which(NPM) is not None
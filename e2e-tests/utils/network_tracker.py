@@ -0,0 +1,137 @@
+"""
+Seguimiento de requests fetch/XHR dentro de la página
+
+Instala en el navegador un script que intercepta fetch y XMLHttpRequest,
+cuenta los requests en curso y guarda URL, método, estado y duración de cada
+uno en un buffer que los tests y el reporte pueden leer.
+"""
+
+# Script del tracker. Se ejecuta una sola vez por documento; el buffer se guarda
+# en sessionStorage al salir de la página para no perder los requests al navegar
+NETWORK_TRACKER_JS = """
+(function () {
+    if (window.__e2eNetwork) return;
+
+    var MAX_ENTRIES = 500;
+    var saved = [];
+    try {
+        saved = JSON.parse(window.sessionStorage.getItem('__e2eNetwork') || '[]');
+    } catch (e) {}
+
+    var tracker = window.__e2eNetwork = {
+        pending: 0,
+        lastActivity: performance.now(),
+        requests: saved
+    };
+
+    function start() {
+        tracker.pending++;
+        tracker.lastActivity = performance.now();
+    }
+
+    function finish(method, url, status, startTime) {
+        var now = performance.now();
+        tracker.pending = Math.max(0, tracker.pending - 1);
+        tracker.lastActivity = now;
+        tracker.requests.push({
+            method: method,
+            url: url,
+            status: status,
+            duration: now - startTime,
+            startedAt: Date.now() - (now - startTime)
+        });
+        if (tracker.requests.length > MAX_ENTRIES) tracker.requests.shift();
+    }
+
+    var originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (input, init) {
+            var method = String((init && init.method) || (input && input.method) || 'GET').toUpperCase();
+            var url = typeof input === 'string' ? input : (input && input.url) || String(input);
+            var startTime = performance.now();
+            start();
+            return originalFetch.apply(this, arguments).then(function (response) {
+                finish(method, url, response.status, startTime);
+                return response;
+            }, function (error) {
+                finish(method, url, 0, startTime);
+                throw error;
+            });
+        };
+    }
+
+    var originalOpen = XMLHttpRequest.prototype.open;
+    var originalSend = XMLHttpRequest.prototype.send;
+
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__e2eRequest = { method: String(method).toUpperCase(), url: String(url) };
+        return originalOpen.apply(this, arguments);
+    };
+
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        var info = xhr.__e2eRequest || { method: 'GET', url: '' };
+        var startTime = performance.now();
+        start();
+        xhr.addEventListener('loadend', function () {
+            finish(info.method, info.url, xhr.status, startTime);
+        });
+        return originalSend.apply(this, arguments);
+    };
+
+    window.addEventListener('pagehide', function () {
+        try {
+            window.sessionStorage.setItem('__e2eNetwork', JSON.stringify(tracker.requests));
+        } catch (e) {}
+    });
+})();
+"""
+
+# Estado del tracker: [readyState, requests en curso, ms desde la última actividad]
+NETWORK_STATE_JS = """
+    var tracker = window.__e2eNetwork;
+    if (!tracker) return null;
+    return [document.readyState, tracker.pending, performance.now() - tracker.lastActivity];
+"""
+
+READ_NETWORK_LOG_JS = """
+    var tracker = window.__e2eNetwork;
+    var requests = tracker ? tracker.requests.slice() : [];
+    if (arguments[0] && tracker) {
+        tracker.requests = [];
+        try { window.sessionStorage.removeItem('__e2eNetwork'); } catch (e) {}
+    }
+    return requests;
+"""
+
+
+def install_network_tracker(driver):
+    """
+    Instala el tracker de red en el navegador
+
+    En Chrome/Edge se registra con CDP para que corra antes que el código de la
+    app en cada página nueva. En otros navegadores se inyecta en la página
+    actual, por lo que solo ve los requests posteriores a la inyección.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        if not getattr(driver, "_e2e_network_tracker", False):
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_JS})
+            driver._e2e_network_tracker = True
+
+    driver.execute_script(NETWORK_TRACKER_JS)
+
+
+def get_network_state(driver):
+    """
+    Retorna (readyState, requests en curso, ms sin actividad) o None si el
+    tracker no está instalado en la página actual
+    """
+    return driver.execute_script(NETWORK_STATE_JS)
+
+
+def read_network_log(driver, clear=False):
+    """
+    Retorna la lista de requests registrados: url, method, status, duration
+    (ms) y startedAt (epoch ms). Con clear=True vacía el buffer.
+    """
+    return driver.execute_script(READ_NETWORK_LOG_JS, clear) or []
@@ -0,0 +1,135 @@
+"""
+Captura de performance del navegador por test
+
+Con PERF_CAPTURE=true Chrome/Edge registran el performance log (eventos CDP
+del dominio Network) y, al terminar cada test, se guarda un JSON compacto en
+reports/perf/ con el navigation timing, los resource timings y los bytes
+transferidos de la página.
+"""
+import json
+import os
+import re
+from selenium.common.exceptions import WebDriverException
+from config.config import PERF_CAPTURE_DIR
+
+# Navigation timing de la página actual, en ms relativos al inicio de la navegación
+NAVIGATION_TIMING_JS = """
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return null;
+    return {
+        url: nav.name,
+        ttfb: nav.responseStart - nav.requestStart,
+        responseEnd: nav.responseEnd,
+        domInteractive: nav.domInteractive,
+        domContentLoaded: nav.domContentLoadedEventEnd,
+        loadEventEnd: nav.loadEventEnd,
+        transferSize: nav.transferSize || 0
+    };
+"""
+
+RESOURCE_TIMING_JS = """
+    return performance.getEntriesByType('resource').map(function (entry) {
+        return {
+            name: entry.name,
+            type: entry.initiatorType,
+            start: Math.round(entry.startTime),
+            duration: Math.round(entry.duration),
+            transferSize: entry.transferSize || 0
+        };
+    });
+"""
+
+
+def enable_perf_logging(options):
+    """
+    Habilita el performance log en las opciones de Chrome/Edge
+    """
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def reset_perf_capture(driver):
+    """
+    Descarta los eventos acumulados en el performance log (por ejemplo, los
+    del test anterior cuando el navegador viene del pool)
+    """
+    try:
+        driver.get_log("performance")
+    except (WebDriverException, ValueError):
+        pass
+
+
+def _network_summary(driver):
+    """
+    Agrupa los eventos Network.* del performance log por request y retorna
+    (requests, bytes transferidos). Sin performance log retorna (None, None).
+    """
+    try:
+        entries = driver.get_log("performance")
+    except (WebDriverException, ValueError):
+        return None, None
+
+    requests = {}
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method", "")
+        params = message.get("params", {})
+        request_id = params.get("requestId")
+
+        if method == "Network.responseReceived":
+            response = params["response"]
+            requests.setdefault(request_id, {}).update({
+                "url": response.get("url"),
+                "type": params.get("type"),
+                "status": response.get("status"),
+                "fromCache": response.get("fromDiskCache", False) or response.get("fromServiceWorker", False)
+            })
+        elif method == "Network.loadingFinished":
+            requests.setdefault(request_id, {})["bytes"] = params.get("encodedDataLength", 0)
+        elif method == "Network.loadingFailed":
+            requests.setdefault(request_id, {})["failed"] = params.get("errorText")
+
+    # Requests sin respuesta (data:, preflight cancelados, ...) no aportan datos
+    network = [request for request in requests.values() if "url" in request]
+    total_bytes = sum(request.get("bytes", 0) for request in requests.values())
+    return network, total_bytes
+
+
+def collect_perf_capture(driver):
+    """
+    Retorna el navigation timing, los resource timings y el resumen de red
+    de la página actual
+    """
+    navigation = driver.execute_script(NAVIGATION_TIMING_JS)
+    resources = driver.execute_script(RESOURCE_TIMING_JS) or []
+    network, total_bytes = _network_summary(driver)
+
+    if total_bytes is None:
+        # Navegadores sin performance log: se estima con Resource Timing
+        total_bytes = sum(resource["transferSize"] for resource in resources)
+        if navigation:
+            total_bytes += navigation["transferSize"]
+
+    return {
+        "navigation": navigation,
+        "resources": resources,
+        "network": network,
+        "transferredBytes": total_bytes
+    }
+
+
+def save_perf_capture(test_name, capture, directory=PERF_CAPTURE_DIR):
+    """
+    Guarda la captura de un test como JSON compacto y retorna la ruta
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    # Los tests parametrizados incluyen [ ] / : en el nombre
+    safe_name = re.sub(r"[^\w.-]+", "_", test_name).strip("_")
+    filepath = os.path.join(directory, f"{safe_name}.json")
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(capture, f, separators=(",", ":"))
+
+    return filepath
@@ -0,0 +1,177 @@
+"""
+Escritura de screenshots en segundo plano
+
+El test solo pide la imagen al driver (get_screenshot_as_png); la compresión,
+la escritura a disco y la limpieza de archivos viejos se hacen en un hilo
+aparte con una cola acotada. Las capturas idénticas (mismo hash) no se
+vuelven a escribir: se retorna el archivo de la primera.
+"""
+import hashlib
+import io
+import os
+import queue
+import threading
+from datetime import datetime
+from config.config import (
+    SCREENSHOT_DIR,
+    SCREENSHOT_FORMAT,
+    SCREENSHOT_SCALE,
+    SCREENSHOT_QUEUE_SIZE,
+    SCREENSHOT_MAX_FILES
+)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Extensión de archivo de cada formato
+FORMAT_EXTENSIONS = {"png": "png", "png-optimized": "png", "webp": "webp"}
+
+# Extensiones que cuentan para SCREENSHOT_MAX_FILES
+SCREENSHOT_EXTENSIONS = (".png", ".webp")
+
+
+def encode_image(png, image_format=SCREENSHOT_FORMAT, scale=SCREENSHOT_SCALE):
+    """
+    Convierte el PNG del driver al formato configurado
+
+    Sin Pillow (o con formato "png" y escala 1) retorna el PNG original.
+    """
+    if Image is None or (image_format == "png" and scale >= 1):
+        return png
+
+    image = Image.open(io.BytesIO(png))
+    if scale < 1:
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        image = image.resize(size, Image.LANCZOS)
+
+    output = io.BytesIO()
+    if image_format == "webp":
+        image.save(output, format="WEBP", lossless=True, method=4)
+    else:
+        image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def prune_screenshots(directory=SCREENSHOT_DIR, max_files=SCREENSHOT_MAX_FILES):
+    """
+    Elimina los screenshots más viejos hasta dejar max_files (0 = sin límite)
+
+    Returns:
+        int: Cantidad de archivos eliminados
+    """
+    if max_files <= 0 or not os.path.exists(directory):
+        return 0
+
+    files = [
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(SCREENSHOT_EXTENSIONS)
+    ]
+    if len(files) <= max_files:
+        return 0
+
+    files.sort(key=os.path.getmtime)
+    removed = 0
+    for path in files[:len(files) - max_files]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError as e:
+            print(f"Warning: Could not remove old screenshot {path} - {str(e)}")
+    return removed
+
+
+class ScreenshotWriter:
+    """Cola acotada de screenshots que un hilo en segundo plano escribe a disco"""
+
+    def __init__(self, directory=SCREENSHOT_DIR, image_format=SCREENSHOT_FORMAT, queue_size=SCREENSHOT_QUEUE_SIZE):
+        self.directory = directory
+        self.image_format = image_format if Image is not None else "png"
+        self.queue = queue.Queue(maxsize=queue_size)
+        # Hash de la captura -> archivo donde se guardó
+        self.written = {}
+        # Archivos encolados que todavía no se escribieron
+        self.pending = set()
+        self.dropped = 0
+        self._thread = None
+        self._lock = threading.Lock()
+        self._pillow_missing = Image is None and (image_format != "png" or SCREENSHOT_SCALE < 1)
+
+    def capture(self, driver, name):
+        """
+        Toma el screenshot y lo encola para escribirlo
+
+        Returns:
+            str: Ruta del archivo (el de una captura idéntica anterior si la
+                imagen se repite) o None si la cola estaba llena
+        """
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.sha1(png).hexdigest()
+
+        with self._lock:
+            previous = self.written.get(digest)
+            if previous and (previous in self.pending or os.path.exists(previous)):
+                return previous
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            extension = FORMAT_EXTENSIONS.get(self.image_format, "png")
+            filename = os.path.join(self.directory, f"{name}_{timestamp}_{digest[:8]}.{extension}")
+
+            try:
+                self.queue.put_nowait((filename, png))
+            except queue.Full:
+                self.dropped += 1
+                print(f"Warning: Screenshot queue is full - dropping screenshot {name}")
+                return None
+
+            self.written[digest] = filename
+            self.pending.add(filename)
+            self._ensure_thread()
+
+        return filename
+
+    def _ensure_thread(self):
+        if self._pillow_missing:
+            print("Warning: Pillow is not installed - screenshots are saved as plain PNG")
+            self._pillow_missing = False
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            filename, png = self.queue.get()
+            try:
+                self._write(filename, png)
+            except Exception as e:
+                print(f"Warning: Could not write screenshot {filename} - {str(e)}")
+            finally:
+                with self._lock:
+                    self.pending.discard(filename)
+                self.queue.task_done()
+
+    def _write(self, filename, png):
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+
+        data = encode_image(png, self.image_format)
+
+        # Escritura atómica: un archivo a medias no queda con el nombre final
+        tmp_path = f"{filename}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, filename)
+
+        prune_screenshots(self.directory)
+
+    def flush(self):
+        """
+        Espera a que se escriban todas las capturas encoladas
+        """
+        self.queue.join()
+
+
+# Writer de la sesión (uno por proceso; cada worker de xdist tiene el suyo)
+screenshot_writer = ScreenshotWriter()
@@ -0,0 +1,124 @@
+"""
+Creación de datos de prueba a través de la API
+
+Los tests que necesitan eventos como precondición los crean con
+POST /events en lugar de completar el formulario de /new. La creación de
+eventos en sí la siguen cubriendo los tests de HU-03. Los lotes usan
+POST /events/batch y /events/batch-delete (un request cada API_BATCH_SIZE
+eventos) y, si la API no los tiene, requests individuales en paralelo.
+"""
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from utils.api_client import api_request, create_events_batch, delete_events_batch
+from utils.janitor import janitor
+from config.config import API_POOL_SIZE, SEED_EVENT_PREFIX
+
+
+class EventFactory:
+    """Crea eventos de un usuario por API y los elimina al terminar"""
+
+    def __init__(self, token):
+        """
+        Args:
+            token (str): JWT del usuario dueño de los eventos
+        """
+        self.token = token
+        self.created_ids = []
+
+    def build(self, **overrides):
+        """
+        Retorna los datos de un evento válido; overrides reemplaza cualquier campo
+        """
+        event = {
+            "title": f"{SEED_EVENT_PREFIX} - {uuid.uuid4().hex[:8]}",
+            "description": "Evento creado por API para las pruebas E2E",
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "time": "00:00",
+            "type": "EXAM"
+        }
+        event.update(overrides)
+        return event
+
+    def create(self, **overrides):
+        """
+        Crea un evento con POST /events y retorna el evento creado
+        """
+        response = api_request("POST", "/events", self.token, json=self.build(**overrides))
+        response.raise_for_status()
+
+        event = response.json()
+        self.created_ids.append(event["_id"])
+        janitor.track(self.token, event["_id"])
+        return event
+
+    def create_many(self, count=None, events=None):
+        """
+        Crea varios eventos con POST /events/batch (o en paralelo si la API no
+        tiene el endpoint batch)
+
+        Args:
+            count (int): Cantidad de eventos con datos por defecto
+            events (list): Overrides de cada evento (alternativa a count)
+
+        Returns:
+            list: Eventos creados, en el mismo orden pedido
+        """
+        overrides = events if events is not None else [{}] * (count or 0)
+
+        results = create_events_batch(self.token, [self.build(**data) for data in overrides])
+        if results is None:
+            with ThreadPoolExecutor(max_workers=API_POOL_SIZE) as executor:
+                return list(executor.map(lambda data: self.create(**data), overrides))
+
+        created = [result["event"] for result in results if result["status"] == 201]
+        for event in created:
+            self.created_ids.append(event["_id"])
+            janitor.track(self.token, event["_id"])
+
+        rejected = [result for result in results if result["status"] != 201]
+        if rejected:
+            raise ValueError(f"La API rechazó {len(rejected)} eventos del lote: {rejected[0].get('details')}")
+        return created
+
+    def delete(self, event_id):
+        """
+        Elimina un evento; retorna True si se eliminó o ya no existía
+        """
+        response = api_request("DELETE", f"/events/{event_id}", self.token)
+        if response.status_code in (204, 404):
+            janitor.untrack(self.token, event_id)
+            return True
+        return False
+
+    def cleanup(self):
+        """
+        Elimina todos los eventos creados por la factory con
+        POST /events/batch-delete (o en paralelo si la API no lo tiene)
+        """
+        ids, self.created_ids = self.created_ids, []
+        if not ids:
+            return True
+
+        try:
+            statuses = delete_events_batch(self.token, ids)
+        except Exception as e:
+            print(f"Warning: Could not batch delete seeded events - {str(e)}")
+            statuses = None
+
+        if statuses is not None:
+            for event_id in statuses:
+                janitor.untrack(self.token, event_id)
+            return set(statuses) >= set(ids)
+
+        with ThreadPoolExecutor(max_workers=API_POOL_SIZE) as executor:
+            results = list(executor.map(self._safe_delete, ids))
+
+        return all(results)
+
+    def _safe_delete(self, event_id):
+        try:
+            return self.delete(event_id)
+        except Exception as e:
+            print(f"Warning: Could not delete seeded event {event_id} - {str(e)}")
+            return False
@@ -0,0 +1,46 @@
+"""
+Control del estado del servidor en memoria desde las pruebas
+
+Usa las rutas /__test__ del servidor (ENABLE_TEST_ROUTES=true con la base en
+memoria, como en el stack local) para guardar un snapshot del dataset base y
+restaurarlo entre tests sin reiniciar el proceso de Node.
+"""
+import requests
+from utils.api_client import get_api_session
+from config.config import get_api_url
+
+
+def _post(path, name=None):
+    response = get_api_session().post(
+        f"{get_api_url()}/__test__{path}",
+        json={"name": name} if name else {},
+        timeout=15
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def state_routes_available():
+    """
+    Indica si la API expone las rutas de test (no existen en los despliegues remotos)
+    """
+    try:
+        response = get_api_session().get(f"{get_api_url()}/__test__/state", timeout=5)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
+
+def reset_server():
+    """Vacía usuarios y eventos del servidor"""
+    return _post("/reset")
+
+
+def snapshot_server(name):
+    """Guarda el estado actual del servidor con un nombre"""
+    return _post("/snapshot", name)
+
+
+def restore_server(name):
+    """Restaura un snapshot guardado con snapshot_server"""
+    return _post("/restore", name)
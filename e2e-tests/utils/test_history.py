@@ -0,0 +1,87 @@
+"""
+Historial de duraciones y resultados de los tests entre ejecuciones
+
+Se alimenta con los mismos datos que pytest_runtest_logreport envía al
+reporte Excel y se usa para ordenar los tests: primero los que fallaron
+recientemente (feedback rápido) y, en ejecución paralela, de mayor a menor
+duración para que los workers terminen a la par.
+"""
+import json
+import os
+from config.config import TEST_HISTORY_FILE, TEST_HISTORY_RUNS
+
+
+class TestHistory:
+    """Duraciones y estados de las últimas ejecuciones de cada test"""
+
+    # Evita que pytest intente recolectar esta clase como tests
+    __test__ = False
+
+    def __init__(self, path=TEST_HISTORY_FILE, max_runs=TEST_HISTORY_RUNS):
+        self.path = path
+        self.max_runs = max_runs
+        self.tests = self._load()
+
+    def _load(self):
+        """Lee el historial; si no existe o está corrupto, empieza vacío"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read test history - {str(e)}")
+            return {}
+
+    def record(self, nodeid, duration, status):
+        """
+        Registra una ejecución de un test (se conservan las últimas max_runs)
+        """
+        entry = self.tests.setdefault(nodeid, {"durations": [], "outcomes": []})
+        entry["durations"] = (entry["durations"] + [round(duration, 3)])[-self.max_runs:]
+        entry["outcomes"] = (entry["outcomes"] + [status])[-self.max_runs:]
+
+    def save(self):
+        """
+        Guarda el historial (escritura atómica para no dejar el archivo a medias)
+        """
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.tests, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def expected_duration(self, nodeid):
+        """
+        Duración esperada: promedio de las últimas ejecuciones (0 si no hay datos)
+        """
+        durations = self.tests.get(nodeid, {}).get("durations", [])
+        return sum(durations) / len(durations) if durations else 0
+
+    def recently_failed(self, nodeid, runs=3):
+        """
+        Indica si el test falló en alguna de sus últimas `runs` ejecuciones
+        """
+        outcomes = self.tests.get(nodeid, {}).get("outcomes", [])
+        return any(outcome in ("FAILED", "ERROR") for outcome in outcomes[-runs:])
+
+
+def order_items(items, history, parallel=False):
+    """
+    Ordena los tests recolectados según el historial
+
+    Primero los que fallaron recientemente; en paralelo, además, de mayor a
+    menor duración esperada (el orden debe ser determinístico: todos los
+    workers de xdist tienen que recolectar los tests en el mismo orden).
+    Los tests sin historial conservan su orden original.
+    """
+    def sort_key(indexed_item):
+        index, item = indexed_item
+        duration = history.expected_duration(item.nodeid) if parallel else 0
+        return (not history.recently_failed(item.nodeid), -duration, index)
+
+    items[:] = [item for _, item in sorted(enumerate(items), key=sort_key)]
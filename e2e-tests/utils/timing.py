@@ -0,0 +1,75 @@
+"""
+Medición de tiempos por fase dentro de cada test
+
+Los tests, fixtures y helpers marcan fases (navegador, login, navegación,
+formulario, espera, ...) con step() o @timed_step; los tiempos se juntan por
+test y se vuelcan en la hoja "Timings" del reporte Excel.
+"""
+import math
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# Fases registradas en el test actual: lista de (fase, segundos)
+_steps = []
+
+
+def reset_steps():
+    """
+    Descarta las fases registradas (se llama al comenzar cada test)
+    """
+    _steps.clear()
+
+
+@contextmanager
+def step(phase):
+    """
+    Context manager que mide la duración de una fase del test actual
+
+    Uso:
+        with step("formulario"):
+            completar_formulario(driver)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _steps.append((phase, time.perf_counter() - start))
+
+
+def timed_step(phase):
+    """
+    Decorador que mide cada llamada a la función como una fase
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with step(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def collect_steps():
+    """
+    Retorna el total de segundos por fase del test actual y reinicia el registro
+
+    Returns:
+        dict: {fase: segundos} en el orden en que aparecieron las fases
+    """
+    totals = {}
+    for phase, seconds in _steps:
+        totals[phase] = totals.get(phase, 0) + seconds
+    reset_steps()
+    return totals
+
+
+def percentile(values, p):
+    """
+    Percentil p (0-100) por el método nearest-rank
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -0,0 +1,56 @@
+"""
+Gestión de usuarios de prueba para ejecución en paralelo
+
+Cada worker de pytest-xdist usa su propia cuenta para que los tests no
+compartan (ni pisen) los eventos del mismo usuario.
+"""
+import os
+import requests
+from utils.api_client import get_api_session
+from config.config import TEST_USER_EMAIL, TEST_USER_PASSWORD, get_api_url
+
+
+def get_worker_id():
+    """
+    Retorna el id del worker de pytest-xdist ("gw0", "gw1", ...) o "master"
+    cuando los tests se ejecutan en serie
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def get_worker_credentials(worker_id, email=TEST_USER_EMAIL, password=TEST_USER_PASSWORD):
+    """
+    Retorna (email, password) del usuario de prueba asignado a un worker
+
+    email y password permiten pedir la cuenta de otro usuario base (por
+    ejemplo el usuario alternativo) con el mismo sufijo por worker.
+    """
+    if worker_id == "master":
+        return email, password
+
+    local_part, domain = email.split("@")
+    return f"{local_part}_{worker_id}@{domain}", password
+
+
+def provision_user(email, password):
+    """
+    Registra el usuario en la API si todavía no existe
+
+    Retorna True si el usuario quedó disponible (creado o ya existente).
+    """
+    try:
+        response = get_api_session().post(
+            f"{get_api_url()}/auth/register",
+            json={"email": email, "password": password},
+            timeout=15
+        )
+    except requests.RequestException as e:
+        print(f"Warning: Could not provision user {email} - {str(e)}")
+        return False
+
+    # 201: usuario creado, 409: el email ya estaba registrado
+    if response.status_code in (201, 409):
+        return True
+
+    print(f"Warning: Could not provision user {email} - HTTP {response.status_code}")
+    return False
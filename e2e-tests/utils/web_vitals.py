@@ -0,0 +1,136 @@
+"""
+Medición de Web Vitals y presupuestos de performance por página
+
+Inyecta PerformanceObservers que registran LCP, CLS, FCP y long tasks desde el
+inicio de cada documento, y compara los valores con los presupuestos de
+PERF_BUDGETS (config/config.py).
+"""
+from config.config import PERF_BUDGETS, PERF_BUDGET_MODE
+
+# Script de los observers. Se registra con CDP para que corra antes que la app;
+# buffered: true recupera las entradas previas cuando se inyecta más tarde
+WEB_VITALS_JS = """
+(function () {
+    if (window.__e2eVitals || !window.PerformanceObserver) return;
+
+    var vitals = window.__e2eVitals = {
+        fcp: null,
+        lcp: null,
+        cls: 0,
+        longTasks: 0,
+        totalBlockingTime: 0,
+        lastLongTaskEnd: 0
+    };
+
+    // CLS por ventanas de sesión: shifts separados por menos de 1 s, ventana de hasta 5 s
+    var sessionValue = 0, sessionStart = 0, sessionLast = 0;
+
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function (list) {
+                list.getEntries().forEach(callback);
+            }).observe({ type: type, buffered: true });
+        } catch (e) {}
+    }
+
+    observe('paint', function (entry) {
+        if (entry.name === 'first-contentful-paint') vitals.fcp = entry.startTime;
+    });
+
+    observe('largest-contentful-paint', function (entry) {
+        vitals.lcp = entry.startTime;
+    });
+
+    observe('layout-shift', function (entry) {
+        if (entry.hadRecentInput) return;
+        if (sessionValue && entry.startTime - sessionLast < 1000 && entry.startTime - sessionStart < 5000) {
+            sessionValue += entry.value;
+        } else {
+            sessionValue = entry.value;
+            sessionStart = entry.startTime;
+        }
+        sessionLast = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, sessionValue);
+    });
+
+    observe('longtask', function (entry) {
+        vitals.longTasks++;
+        vitals.totalBlockingTime += Math.max(0, entry.duration - 50);
+        vitals.lastLongTaskEnd = Math.max(vitals.lastLongTaskEnd, entry.startTime + entry.duration);
+    });
+})();
+"""
+
+# TTI aproximado: fin de la última long task o DOMContentLoaded, lo que ocurra después
+READ_WEB_VITALS_JS = """
+    var vitals = window.__e2eVitals;
+    if (!vitals) return null;
+    var nav = performance.getEntriesByType('navigation')[0];
+    var domContentLoaded = nav ? nav.domContentLoadedEventEnd : 0;
+    return {
+        fcp: vitals.fcp,
+        lcp: vitals.lcp,
+        cls: vitals.cls,
+        tti: Math.max(domContentLoaded, vitals.lastLongTaskEnd, vitals.fcp || 0),
+        long_tasks: vitals.longTasks,
+        tbt: vitals.totalBlockingTime
+    };
+"""
+
+
+def install_web_vitals(driver):
+    """
+    Instala los observers de Web Vitals en el navegador
+
+    En Chrome/Edge se registran con CDP para cada documento nuevo; en el resto
+    se inyectan en la página actual (buffered recupera LCP, CLS y paint).
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        if not getattr(driver, "_e2e_web_vitals", False):
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": WEB_VITALS_JS})
+            driver._e2e_web_vitals = True
+
+    driver.execute_script(WEB_VITALS_JS)
+
+
+def read_web_vitals(driver):
+    """
+    Retorna las métricas de la página actual: fcp, lcp, tti y tbt en ms,
+    cls (sin unidad) y long_tasks (cantidad). None si no hay observers.
+    """
+    return driver.execute_script(READ_WEB_VITALS_JS)
+
+
+def check_budget(page, metrics, budgets=None):
+    """
+    Compara las métricas de una página con su presupuesto
+
+    Returns:
+        list: Mensajes de las métricas que exceden el presupuesto
+    """
+    budget = (budgets or PERF_BUDGETS).get(page, {})
+    violations = []
+
+    for metric, limit in budget.items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{page}: {metric}={round(value, 3)} supera el presupuesto de {limit}")
+
+    return violations
+
+
+def assert_within_budget(page, metrics, mode=PERF_BUDGET_MODE):
+    """
+    Falla el test (mode="fail") o solo avisa (mode="warn") si alguna métrica
+    de la página supera su presupuesto
+    """
+    violations = check_budget(page, metrics)
+
+    if not violations:
+        return
+
+    if mode == "fail":
+        raise AssertionError("Presupuesto de performance excedido:\n" + "\n".join(violations))
+
+    for violation in violations:
+        print(f"Warning: Presupuesto de performance excedido - {violation}")
@@ -15,6 +15,7 @@ export const config = {
   mongodbUri: process.env.MONGODB_URI || '',
   jwtSecret: process.env.JWT_SECRET || 'fallback-secret-for-development',
   corsOrigin: process.env.CORS_ORIGIN || 'http://localhost:5173',
+  enableTestRoutes: process.env.ENABLE_TEST_ROUTES === 'true',
   rateLimit: {
     windowMs: parseInt(process.env.RATE_LIMIT_WINDOW_MS || '900000'), // 15 minutes
     max: parseInt(process.env.RATE_LIMIT_MAX_REQUESTS || '100')
@@ -23,3 +24,4 @@ export const config = {
 
 export const isProduction = config.nodeEnv === 'production';
 export const useMemoryDb = !config.mongodbUri;
+export const testRoutesEnabled = config.enableTestRoutes && useMemoryDb && !isProduction;
@@ -1,34 +1,58 @@
+import { createHash } from 'crypto';
 import { Response } from 'express';
 import { body, validationResult } from 'express-validator';
 import { useMemoryDb } from '../config/env';
 import { AuthenticatedRequest } from '../middlewares/auth';
+import { EVENT_TYPES, EventType } from '../models/Event';
 import { MemoryEventRepository } from '../repositories/memory';
 import { MongoEventRepository } from '../repositories/mongo';
 
 const eventRepo = useMemoryDb ? new MemoryEventRepository() : new MongoEventRepository();
 
-export const createEventValidation = [
-  body('title')
+// Máximo de eventos por request en los endpoints batch
+export const BATCH_MAX_EVENTS = 100;
+
+// Reglas de un evento nuevo; `field` arma la ruta de cada campo en el body
+const eventCreationRules = (field: (name: string) => string = name => name) => [
+  body(field('title'))
     .trim()
     .isLength({ min: 2, max: 100 })
     .withMessage('El título debe tener entre 2 y 100 caracteres'),
-  body('description')
+  body(field('description'))
     .optional()
     .trim()
     .isLength({ max: 1000 })
     .withMessage('La descripción no puede exceder 1000 caracteres'),
-  body('date')
+  body(field('date'))
     .matches(/^\d{4}-\d{2}-\d{2}$/)
     .withMessage('La fecha debe estar en formato YYYY-MM-DD'),
-  body('time')
+  body(field('time'))
     .optional()
     .matches(/^([01]?[0-9]|2[0-3]):[0-5][0-9]$/)
     .withMessage('La hora debe estar en formato HH:mm'),
-  body('type')
+  body(field('type'))
     .isIn(['EXAM', 'DELIVERY', 'CLASS'])
     .withMessage('El tipo debe ser EXAM, DELIVERY o CLASS')
 ];
 
+export const createEventValidation = eventCreationRules();
+
+export const createEventsBatchValidation = [
+  body('events')
+    .isArray({ min: 1, max: BATCH_MAX_EVENTS })
+    .withMessage(`events debe ser una lista de 1 a ${BATCH_MAX_EVENTS} eventos`),
+  ...eventCreationRules(name => `events.*.${name}`)
+];
+
+export const deleteEventsBatchValidation = [
+  body('ids')
+    .isArray({ min: 1, max: BATCH_MAX_EVENTS })
+    .withMessage(`ids debe ser una lista de 1 a ${BATCH_MAX_EVENTS} ids`),
+  body('ids.*')
+    .isString()
+    .withMessage('Cada id debe ser un string')
+];
+
 export const updateEventValidation = [
   body('title')
     .optional()
@@ -54,9 +78,16 @@ export const updateEventValidation = [
     .withMessage('El tipo debe ser EXAM, DELIVERY o CLASS')
 ];
 
+// Validador de una consulta de GET /events: cambia cuando cambia la versión de
+// los eventos del usuario y es distinto para cada rango y filtro
+const eventsEtag = (userId: string, version: string, query: string[]): string => {
+  const hash = createHash('sha1').update([userId, version, ...query].join('|')).digest('base64url');
+  return `W/"${hash.slice(0, 27)}"`;
+};
+
 export const getEvents = async (req: AuthenticatedRequest, res: Response): Promise<void> => {
   try {
-    const { from, to } = req.query;
+    const { from, to, type, search } = req.query;
     
     if (!from || !to) {
       res.status(400).json({ error: 'Los parámetros from y to son requeridos' });
@@ -75,7 +106,35 @@ export const getEvents = async (req: AuthenticatedRequest, res: Response): Promi
       return;
     }
 
-    const events = await eventRepo.findByUserAndDateRange(req.userId!, from, to);
+    // Filtros opcionales por tipo y por texto en título/descripción
+    if (type !== undefined && (typeof type !== 'string' || !EVENT_TYPES.includes(type as EventType))) {
+      res.status(400).json({ error: 'El tipo debe ser EXAM, DELIVERY o CLASS' });
+      return;
+    }
+
+    if (search !== undefined && (typeof search !== 'string' || search.length > 100)) {
+      res.status(400).json({ error: 'La búsqueda debe ser un texto de hasta 100 caracteres' });
+      return;
+    }
+
+    const filters = {
+      type: type as EventType | undefined,
+      search: (search as string | undefined)?.trim() || undefined
+    };
+
+    // GET condicional: si el cliente ya tiene esta versión se responde 304 sin consultar los eventos
+    const { version, lastModified } = await eventRepo.getEventsVersion(req.userId!);
+    res.set('Cache-Control', 'private, no-cache');
+    res.set('ETag', eventsEtag(req.userId!, version, [from, to, filters.type || '', filters.search || '']));
+    if (lastModified) {
+      res.set('Last-Modified', lastModified.toUTCString());
+    }
+    if (req.fresh) {
+      res.status(304).end();
+      return;
+    }
+
+    const events = await eventRepo.findByUserAndDateRange(req.userId!, from, to, filters);
     
     res.status(200).json(events);
   } catch (error) {
@@ -113,6 +172,63 @@ export const createEvent = async (req: AuthenticatedRequest, res: Response): Pro
   }
 };
 
+export const createEventsBatch = async (req: AuthenticatedRequest, res: Response): Promise<void> => {
+  try {
+    const errors = validationResult(req).array();
+
+    // Errores de la lista en sí (no de un evento): se rechaza el request completo
+    const listErrors = errors.filter(error => error.type === 'field' && error.path === 'events');
+    if (listErrors.length > 0) {
+      res.status(422).json({
+        error: 'Datos inválidos',
+        details: listErrors
+      });
+      return;
+    }
+
+    // Errores de cada evento, agrupados por posición ("events[3].title" -> 3, "title")
+    const itemErrors = new Map<number, { path: string; msg: string }[]>();
+    for (const error of errors) {
+      const match = error.type === 'field' ? /^events\[(\d+)\]\.(.+)$/.exec(error.path) : null;
+      if (!match) continue;
+      const index = Number(match[1]);
+      itemErrors.set(index, [...(itemErrors.get(index) || []), { path: match[2], msg: error.msg }]);
+    }
+
+    const items: any[] = req.body.events;
+    const valid = items
+      .map((item, index) => ({ item, index }))
+      .filter(({ index }) => !itemErrors.has(index));
+
+    // Una sola escritura para todos los eventos válidos
+    const created = await eventRepo.createMany(valid.map(({ item }) => ({
+      userId: req.userId! as any,
+      title: item.title,
+      description: item.description,
+      date: item.date,
+      time: item.time,
+      type: item.type
+    })));
+
+    const results: any[] = items.map((_, index) => ({
+      index,
+      status: 422,
+      error: 'Datos inválidos',
+      details: itemErrors.get(index)
+    }));
+    valid.forEach(({ index }, position) => {
+      results[index] = { index, status: 201, event: created[position] };
+    });
+
+    // 201 si se crearon todos, 207 si solo algunos, 422 si ninguno
+    const status = created.length === items.length ? 201 : created.length > 0 ? 207 : 422;
+    res.status(status).json({ created: created.length, failed: items.length - created.length, results });
+  } catch (error) {
+    console.error('Error creando eventos:', error);
+    res.status(500).json({ error: 'Error interno del servidor' });
+  }
+};
+
 export const updateEvent = async (req: AuthenticatedRequest, res: Response): Promise<void> => {
   try {
     const errors = validationResult(req);
@@ -158,3 +274,27 @@ export const deleteEvent = async (req: AuthenticatedRequest, res: Response): Pro
     res.status(500).json({ error: 'Error interno del servidor' });
   }
 };
+
+export const deleteEventsBatch = async (req: AuthenticatedRequest, res: Response): Promise<void> => {
+  try {
+    const errors = validationResult(req);
+    if (!errors.isEmpty()) {
+      res.status(422).json({
+        error: 'Datos inválidos',
+        details: errors.array()
+      });
+      return;
+    }
+
+    const ids: string[] = req.body.ids;
+    const deleted = new Set(await eventRepo.deleteManyByIdsAndUser(ids, req.userId!));
+
+    res.status(200).json({
+      deleted: deleted.size,
+      results: ids.map(id => ({ id, status: deleted.has(id) ? 204 : 404 }))
+    });
+  } catch (error) {
+    console.error('Error eliminando eventos:', error);
+    res.status(500).json({ error: 'Error interno del servidor' });
+  }
+};
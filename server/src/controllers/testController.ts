@@ -0,0 +1,49 @@
+import { Request, Response } from 'express';
+import {
+  getMemoryStoreStats,
+  resetMemoryStore,
+  restoreMemoryStore,
+  snapshotMemoryStore
+} from '../repositories/memory';
+
+// Controlador de las rutas de test: solo se montan con ENABLE_TEST_ROUTES y la base en memoria
+
+const getSnapshotName = (req: Request): string | null => {
+  const name = req.body?.name;
+  return typeof name === 'string' && name.trim() ? name.trim() : null;
+};
+
+export const getState = (req: Request, res: Response): void => {
+  res.status(200).json(getMemoryStoreStats());
+};
+
+export const resetState = (req: Request, res: Response): void => {
+  resetMemoryStore();
+  res.status(200).json(getMemoryStoreStats());
+};
+
+export const snapshotState = (req: Request, res: Response): void => {
+  const name = getSnapshotName(req);
+  if (!name) {
+    res.status(400).json({ error: 'El nombre del snapshot es requerido' });
+    return;
+  }
+
+  snapshotMemoryStore(name);
+  res.status(201).json(getMemoryStoreStats());
+};
+
+export const restoreState = (req: Request, res: Response): void => {
+  const name = getSnapshotName(req);
+  if (!name) {
+    res.status(400).json({ error: 'El nombre del snapshot es requerido' });
+    return;
+  }
+
+  if (!restoreMemoryStore(name)) {
+    res.status(404).json({ error: 'Snapshot no encontrado' });
+    return;
+  }
+
+  res.status(200).json(getMemoryStoreStats());
+};
@@ -4,12 +4,13 @@ import express from 'express';
 import helmet from 'helmet';
 import morgan from 'morgan';
 import swaggerUi from 'swagger-ui-express';
-import { config, useMemoryDb } from './config/env';
+import { config, testRoutesEnabled, useMemoryDb } from './config/env';
 import { swaggerSpec } from './config/swagger';
 import { connectMongoDB } from './repositories/mongo';
 import authRoutes from './routes/auth';
 import eventRoutes from './routes/events';
 import profileRoutes from './routes/profile';
+import testRoutes from './routes/testing';
 
 const app = express();
 
@@ -30,7 +31,9 @@ app.use(cors({
   origin: config.corsOrigin.split(',').map(o => o.trim()),
   credentials: true,
   methods: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
-  allowedHeaders: ['Content-Type', 'Authorization']
+  allowedHeaders: ['Content-Type', 'Authorization', 'If-None-Match', 'If-Modified-Since'],
+  // El frontend lee el ETag de GET /events para revalidar con If-None-Match
+  exposedHeaders: ['ETag', 'Last-Modified']
 }));
 
 // Middleware de logging
@@ -58,6 +61,11 @@ app.use('/auth', authRoutes);
 app.use('/events', eventRoutes);
 app.use('/profile', profileRoutes);
 
+// Rutas de reset/snapshot/restore para las pruebas E2E (solo base en memoria)
+if (testRoutesEnabled) {
+  app.use('/__test__', testRoutes);
+}
+
 // Ruta de salud
 app.get('/health', (req, res) => {
   res.json({ 
@@ -86,6 +94,9 @@ const startServer = async () => {
       await connectMongoDB(config.mongodbUri);
     } else {
       console.log('🗄️  Usando base de datos en memoria');
+      if (testRoutesEnabled) {
+        console.log('🧪 Rutas de test habilitadas en /__test__');
+      }
     }
 
     app.listen(config.port, () => {
@@ -2,6 +2,20 @@ import mongoose, { Document, Schema } from 'mongoose';
 
 export type EventType = 'EXAM' | 'DELIVERY' | 'CLASS';
 
+export const EVENT_TYPES: EventType[] = ['EXAM', 'DELIVERY', 'CLASS'];
+
+// Filtros opcionales de GET /events
+export interface EventFilters {
+  type?: EventType;
+  search?: string; // Texto buscado en título y descripción (sin distinguir mayúsculas)
+}
+
+// Versión de los eventos de un usuario: cambia con cada alta, edición o baja
+export interface EventsVersion {
+  version: string;
+  lastModified: Date | null;
+}
+
 export interface IEvent extends Document {
   _id: mongoose.Types.ObjectId;
   userId: mongoose.Types.ObjectId;
@@ -70,5 +84,7 @@ const EventSchema = new Schema<IEvent>({
 // Índices compuestos
 EventSchema.index({ userId: 1, date: 1 });
 EventSchema.index({ userId: 1, updatedAt: -1 });
+// Filtro por tipo dentro del rango de fechas del mes
+EventSchema.index({ userId: 1, type: 1, date: 1 });
 
 export const Event = mongoose.model<IEvent>('Event', EventSchema);
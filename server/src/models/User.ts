@@ -7,6 +7,8 @@ export interface IUser extends Document {
   firstName?: string;
   lastName?: string;
   organizations: string[];
+  eventsVersion: number; // Contador de cambios en sus eventos (ETag de GET /events)
+  eventsModifiedAt?: Date; // Último cambio en sus eventos (Last-Modified)
   createdAt: Date;
   updatedAt: Date;
 }
@@ -38,7 +40,14 @@ const UserSchema = new Schema<IUser>({
     type: String,
     trim: true,
     maxlength: 100
-  }]
+  }],
+  eventsVersion: {
+    type: Number,
+    default: 0
+  },
+  eventsModifiedAt: {
+    type: Date
+  }
 }, {
   timestamps: true
 });
@@ -1,5 +1,5 @@
 import mongoose from 'mongoose';
-import { EventType, IEvent } from '../models/Event';
+import { EventFilters, EventType, EventsVersion, IEvent } from '../models/Event';
 import { IUser } from '../models/User';
 
 // Interfaces para el repositorio en memoria
@@ -113,121 +113,302 @@ export class MemoryUserRepository {
   }
 }
 
+// Índices de eventos: por id y, por usuario, ordenados por fecha y hora.
+// Los eventos eliminados (deletedAt) siguen en `events` y en el índice por id,
+// pero no en el índice por usuario.
+const eventsById = new Map<string, MemoryEvent>();
+const eventsByUser = new Map<string, MemoryEvent[]>();
+
+// Mismo orden que devolvía el filtro original: fecha y luego hora
+const compareEvents = (a: MemoryEvent, b: MemoryEvent): number => {
+  if (a.date !== b.date) return a.date.localeCompare(b.date);
+  return (a.time || '00:00').localeCompare(b.time || '00:00');
+};
+
+// Primer índice de la lista cuyo elemento cumple `isAfter` (la lista está ordenada)
+const bisect = (list: MemoryEvent[], isAfter: (event: MemoryEvent) => boolean): number => {
+  let low = 0;
+  let high = list.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (isAfter(list[mid])) {
+      high = mid;
+    } else {
+      low = mid + 1;
+    }
+  }
+  return low;
+};
+
+const addToUserIndex = (event: MemoryEvent): void => {
+  let list = eventsByUser.get(event.userId);
+  if (!list) {
+    list = [];
+    eventsByUser.set(event.userId, list);
+  }
+  // Después de los eventos con la misma fecha y hora: conserva el orden de creación
+  list.splice(bisect(list, e => compareEvents(e, event) > 0), 0, event);
+};
+
+const removeFromUserIndex = (event: MemoryEvent): void => {
+  const list = eventsByUser.get(event.userId);
+  if (!list) return;
+
+  for (let i = bisect(list, e => compareEvents(e, event) >= 0); i < list.length; i++) {
+    if (list[i] === event) {
+      list.splice(i, 1);
+      return;
+    }
+    if (compareEvents(list[i], event) > 0) return;
+  }
+};
+
+// Versiones para los validadores (ETag) de GET /events. El contador nunca se
+// reinicia: tras un reset o restore ninguna versión anterior vuelve a aparecer
+let versionCounter = 0;
+let baseVersion = { version: versionCounter, lastModified: new Date() };
+const userVersions = new Map<string, { version: number; lastModified: Date }>();
+
+const touchUserEvents = (userId: string, at: Date): void => {
+  versionCounter += 1;
+  userVersions.set(userId, { version: versionCounter, lastModified: at });
+};
+
+const rebuildEventIndex = (): void => {
+  // Todos los usuarios pasan a una versión nueva
+  versionCounter += 1;
+  baseVersion = { version: versionCounter, lastModified: new Date() };
+  userVersions.clear();
+
+  eventsById.clear();
+  eventsByUser.clear();
+  for (const event of events) {
+    eventsById.set(event._id, event);
+  }
+  const active = events.filter(e => !e.deletedAt).sort(compareEvents);
+  for (const event of active) {
+    const list = eventsByUser.get(event.userId);
+    if (list) {
+      list.push(event);
+    } else {
+      eventsByUser.set(event.userId, [event]);
+    }
+  }
+};
+
+const findActiveEvent = (eventId: string, userId: string): MemoryEvent | null => {
+  const event = eventsById.get(eventId);
+  if (!event || event.userId !== userId || event.deletedAt) return null;
+  return event;
+};
+
+const toEvent = (event: MemoryEvent): IEvent => ({
+  _id: new mongoose.Types.ObjectId(event._id),
+  userId: new mongoose.Types.ObjectId(event.userId),
+  title: event.title,
+  description: event.description,
+  date: event.date,
+  time: event.time,
+  type: event.type,
+  remindDays: event.remindDays,
+  deletedAt: event.deletedAt,
+  createdAt: event.createdAt,
+  updatedAt: event.updatedAt
+}) as IEvent;
+
+const buildEvent = (eventData: Partial<IEvent>, now: Date): MemoryEvent => ({
+  _id: new mongoose.Types.ObjectId().toString(),
+  userId: eventData.userId!.toString(),
+  title: eventData.title!,
+  description: eventData.description,
+  date: eventData.date!,
+  time: eventData.time,
+  type: eventData.type!,
+  remindDays: eventData.remindDays,
+  deletedAt: eventData.deletedAt,
+  createdAt: now,
+  updatedAt: now
+});
+
 export class MemoryEventRepository {
   async create(eventData: Partial<IEvent>): Promise<IEvent> {
-    const id = new mongoose.Types.ObjectId().toString();
     const now = new Date();
-    
-    const event: MemoryEvent = {
-      _id: id,
-      userId: eventData.userId!.toString(),
-      title: eventData.title!,
-      description: eventData.description,
-      date: eventData.date!,
-      time: eventData.time,
-      type: eventData.type!,
-      remindDays: eventData.remindDays,
-      deletedAt: eventData.deletedAt,
-      createdAt: now,
-      updatedAt: now
-    };
+    const event = buildEvent(eventData, now);
     
     events.push(event);
+    eventsById.set(event._id, event);
+    if (!event.deletedAt) {
+      addToUserIndex(event);
+    }
+    touchUserEvents(event.userId, now);
     
-    return {
-      _id: new mongoose.Types.ObjectId(id),
-      userId: new mongoose.Types.ObjectId(event.userId),
-      title: event.title,
-      description: event.description,
-      date: event.date,
-      time: event.time,
-      type: event.type,
-      remindDays: event.remindDays,
-      deletedAt: event.deletedAt,
-      createdAt: event.createdAt,
-      updatedAt: event.updatedAt
-    } as IEvent;
+    return toEvent(event);
   }
 
   async findByUserAndDateRange(
     userId: string, 
     from: string, 
-    to: string
+    to: string,
+    filters: EventFilters = {}
   ): Promise<IEvent[]> {
-    const userEvents = events
-      .filter(e => e.userId === userId && !e.deletedAt)
-      .filter(e => e.date >= from && e.date <= to)
-      .sort((a, b) => {
-        if (a.date !== b.date) return a.date.localeCompare(b.date);
-        return (a.time || '00:00').localeCompare(b.time || '00:00');
-      });
-    
-    return userEvents.map(event => ({
-      _id: new mongoose.Types.ObjectId(event._id),
-      userId: new mongoose.Types.ObjectId(event.userId),
-      title: event.title,
-      description: event.description,
-      date: event.date,
-      time: event.time,
-      type: event.type,
-      remindDays: event.remindDays,
-      deletedAt: event.deletedAt,
-      createdAt: event.createdAt,
-      updatedAt: event.updatedAt
-    })) as IEvent[];
+    const userEvents = eventsByUser.get(userId) || [];
+
+    // Búsqueda binaria de los límites del rango: O(log n) + tamaño del resultado
+    const start = bisect(userEvents, e => e.date >= from);
+    const end = bisect(userEvents, e => e.date > to);
+
+    const search = filters.search?.toLowerCase();
+    return userEvents
+      .slice(start, end)
+      .filter(e =>
+        (!filters.type || e.type === filters.type) &&
+        (!search ||
+          e.title.toLowerCase().includes(search) ||
+          (e.description || '').toLowerCase().includes(search))
+      )
+      .map(toEvent);
+  }
+
+  async createMany(items: Partial<IEvent>[]): Promise<IEvent[]> {
+    const now = new Date();
+    const created = items.map(item => buildEvent(item, now));
+
+    // Se agregan al final de la lista de cada usuario y se reordena una sola vez;
+    // el sort es estable, así que los empates conservan el orden de creación
+    const touched = new Set<string>();
+    for (const event of created) {
+      events.push(event);
+      eventsById.set(event._id, event);
+      touched.add(event.userId);
+      if (event.deletedAt) continue;
+
+      const list = eventsByUser.get(event.userId);
+      if (list) {
+        list.push(event);
+      } else {
+        eventsByUser.set(event.userId, [event]);
+      }
+    }
+    for (const userId of touched) {
+      eventsByUser.get(userId)?.sort(compareEvents);
+      touchUserEvents(userId, now);
+    }
+
+    return created.map(toEvent);
   }
 
   async findByIdAndUser(eventId: string, userId: string): Promise<IEvent | null> {
-    const event = events.find(e => e._id === eventId && e.userId === userId && !e.deletedAt);
-    if (!event) return null;
-    
-    return {
-      _id: new mongoose.Types.ObjectId(event._id),
-      userId: new mongoose.Types.ObjectId(event.userId),
-      title: event.title,
-      description: event.description,
-      date: event.date,
-      time: event.time,
-      type: event.type,
-      remindDays: event.remindDays,
-      deletedAt: event.deletedAt,
-      createdAt: event.createdAt,
-      updatedAt: event.updatedAt
-    } as IEvent;
+    const event = findActiveEvent(eventId, userId);
+    return event ? toEvent(event) : null;
   }
 
   async deleteByIdAndUser(eventId: string, userId: string): Promise<boolean> {
-    const eventIndex = events.findIndex(e => e._id === eventId && e.userId === userId && !e.deletedAt);
-    if (eventIndex === -1) return false;
+    const event = findActiveEvent(eventId, userId);
+    if (!event) return false;
     
-    events[eventIndex].deletedAt = new Date();
-    events[eventIndex].updatedAt = new Date();
+    removeFromUserIndex(event);
+    event.deletedAt = new Date();
+    event.updatedAt = new Date();
+    touchUserEvents(userId, event.updatedAt);
     return true;
   }
 
+  async deleteManyByIdsAndUser(eventIds: string[], userId: string): Promise<string[]> {
+    const now = new Date();
+    const deleted: string[] = [];
+
+    for (const eventId of new Set(eventIds)) {
+      const event = findActiveEvent(eventId, userId);
+      if (!event) continue;
+      event.deletedAt = now;
+      event.updatedAt = now;
+      deleted.push(eventId);
+    }
+
+    // Un solo recorrido del índice del usuario para sacar todos los eliminados
+    if (deleted.length > 0) {
+      const list = eventsByUser.get(userId) || [];
+      eventsByUser.set(userId, list.filter(e => !e.deletedAt));
+      touchUserEvents(userId, now);
+    }
+    return deleted;
+  }
+
   async updateByIdAndUser(
     eventId: string, 
     userId: string, 
     updateData: Partial<IEvent>
   ): Promise<IEvent | null> {
-    const eventIndex = events.findIndex(e => e._id === eventId && e.userId === userId && !e.deletedAt);
-    if (eventIndex === -1) return null;
+    const event = findActiveEvent(eventId, userId);
+    if (!event) return null;
     
-    const event = events[eventIndex];
+    // La fecha u hora pueden cambiar: se saca del índice antes de modificarlo
+    removeFromUserIndex(event);
     Object.assign(event, updateData, { updatedAt: new Date() });
+
+    if (event._id !== eventId) {
+      eventsById.delete(eventId);
+      eventsById.set(event._id, event);
+    }
+    if (!event.deletedAt) {
+      addToUserIndex(event);
+    }
+    touchUserEvents(userId, event.updatedAt);
     
-    return {
-      _id: new mongoose.Types.ObjectId(event._id),
-      userId: new mongoose.Types.ObjectId(event.userId),
-      title: event.title,
-      description: event.description,
-      date: event.date,
-      time: event.time,
-      type: event.type,
-      remindDays: event.remindDays,
-      deletedAt: event.deletedAt,
-      createdAt: event.createdAt,
-      updatedAt: event.updatedAt
-    } as IEvent;
+    return toEvent(event);
+  }
+
+  async getEventsVersion(userId: string): Promise<EventsVersion> {
+    const { version, lastModified } = userVersions.get(userId) || baseVersion;
+    return { version: String(version), lastModified };
   }
 }
+
+// Snapshots del almacenamiento en memoria (solo para las rutas de test)
+interface MemorySnapshot {
+  users: MemoryUser[];
+  events: MemoryEvent[];
+}
+
+const snapshots = new Map<string, MemorySnapshot>();
+
+const copyUsers = (source: MemoryUser[]): MemoryUser[] =>
+  source.map(user => ({ ...user, organizations: [...user.organizations] }));
+
+const copyEvents = (source: MemoryEvent[]): MemoryEvent[] =>
+  source.map(event => ({ ...event }));
+
+// Reemplaza el contenido de un array sin cambiar la referencia que usan los repositorios
+const replaceContents = <T>(target: T[], items: T[]): void => {
+  target.length = 0;
+  for (const item of items) {
+    target.push(item);
+  }
+};
+
+export const getMemoryStoreStats = () => ({
+  users: users.length,
+  events: events.length,
+  snapshots: [...snapshots.keys()]
+});
+
+export const resetMemoryStore = (): void => {
+  replaceContents(users, []);
+  replaceContents(events, []);
+  rebuildEventIndex();
+};
+
+export const snapshotMemoryStore = (name: string): void => {
+  snapshots.set(name, { users: copyUsers(users), events: copyEvents(events) });
+};
+
+export const restoreMemoryStore = (name: string): boolean => {
+  const snapshot = snapshots.get(name);
+  if (!snapshot) return false;
+
+  // Se copia de nuevo para que el snapshot se pueda restaurar más de una vez
+  replaceContents(users, copyUsers(snapshot.users));
+  replaceContents(events, copyEvents(snapshot.events));
+  rebuildEventIndex();
+  return true;
+};
@@ -1,5 +1,5 @@
 import mongoose from 'mongoose';
-import { Event, IEvent } from '../models/Event';
+import { Event, EventFilters, EventsVersion, IEvent } from '../models/Event';
 import { IUser, User } from '../models/User';
 
 export class MongoUserRepository {
@@ -30,22 +30,58 @@ export class MongoUserRepository {
   }
 }
 
+// Escapa los caracteres especiales para buscar el texto literal
+const escapeRegex = (text: string): string => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// Registra un cambio en los eventos del usuario para el ETag de GET /events.
+// $inc es atómico: dos cambios en el mismo milisegundo (o con relojes desfasados) dan versiones distintas
+const touchUserEvents = async (userId: string | mongoose.Types.ObjectId): Promise<void> => {
+  await User.updateOne(
+    { _id: userId },
+    { $inc: { eventsVersion: 1 }, $set: { eventsModifiedAt: new Date() } },
+    // No es una edición del perfil: no se toca updatedAt
+    { timestamps: false }
+  );
+};
+
 export class MongoEventRepository {
   async create(eventData: Partial<IEvent>): Promise<IEvent> {
     const event = new Event(eventData);
-    return await event.save();
+    const saved = await event.save();
+    await touchUserEvents(saved.userId);
+    return saved;
+  }
+
+  async createMany(items: Partial<IEvent>[]): Promise<IEvent[]> {
+    // Un solo insertMany (con la validación del schema) para todo el lote
+    const created = await Event.insertMany(items) as unknown as IEvent[];
+    const userIds = new Set(created.map(event => event.userId.toString()));
+    await Promise.all([...userIds].map(userId => touchUserEvents(userId)));
+    return created;
   }
 
   async findByUserAndDateRange(
     userId: string, 
     from: string, 
-    to: string
+    to: string,
+    filters: EventFilters = {}
   ): Promise<IEvent[]> {
-    return await Event.find({
+    const query: mongoose.FilterQuery<IEvent> = {
       userId: new mongoose.Types.ObjectId(userId),
       date: { $gte: from, $lte: to },
       deletedAt: { $exists: false }
-    }).sort({ date: 1, time: 1 });
+    };
+
+    // Con tipo se usa el índice { userId, type, date }
+    if (filters.type) {
+      query.type = filters.type;
+    }
+    if (filters.search) {
+      const pattern = new RegExp(escapeRegex(filters.search), 'i');
+      query.$or = [{ title: pattern }, { description: pattern }];
+    }
+
+    return await Event.find(query).sort({ date: 1, time: 1 });
   }
 
   async findByIdAndUser(eventId: string, userId: string): Promise<IEvent | null> {
@@ -63,9 +99,34 @@ export class MongoEventRepository {
         userId: new mongoose.Types.ObjectId(userId),
         deletedAt: { $exists: false }
       },
-      { deletedAt: new Date() }
+      { deletedAt: new Date(), updatedAt: new Date() }
+    );
+    if (result.modifiedCount === 0) return false;
+
+    await touchUserEvents(userId);
+    return true;
+  }
+
+  async deleteManyByIdsAndUser(eventIds: string[], userId: string): Promise<string[]> {
+    const validIds = [...new Set(eventIds)].filter(id => mongoose.isValidObjectId(id));
+    const filter = {
+      _id: { $in: validIds },
+      userId: new mongoose.Types.ObjectId(userId),
+      deletedAt: { $exists: false }
+    };
+
+    // Ids que se van a eliminar (para el resultado por item) y un solo updateMany
+    const found = await Event.find(filter).select('_id').lean();
+    const ids = found.map(event => event._id);
+    if (ids.length === 0) return [];
+
+    const now = new Date();
+    await Event.updateMany(
+      { ...filter, _id: { $in: ids } },
+      { deletedAt: now, updatedAt: now }
     );
-    return result.modifiedCount > 0;
+    await touchUserEvents(userId);
+    return ids.map(id => id.toString());
   }
 
   async updateByIdAndUser(
@@ -73,7 +134,7 @@ export class MongoEventRepository {
     userId: string, 
     updateData: Partial<IEvent>
   ): Promise<IEvent | null> {
-    return await Event.findOneAndUpdate(
+    const event = await Event.findOneAndUpdate(
       {
         _id: eventId,
         userId: new mongoose.Types.ObjectId(userId),
@@ -82,6 +143,22 @@ export class MongoEventRepository {
       { ...updateData, updatedAt: new Date() },
       { new: true }
     );
+    if (event) {
+      await touchUserEvents(userId);
+    }
+    return event;
+  }
+
+  async getEventsVersion(userId: string): Promise<EventsVersion> {
+    // Contador que incrementa cada alta, edición o baja (ver touchUserEvents)
+    const user = await User.findById(userId)
+      .select('eventsVersion eventsModifiedAt')
+      .lean();
+
+    return {
+      version: String(user?.eventsVersion ?? 0),
+      lastModified: user?.eventsModifiedAt ?? null
+    };
   }
 }
 
@@ -2,7 +2,11 @@ import { Router } from 'express';
 import {
     createEvent,
     createEventValidation,
+    createEventsBatch,
+    createEventsBatchValidation,
     deleteEvent,
+    deleteEventsBatch,
+    deleteEventsBatchValidation,
     getEvents,
     updateEvent,
     updateEventValidation
@@ -30,15 +34,64 @@ router.use(requireAuth);
  *     security:
  *       - bearerAuth: []
  *       - cookieAuth: []
+ *     parameters:
+ *       - in: query
+ *         name: from
+ *         required: true
+ *         schema:
+ *           type: string
+ *           example: 2024-01-01
+ *         description: Fecha inicial del rango (YYYY-MM-DD, inclusive)
+ *       - in: query
+ *         name: to
+ *         required: true
+ *         schema:
+ *           type: string
+ *           example: 2024-01-31
+ *         description: Fecha final del rango (YYYY-MM-DD, inclusive)
+ *       - in: query
+ *         name: type
+ *         schema:
+ *           type: string
+ *           enum: [EXAM, DELIVERY, CLASS]
+ *         description: Solo eventos de este tipo
+ *       - in: query
+ *         name: search
+ *         schema:
+ *           type: string
+ *           maxLength: 100
+ *         description: Texto buscado en título y descripción, sin distinguir mayúsculas
+ *       - in: header
+ *         name: If-None-Match
+ *         schema:
+ *           type: string
+ *         description: ETag de una respuesta anterior para la misma consulta
  *     responses:
  *       200:
  *         description: Lista de eventos del usuario
+ *         headers:
+ *           ETag:
+ *             description: Validador de la consulta; cambia al crear, editar o eliminar eventos del usuario
+ *             schema:
+ *               type: string
+ *           Last-Modified:
+ *             description: Fecha del último cambio en los eventos del usuario
+ *             schema:
+ *               type: string
  *         content:
  *           application/json:
  *             schema:
  *               type: array
  *               items:
  *                 $ref: '#/components/schemas/Event'
+ *       304:
+ *         description: Sin cambios desde la versión indicada en If-None-Match o If-Modified-Since
+ *       400:
+ *         description: Rango de fechas o filtros inválidos
+ *         content:
+ *           application/json:
+ *             schema:
+ *               $ref: '#/components/schemas/Error'
  *       401:
  *         description: No autenticado
  *         content:
@@ -112,6 +165,151 @@ router.get('/', getEvents);
  */
 router.post('/', createEventValidation, createEvent);
 
+/**
+ * @swagger
+ * /events/batch:
+ *   post:
+ *     summary: Crear varios eventos en un solo request (hasta 100)
+ *     description: Cada evento se valida por separado; los válidos se guardan en una sola escritura
+ *     tags: [Events]
+ *     security:
+ *       - bearerAuth: []
+ *       - cookieAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             required:
+ *               - events
+ *             properties:
+ *               events:
+ *                 type: array
+ *                 minItems: 1
+ *                 maxItems: 100
+ *                 items:
+ *                   type: object
+ *                   required: [title, date, type]
+ *                   properties:
+ *                     title:
+ *                       type: string
+ *                       example: Parcial de Álgebra
+ *                     description:
+ *                       type: string
+ *                     date:
+ *                       type: string
+ *                       example: 2024-05-10
+ *                     time:
+ *                       type: string
+ *                       example: 09:00
+ *                     type:
+ *                       type: string
+ *                       enum: [EXAM, DELIVERY, CLASS]
+ *     responses:
+ *       201:
+ *         description: Se crearon todos los eventos
+ *       207:
+ *         description: Se crearon algunos eventos; results indica el estado de cada uno
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 created:
+ *                   type: integer
+ *                 failed:
+ *                   type: integer
+ *                 results:
+ *                   type: array
+ *                   items:
+ *                     type: object
+ *                     properties:
+ *                       index:
+ *                         type: integer
+ *                       status:
+ *                         type: integer
+ *                         example: 201
+ *                       event:
+ *                         $ref: '#/components/schemas/Event'
+ *                       details:
+ *                         type: array
+ *                         items:
+ *                           type: object
+ *       422:
+ *         description: La lista es inválida o ningún evento es válido
+ *         content:
+ *           application/json:
+ *             schema:
+ *               $ref: '#/components/schemas/Error'
+ *       401:
+ *         description: No autenticado
+ *         content:
+ *           application/json:
+ *             schema:
+ *               $ref: '#/components/schemas/Error'
+ */
+router.post('/batch', createEventsBatchValidation, createEventsBatch);
+
+/**
+ * @swagger
+ * /events/batch-delete:
+ *   post:
+ *     summary: Eliminar varios eventos en un solo request (hasta 100)
+ *     tags: [Events]
+ *     security:
+ *       - bearerAuth: []
+ *       - cookieAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             required:
+ *               - ids
+ *             properties:
+ *               ids:
+ *                 type: array
+ *                 minItems: 1
+ *                 maxItems: 100
+ *                 items:
+ *                   type: string
+ *     responses:
+ *       200:
+ *         description: Resultado por id (204 eliminado, 404 no existe o es de otro usuario)
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 deleted:
+ *                   type: integer
+ *                 results:
+ *                   type: array
+ *                   items:
+ *                     type: object
+ *                     properties:
+ *                       id:
+ *                         type: string
+ *                       status:
+ *                         type: integer
+ *                         example: 204
+ *       422:
+ *         description: La lista de ids es inválida
+ *         content:
+ *           application/json:
+ *             schema:
+ *               $ref: '#/components/schemas/Error'
+ *       401:
+ *         description: No autenticado
+ *         content:
+ *           application/json:
+ *             schema:
+ *               $ref: '#/components/schemas/Error'
+ */
+router.post('/batch-delete', deleteEventsBatchValidation, deleteEventsBatch);
+
 /**
  * @swagger
  * /events/{id}:
@@ -0,0 +1,13 @@
+import { Router } from 'express';
+import { getState, resetState, restoreState, snapshotState } from '../controllers/testController';
+
+// Rutas para aislar el estado entre pruebas E2E. No se documentan en Swagger:
+// solo existen con ENABLE_TEST_ROUTES=true y la base de datos en memoria.
+const router = Router();
+
+router.get('/state', getState);
+router.post('/reset', resetState);
+router.post('/snapshot', snapshotState);
+router.post('/restore', restoreState);
+
+export default router;
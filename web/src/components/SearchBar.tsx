@@ -6,6 +6,9 @@ interface SearchBarProps {
   onChange: (value: string) => void;
 }
 
+// GET /events responde 400 a búsquedas de más de 100 caracteres
+const MAX_SEARCH_LENGTH = 100;
+
 const SearchBar: React.FC<SearchBarProps> = ({ value, placeholder, onChange }) => {
   return (
     <div className="relative w-full">
@@ -22,6 +25,7 @@ const SearchBar: React.FC<SearchBarProps> = ({ value, placeholder, onChange }) =
       <input
         type="text"
         value={value}
+        maxLength={MAX_SEARCH_LENGTH}
         onChange={(event) => onChange(event.target.value)}
         placeholder={placeholder}
         className="w-full rounded-lg border border-gray-300 bg-white py-2 pl-10 pr-4 text-sm transition-colors focus:border-accent focus:outline-none focus:ring-2 focus:ring-accent"
@@ -1,6 +1,7 @@
 import { useState, useEffect, createContext, useContext, ReactNode } from 'react';
 import { User, AuthResponse, ApiError } from '../types';
-import { api } from '../utils/api';
+import { api, clearEtagCache } from '../utils/api';
+import { invalidateEventsCache } from '../utils/eventsCache';
 
 interface AuthContextType {
   user: User | null;
@@ -54,6 +55,9 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
       });
 
       if (response.data) {
+        // Puede quedar cache de otro usuario (sesión vencida sin logout)
+        invalidateEventsCache();
+        clearEtagCache();
         setUser(response.data.user);
       }
     } catch (error: any) {
@@ -70,6 +74,9 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
       });
 
       if (response.data) {
+        // Igual que en login: no reutilizar eventos cacheados de otra sesión
+        invalidateEventsCache();
+        clearEtagCache();
         setUser(response.data.user);
       }
     } catch (error: any) {
@@ -84,6 +91,9 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
     } catch (error) {
       console.error('Error al cerrar sesión:', error);
     } finally {
+      // Los eventos cacheados son del usuario que cierra sesión
+      invalidateEventsCache();
+      clearEtagCache();
       setUser(null);
     }
   };
@@ -1,53 +1,84 @@
-import { endOfMonth, format, startOfMonth } from 'date-fns';
-import { useCallback, useEffect, useState } from 'react';
+import { addMonths, endOfMonth, format, parseISO, startOfMonth, subMonths } from 'date-fns';
+import { useCallback, useEffect, useRef, useState } from 'react';
 import { ApiError, CreateEventData, Event, UpdateEventData } from '../types';
 import { api } from '../utils/api';
+import {
+  EventsQuery,
+  eventsCacheKey,
+  fetchEventsCached,
+  getCachedEvents,
+  invalidateEventsCache,
+  prefetchEvents
+} from '../utils/eventsCache';
 
 interface EventFilters {
   type?: string;
   search?: string;
 }
 
+const monthRange = (date: Date) => ({
+  from: format(startOfMonth(date), 'yyyy-MM-dd'),
+  to: format(endOfMonth(date), 'yyyy-MM-dd')
+});
+
 export const useEvents = (date: Date, filters?: EventFilters) => {
-  const [events, setEvents] = useState<Event[]>([]);
+  const [events, setEvents] = useState<Event[]>(() =>
+    getCachedEvents({ ...monthRange(date), type: filters?.type, search: filters?.search }) || []
+  );
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
-  const from = format(startOfMonth(date), 'yyyy-MM-dd');
-  const to = format(endOfMonth(date), 'yyyy-MM-dd');
+  const { from, to } = monthRange(date);
+  // Consulta vigente: evita que una respuesta de un mes anterior pise la del actual
+  const currentKey = useRef('');
 
   const fetchEvents = useCallback(async () => {
-    setLoading(true);
+    const query: EventsQuery = { from, to, type: filters?.type, search: filters?.search };
+    const key = eventsCacheKey(query);
+    currentKey.current = key;
     setError(null);
 
-    try {
-      const params = new URLSearchParams({
-        from,
-        to
-      });
-
-      if (filters?.type) {
-        params.append('type', filters.type);
-      }
-      if (filters?.search) {
-        params.append('search', filters.search);
-      }
-
-      const response = await api.get<Event[]>(`/events?${params.toString()}`);
-      setEvents(response.data || []);
-    } catch (err: any) {
-      const apiError = err.response?.data as ApiError;
-      setError(apiError?.error || 'Error al cargar eventos');
-    } finally {
+    // Si el mes está en caché se muestra al instante, sin round trip
+    const cached = getCachedEvents(query);
+    if (cached) {
+      setEvents(cached);
       setLoading(false);
+    } else {
+      setLoading(true);
+      try {
+        const data = await fetchEventsCached(query);
+        if (currentKey.current === key) {
+          setEvents(data);
+        }
+      } catch (err: any) {
+        if (currentKey.current === key) {
+          const apiError = err.response?.data as ApiError;
+          setError(apiError?.error || 'Error al cargar eventos');
+        }
+      } finally {
+        if (currentKey.current === key) {
+          setLoading(false);
+        }
+      }
     }
+
+    // Prefetch en segundo plano de los meses adyacentes con los mismos filtros
+    const month = parseISO(from);
+    prefetchEvents({ ...query, ...monthRange(subMonths(month, 1)) });
+    prefetchEvents({ ...query, ...monthRange(addMonths(month, 1)) });
   }, [filters?.search, filters?.type, from, to]);
 
+  const refetch = useCallback(async () => {
+    invalidateEventsCache();
+    await fetchEvents();
+  }, [fetchEvents]);
+
   const createEvent = async (eventData: CreateEventData): Promise<Event> => {
     try {
       const response = await api.post<Event>('/events', eventData);
       const newEvent = response.data;
       
+      invalidateEventsCache();
       setEvents(prev => [...prev, newEvent]);
       return newEvent;
     } catch (err: any) {
@@ -61,6 +92,7 @@ export const useEvents = (date: Date, filters?: EventFilters) => {
       const response = await api.put<Event>(`/events/${eventId}`, eventData);
       const updatedEvent = response.data;
       
+      invalidateEventsCache();
       setEvents(prev => 
         prev.map(event => 
           event._id === eventId ? updatedEvent : event
@@ -76,6 +108,7 @@ export const useEvents = (date: Date, filters?: EventFilters) => {
   const deleteEvent = async (eventId: string): Promise<void> => {
     try {
       await api.delete(`/events/${eventId}`);
+      invalidateEventsCache();
       setEvents(prev => prev.filter(event => event._id !== eventId));
     } catch (err: any) {
       const apiError = err.response?.data as ApiError;
@@ -94,6 +127,6 @@ export const useEvents = (date: Date, filters?: EventFilters) => {
     createEvent,
     updateEvent,
     deleteEvent,
-    refetch: fetchEvents
+    refetch
   };
 };
@@ -1,21 +1,66 @@
 import axios, { AxiosResponse } from 'axios';
 
+// VITE_API_URL permite apuntar a otro backend al compilar (vacío = mismo origen)
 const api = axios.create({
-  baseURL: 'https://testing-uade-production.up.railway.app',
+  baseURL: import.meta.env.VITE_API_URL ?? 'https://testing-uade-production.up.railway.app',
   withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
+  // 304 llega cuando el GET se revalidó con If-None-Match y no hubo cambios
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+});
+
+// Última respuesta con ETag de cada GET (por URL con query string)
+const MAX_ETAG_ENTRIES = 50;
+const etagCache = new Map<string, { etag: string; data: unknown }>();
+
+const isGet = (method?: string) => (method || 'get').toLowerCase() === 'get';
+
+// Revalida los GET ya descargados: si no cambiaron el servidor responde 304 sin cuerpo
+api.interceptors.request.use((config) => {
+  const cached = config.url ? etagCache.get(config.url) : undefined;
+  if (isGet(config.method) && cached) {
+    config.headers.set('If-None-Match', cached.etag);
+  }
+  return config;
 });
 
 // Interceptor para manejar errores globalmente
 api.interceptors.response.use(
-  (response: AxiosResponse) => response,
+  (response: AxiosResponse) => {
+    const url = response.config.url;
+    if (!url || !isGet(response.config.method)) {
+      return response;
+    }
+
+    const cached = etagCache.get(url);
+    if (response.status === 304) {
+      if (cached) {
+        return { ...response, status: 200, data: cached.data };
+      }
+      return response;
+    }
+
+    const etag = response.headers['etag'];
+    if (etag) {
+      // Se reinserta para que el Map quede ordenado por uso y se descarte la más vieja
+      etagCache.delete(url);
+      etagCache.set(url, { etag, data: response.data });
+      if (etagCache.size > MAX_ETAG_ENTRIES) {
+        etagCache.delete(etagCache.keys().next().value as string);
+      }
+    }
+    return response;
+  },
   (error) => {
     // No forzar redirección aquí, dejar que React Router maneje la autenticación
     return Promise.reject(error);
   }
 );
 
-export { api };
+export const clearEtagCache = () => {
+  etagCache.clear();
+};
 
+export { api };
@@ -0,0 +1,111 @@
+import { Event } from '../types';
+import { api } from './api';
+
+// Tiempo que una respuesta de GET /events se considera vigente
+export const EVENTS_CACHE_TTL_MS = 60_000;
+// Máximo de combinaciones mes/filtro guardadas a la vez
+const EVENTS_CACHE_MAX_ENTRIES = 24;
+
+export interface EventsQuery {
+  from: string;
+  to: string;
+  type?: string;
+  search?: string;
+}
+
+interface CacheEntry {
+  events: Event[];
+  fetchedAt: number;
+}
+
+const cache = new Map<string, CacheEntry>();
+const inFlight = new Map<string, Promise<Event[]>>();
+// Se incrementa al invalidar para descartar respuestas pedidas antes de un cambio
+let generation = 0;
+
+export const eventsCacheKey = (query: EventsQuery): string =>
+  [query.from, query.to, query.type || '', query.search || ''].join('|');
+
+const isFresh = (entry: CacheEntry): boolean =>
+  Date.now() - entry.fetchedAt < EVENTS_CACHE_TTL_MS;
+
+const evictExpired = () => {
+  for (const [key, entry] of cache) {
+    if (!isFresh(entry)) {
+      cache.delete(key);
+    }
+  }
+  // Map conserva el orden de inserción: se descartan primero las más viejas
+  while (cache.size > EVENTS_CACHE_MAX_ENTRIES) {
+    const oldest = cache.keys().next().value as string;
+    cache.delete(oldest);
+  }
+};
+
+export const getCachedEvents = (query: EventsQuery): Event[] | null => {
+  const key = eventsCacheKey(query);
+  const entry = cache.get(key);
+  if (!entry) {
+    return null;
+  }
+  if (!isFresh(entry)) {
+    cache.delete(key);
+    return null;
+  }
+  return entry.events;
+};
+
+export const fetchEventsCached = (query: EventsQuery): Promise<Event[]> => {
+  const cached = getCachedEvents(query);
+  if (cached) {
+    return Promise.resolve(cached);
+  }
+
+  // Si ya hay un pedido igual en curso (p. ej. un prefetch), se reutiliza
+  const key = eventsCacheKey(query);
+  const pending = inFlight.get(key);
+  if (pending) {
+    return pending;
+  }
+
+  const params = new URLSearchParams({
+    from: query.from,
+    to: query.to
+  });
+  if (query.type) {
+    params.append('type', query.type);
+  }
+  if (query.search) {
+    params.append('search', query.search);
+  }
+
+  const requestGeneration = generation;
+  const request = api.get<Event[]>(`/events?${params.toString()}`)
+    .then(response => {
+      const events = response.data || [];
+      if (requestGeneration === generation) {
+        cache.set(key, { events, fetchedAt: Date.now() });
+        evictExpired();
+      }
+      return events;
+    })
+    .finally(() => {
+      if (inFlight.get(key) === request) {
+        inFlight.delete(key);
+      }
+    });
+
+  inFlight.set(key, request);
+  return request;
+};
+
+export const prefetchEvents = (query: EventsQuery) => {
+  // El prefetch es best-effort: un error se reintenta al navegar al mes
+  fetchEventsCached(query).catch(() => undefined);
+};
+
+export const invalidateEventsCache = () => {
+  generation += 1;
+  cache.clear();
+  inFlight.clear();
+};